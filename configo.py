@@ -28,62 +28,79 @@ Usage:
     configo help              # Show detailed help
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import itertools
 import logging
+import logging.handlers
 import os
 import sys
+import threading
 import time
 import webbrowser
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 
 # Load environment variables first
 from dotenv import load_dotenv
 load_dotenv()
 
-# Core agent components
-from core.memory import AgentMemory
-from core.planner import PlanGenerator, PlanExecutor, InstallationPlan
-from core.enhanced_llm_agent import EnhancedLLMAgent
-from core.validator import ToolValidator, ValidationReport
-from core.project_scan import scan_project
-from core.chat_agent import ChatAgent
-from core.project_scanner import ProjectScanner
-from core.portal_orchestrator import PortalOrchestrator
-from core.system_inspector import SystemInspector, display_system_summary
-from core.shell_executor import ShellExecutor
-from core.app_name_extractor import AppNameExtractor
+# Core agent and UI modules are imported inside the modes that use them,
+# so startup only pays for what the chosen command needs
+if TYPE_CHECKING:
+    from core.memory import AgentMemory
+    from ui.modern_terminal_ui import ModernTerminalUI
+
 
-# UI components
-from ui.modern_terminal_ui import ModernTerminalUI, UIConfig, Theme
-from ui.settings_menu import SettingsMenu
+# Independent plan steps are run concurrently, up to this many at once
+MAX_PARALLEL_STEPS = 4
 
-# Installation utilities
-from installers.base import install_tools
+# Install commands (apt, pip, npm -g, curl | sh, code --install-extension...)
+# write to shared system and user state and are not safe to overlap; they run
+# one at a time while version checks and validation proceed alongside
+_install_lock = threading.Lock()
+
+# Serializes the read-modify-write of the memory files across install threads
+_memory_lock = threading.Lock()
 
 
 def setup_logging() -> None:
     """Configure logging for the autonomous agent."""
     log_level = os.getenv('LOG_LEVEL', 'INFO')
+    
+    # Buffer records and write them to the log file in batches; errors are
+    # written straight away, and logging flushes the rest at interpreter exit
+    file_handler = logging.FileHandler('configo.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler('configo.log')
+            logging.handlers.MemoryHandler(512, flushLevel=logging.ERROR, target=file_handler)
         ]
     )
 
 
-def execute_tool_installation(step, ui: ModernTerminalUI) -> bool:
-    """Execute a tool installation step."""
+def execute_tool_installation(step, ui: ModernTerminalUI, memory: Optional[AgentMemory] = None) -> bool:
+    """Execute a tool installation step, recording the result in memory."""
+    from core.memory import AgentMemory
+    from core.system_inspector import invalidate_system_cache
+    from installers.base import install_tools
+    
     try:
         # Execute the installation command using the installer utility
-        result = install_tools([{
-            'name': step.name,
-            'install_command': step.install_command,
-            'check_command': step.check_command
-        }])
+        with _install_lock:
+            result = install_tools([{
+                'name': step.name,
+                'install_command': step.install_command,
+                'check_command': step.check_command
+            }])
+            
+            # The saved system analysis no longer lists every installed tool
+            invalidate_system_cache()
         
         # Extract results from installation
         success = result.get('success', False)
@@ -91,31 +108,32 @@ def execute_tool_installation(step, ui: ModernTerminalUI) -> bool:
         error = result.get('error')
         
         # Record installation result in memory for future reference
-        memory = AgentMemory()
-        memory.record_tool_installation(
-            tool_name=step.name,
-            install_command=step.install_command,
-            check_command=step.check_command,
-            success=success,
-            version=version,
-            error=error
-        )
+        with _memory_lock:
+            memory = memory or AgentMemory()
+            memory.record_tool_installation(
+                tool_name=step.name,
+                install_command=step.install_command,
+                check_command=step.check_command,
+                success=success,
+                version=version,
+                error=error
+            )
         
         return success
         
     except Exception as e:
-        logging.error(f"Error installing tool {step.name}: {e}")
+        logging.error("Error installing tool %s: %s", step.name, e)
         return False
 
 
-def execute_extension_installation(step, ui: ModernTerminalUI) -> bool:
+def execute_extension_installation(step, ui: ModernTerminalUI, memory: Optional[AgentMemory] = None) -> bool:
     """Execute a VS Code/Cursor extension installation step."""
     try:
         # For now, we'll use the same logic as tool installation
-        return execute_tool_installation(step, ui)
+        return execute_tool_installation(step, ui, memory)
         
     except Exception as e:
-        logging.error(f"Error installing extension {step.name}: {e}")
+        logging.error("Error installing extension %s: %s", step.name, e)
         return False
 
 
@@ -132,18 +150,23 @@ def execute_login_portal(step, ui: ModernTerminalUI) -> bool:
             ui.show_info_message(f"Opened login portal for {step.name}", "🌐")
             return True
         else:
-            logging.error(f"No URL found for login portal {step.name}")
+            logging.error("No URL found for login portal %s", step.name)
             return False
             
     except Exception as e:
-        logging.error(f"Error opening login portal {step.name}: {e}")
+        logging.error("Error opening login portal %s: %s", step.name, e)
         return False
 
 
 def execute_validation(step, ui: ModernTerminalUI) -> bool:
     """Execute a validation step to verify tool installation."""
+    from core.memory import AgentMemory
+    from core.enhanced_llm_agent import EnhancedLLMAgent
+    from core.validator import ToolValidator
+    
     try:
-        memory = AgentMemory()
+        with _memory_lock:
+            memory = AgentMemory()
         llm_agent = EnhancedLLMAgent(memory)
         validator = ToolValidator(memory, llm_agent)
         
@@ -152,10 +175,28 @@ def execute_validation(step, ui: ModernTerminalUI) -> bool:
         return result.is_installed
         
     except Exception as e:
-        logging.error(f"Error validating tool {step.name}: {e}")
+        logging.error("Error validating tool %s: %s", step.name, e)
         return False
 
 
+def execute_step(step, ui: ModernTerminalUI, memory: Optional[AgentMemory] = None) -> Tuple[bool, Optional[str]]:
+    """Execute a plan step, returning its success and the installed version."""
+    step_type = step.step_type.value
+    if step_type == "tool_install":
+        success = execute_tool_installation(step, ui, memory)
+    elif step_type == "extension_install":
+        success = execute_extension_installation(step, ui, memory)
+    elif step_type == "login_portal":
+        success = execute_login_portal(step, ui)
+    elif step_type == "validation":
+        success = execute_validation(step, ui)
+    else:
+        success = False
+    
+    version = get_tool_version(step.name, step.check_command) if success else None
+    return success, version
+
+
 def get_tool_version(tool_name: str, check_command: str) -> Optional[str]:
     """Get the version of an installed tool."""
     try:
@@ -176,15 +217,23 @@ def get_tool_version(tool_name: str, check_command: str) -> Optional[str]:
         return None
         
     except subprocess.TimeoutExpired:
-        logging.error(f"Timeout getting version for {tool_name}")
+        logging.error("Timeout getting version for %s", tool_name)
         return None
     except Exception as e:
-        logging.error(f"Error getting version for {tool_name}: {e}")
+        logging.error("Error getting version for %s: %s", tool_name, e)
         return None 
 
 
 def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool = False) -> None:
     """Run the full development environment setup."""
+    from core import llm_cache
+    from core.memory import AgentMemory
+    from core.planner import PlanGenerator, PlanExecutor
+    from core.enhanced_llm_agent import EnhancedLLMAgent
+    from core.validator import ToolValidator, tool_to_dict
+    from core.project_scan import scan_project
+    from core.system_inspector import SystemInspector
+    
     ui.show_banner()
     ui.show_mode_header('Full Setup', 'Complete development environment setup')
     
@@ -201,9 +250,6 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
         # Display system information
         ui.show_system_info(system_info)
         
-        # Save system intelligence to memory
-        system_inspector.save_to_memory(system_info)
-        
         # Display memory context and statistics
         memory_stats = memory.get_memory_stats()
         ui.show_memory_stats(memory_stats)
@@ -216,7 +262,7 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
         
         # Start tracking this session
         session_id = memory.start_session(env)
-        logging.info(f"Started session: {session_id}")
+        logging.info("Started session: %s", session_id)
         
         # Scan current project for context
         logging.info("Performing project scan")
@@ -225,25 +271,14 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
         # Initialize LLM agent for intelligent recommendations
         ui.show_info_message("Initializing AI agent...")
         llm_agent = EnhancedLLMAgent(memory)
+        llm_cache.init(llm_agent, system_info)
         
         # Generate AI-powered stack recommendations
         ui.show_info_message("Generating AI-powered recommendations...")
         llm_response = llm_agent.generate_enhanced_stack(env, str(stack_info) if stack_info else "", debug=debug)
         
         # Convert LLM response to tool list format
-        tools = []
-        for tool in llm_response.tools:
-            tool_dict = {
-                'name': tool.name,
-                'install_command': tool.install_command,
-                'check_command': tool.check_command,
-                'is_extension': tool.is_extension,
-                'extension_id': tool.extension_id,
-                'justification': tool.justification,
-                'confidence_score': tool.confidence_score,
-                'priority': tool.priority
-            }
-            tools.append(tool_dict)
+        tools = [tool_to_dict(tool) for tool in llm_response.tools]
         
         ui.show_success_message(f"Generated {len(tools)} tools and {len(llm_response.login_portals)} login portals")
         
@@ -305,60 +340,68 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
         installed_tools = []
         failed_tools = []
         
-        # Process each step in the plan
-        while not executor.is_complete():
-            step = executor.get_next_step()
-            if not step:
-                break
-            
-            # Skip if tool should be skipped based on memory
-            if memory.should_skip_tool(step.name):
-                executor.skip_step(step, "Already installed or max retries reached")
-                continue
-            
-            # Start executing the step
-            executor.start_step(step)
-            current_step = executor.plan.completed_steps + executor.plan.failed_steps + 1
-            
-            # Show progress with enhanced UI
-            ui.show_info_message(f"Installing {step.name}...", "🔧")
-            
-            try:
-                # Execute based on step type
-                if step.step_type.value == "tool_install":
-                    success = execute_tool_installation(step, ui)
-                elif step.step_type.value == "extension_install":
-                    success = execute_extension_installation(step, ui)
-                elif step.step_type.value == "login_portal":
-                    success = execute_login_portal(step, ui)
-                elif step.step_type.value == "validation":
-                    success = execute_validation(step, ui)
-                else:
-                    success = False
+        # Process the plan in waves: every step whose dependencies are met
+        # runs concurrently, and results are reported here as they finish.
+        # Installations are recorded in this session's memory, which writes
+        # its files once per wave
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_STEPS) as pool, ui.show_step_progress() as progress:
+            while not executor.is_complete():
+                ready_steps = executor.get_ready_steps()
+                if not ready_steps:
+                    break
                 
-                if success:
-                    # Get version info and mark as complete
-                    version = get_tool_version(step.name, step.check_command)
-                    executor.complete_step(step, version)
-                    installed_tools.append(step.name)
-                    ui.show_success_message(f"{step.name} installed successfully", f"Version: {version}" if version else None)
-                else:
-                    # Mark as failed and attempt self-healing
-                    executor.fail_step(step, "Installation failed")
-                    failed_tools.append(step.name)
-                    ui.show_error_message(f"Failed to install {step.name}", "Will attempt self-healing")
-                    
-                    # Attempt self-healing if retries are allowed
-                    if memory.should_retry_tool(step.name):
-                        ui.show_info_message(f"Retrying {step.name} (attempt {step.retry_count + 1}/{step.max_retries})", "🔄")
-                        if executor.retry_step(step):
+                with memory.batched_writes():
+                    futures = {}
+                    portal_steps = []
+                    for step in ready_steps:
+                        # Skip if tool should be skipped based on memory
+                        with _memory_lock:
+                            should_skip = memory.should_skip_tool(step.name)
+                        if should_skip:
+                            executor.skip_step(step, "Already installed or max retries reached")
                             continue
-                
-            except Exception as e:
-                logging.error(f"Error executing step {step.name}: {e}")
-                executor.fail_step(step, str(e))
-                failed_tools.append(step.name)
-                ui.show_error_message(f"Step failed", str(e))
+                        
+                        # Start executing the step
+                        executor.start_step(step)
+                        progress.update(step.name, 'installing')
+                        
+                        # Login portals open browser tabs; they run on this thread
+                        # after the tools installed alongside them
+                        if step.step_type.value == "login_portal":
+                            portal_steps.append(step)
+                        else:
+                            futures[pool.submit(execute_step, step, ui, memory)] = step
+                    
+                    outcomes = itertools.chain(
+                        ((futures[future], future.result) for future in as_completed(futures)),
+                        ((step, functools.partial(execute_step, step, ui, memory)) for step in portal_steps)
+                    )
+                    for step, outcome in outcomes:
+                        try:
+                            success, version = outcome()
+                            
+                            if success:
+                                executor.complete_step(step, version)
+                                installed_tools.append(step.name)
+                                progress.update(step.name, 'installed', f"Version: {version}" if version else "")
+                            else:
+                                # Mark as failed and attempt self-healing
+                                executor.fail_step(step, "Installation failed")
+                                failed_tools.append(step.name)
+                                progress.update(step.name, 'failed', "Will attempt self-healing")
+                                
+                                # Attempt self-healing if retries are allowed
+                                with _memory_lock:
+                                    should_retry = memory.should_retry_tool(step.name)
+                                if should_retry:
+                                    progress.update(step.name, 'retrying', f"attempt {step.retry_count + 1}/{step.max_retries}")
+                                    executor.retry_step(step)
+                        
+                        except Exception as e:
+                            logging.error("Error executing step %s: %s", step.name, e)
+                            executor.fail_step(step, str(e))
+                            failed_tools.append(step.name)
+                            progress.update(step.name, 'error', str(e))
         
         # Update session with final results
         memory.update_session_tools(session_id, installed_tools, failed_tools)
@@ -398,7 +441,7 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
                         'install_command': fix_command,
                         'check_command': f"{failed_tool} --version" if failed_tool else "echo 'check'"
                     })()
-                    success = execute_tool_installation(temp_step, ui)
+                    success = execute_tool_installation(temp_step, ui, memory)
                     healing_results.append({
                         'tool': failed_tool,
                         'fix_command': fix_command,
@@ -425,12 +468,15 @@ def run_full_setup(ui: ModernTerminalUI, debug: bool = False, lite_mode: bool =
         logging.info("CONFIGO setup completed successfully")
         
     except Exception as e:
-        logging.error(f"Error in full setup: {e}")
+        logging.error("Error in full setup: %s", e)
         ui.show_error_message("Setup failed", str(e))
 
 
 def run_chat_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
     """Run interactive chat mode."""
+    from core.memory import AgentMemory
+    from core.chat_agent import ChatAgent
+    
     ui.show_banner()
     ui.show_mode_header('Chat', 'Interactive AI chat assistant')
     
@@ -448,15 +494,17 @@ def run_chat_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
         # Chat loop
         while True:
             try:
+                chat_agent.prefetch_context()
                 user_input = ui.get_user_input("💬 You: ")
                 
                 if user_input.lower() in ['exit', 'quit', 'bye']:
                     ui.show_success_message("Goodbye! Thanks for using CONFIGO.")
                     break
                 
-                # Process message
-                response = chat_agent.process_message(user_input)
-                ui.show_chat_response(response.message if hasattr(response, 'message') else str(response), is_ai=True)
+                # Process message, showing the response as it streams in
+                with ui.stream_chat_response() as stream:
+                    response = chat_agent.process_message(user_input, on_delta=stream.append)
+                    stream.finish(response.message)
                 
                 # Execute command if needed
                 if hasattr(response, 'action_type') and response.action_type == "command" and hasattr(response, 'command') and response.command:
@@ -477,12 +525,15 @@ def run_chat_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
                 ui.show_error_message("Error processing message", str(e))
                 
     except Exception as e:
-        logging.error(f"Chat mode failed: {e}")
+        logging.error("Chat mode failed: %s", e)
         ui.show_error_message("Chat mode failed", str(e))
 
 
 def run_scan_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
     """Run project scanning mode."""
+    from core.memory import AgentMemory
+    from core.project_scanner import ProjectScanner
+    
     ui.show_banner()
     ui.show_mode_header('Scan', 'Project analysis and recommendations')
     
@@ -498,8 +549,8 @@ def run_scan_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
         # Show results
         ui.show_ai_reasoning(
             f"Project Analysis: {analysis.project_type.title()}",
-            f"Detected frameworks: {', '.join(analysis.detected_frameworks) if analysis.detected_frameworks else 'None'}\n"
-            f"Languages: {', '.join(analysis.languages) if analysis.languages else 'None'}\n"
+            f"Detected frameworks: {', '.join(sorted(analysis.detected_frameworks)) if analysis.detected_frameworks else 'None'}\n"
+            f"Languages: {', '.join(sorted(analysis.languages)) if analysis.languages else 'None'}\n"
             f"Confidence: {analysis.confidence:.1%}",
             analysis.confidence
         )
@@ -510,12 +561,15 @@ def run_scan_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
             ui.show_ai_reasoning("Recommendations", recommendations_text, 0.9)
         
     except Exception as e:
-        logging.error(f"Scan mode failed: {e}")
+        logging.error("Scan mode failed: %s", e)
         ui.show_error_message("Scan mode failed", str(e))
 
 
 def run_portal_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
     """Run portal orchestration mode."""
+    from core.memory import AgentMemory
+    from core.portal_orchestrator import PortalOrchestrator
+    
     ui.show_banner()
     ui.show_mode_header('Portal', 'Login portal orchestration')
     
@@ -556,12 +610,19 @@ def run_portal_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
                 ui.show_error_message("Invalid input")
         
     except Exception as e:
-        logging.error(f"Portal mode failed: {e}")
+        logging.error("Portal mode failed: %s", e)
         ui.show_error_message("Portal mode failed", str(e))
 
 
 def run_install_mode(ui: ModernTerminalUI, app_name: str = None, debug: bool = False) -> None:
     """Run natural language app installation mode."""
+    from core import llm_cache
+    from core.memory import AgentMemory
+    from core.enhanced_llm_agent import EnhancedLLMAgent
+    from core.app_name_extractor import AppNameExtractor
+    from core.system_inspector import SystemInspector, invalidate_system_cache
+    from core.shell_executor import ShellExecutor
+    
     ui.show_banner()
     ui.show_mode_header('Install', 'Natural language app installation')
     
@@ -588,6 +649,7 @@ def run_install_mode(ui: ModernTerminalUI, app_name: str = None, debug: bool = F
         
         # Get system information
         system_info = system_inspector.analyze()
+        llm_cache.init(llm_agent, system_info)
         
         # Generate installation plan
         ui.show_info_message(f"Generating installation plan for {app_name}...")
@@ -610,6 +672,7 @@ def run_install_mode(ui: ModernTerminalUI, app_name: str = None, debug: bool = F
         ui.show_info_message("Executing installation...")
         executor = ShellExecutor(max_retries=3)
         result = executor.execute_install_plan(plan, llm_agent, ui)
+        invalidate_system_cache()
         
         # Record installation in memory
         memory.record_app_install(app_name, plan, result)
@@ -622,7 +685,7 @@ def run_install_mode(ui: ModernTerminalUI, app_name: str = None, debug: bool = F
             ui.show_error_message(f"Installation failed", error)
         
     except Exception as e:
-        logging.error(f"Install mode failed: {e}")
+        logging.error("Install mode failed: %s", e)
         ui.show_error_message("Install mode failed", str(e))
 
 
@@ -648,12 +711,14 @@ def run_diagnostics_mode(ui: ModernTerminalUI, debug: bool = False) -> None:
                 ui.show_error_message(f"{category}: Failed")
         
     except Exception as e:
-        logging.error(f"Diagnostics mode failed: {e}")
+        logging.error("Diagnostics mode failed: %s", e)
         ui.show_error_message("Diagnostics mode failed", str(e))
 
 
 def run_settings_mode(ui: ModernTerminalUI) -> None:
     """Run settings menu."""
+    from ui.settings_menu import SettingsMenu
+    
     ui.show_banner()
     ui.show_mode_header('Settings', 'CONFIGO configuration and preferences')
     
@@ -661,10 +726,22 @@ def run_settings_mode(ui: ModernTerminalUI) -> None:
         settings_menu = SettingsMenu(ui)
         settings_menu.show_settings_menu()
     except Exception as e:
-        logging.error(f"Settings mode failed: {e}")
+        logging.error("Settings mode failed: %s", e)
         ui.show_error_message("Settings mode failed", str(e))
 
 
+# Runs each mode from the parsed command line arguments
+MODE_HANDLERS = {
+    'setup': lambda ui, args: run_full_setup(ui, args.debug, args.lite),
+    'chat': lambda ui, args: run_chat_mode(ui, args.debug),
+    'scan': lambda ui, args: run_scan_mode(ui, args.debug),
+    'install': lambda ui, args: run_install_mode(ui, args.app_name, args.debug),
+    'portals': lambda ui, args: run_portal_mode(ui, args.debug),
+    'diagnostics': lambda ui, args: run_diagnostics_mode(ui, args.debug),
+    'settings': lambda ui, args: run_settings_mode(ui),
+}
+
+
 def show_welcome_screen(ui: ModernTerminalUI) -> str:
     """Show welcome screen and get mode choice."""
     ui.show_welcome_animation()
@@ -706,7 +783,7 @@ Examples:
     )
     
     parser.add_argument('command', nargs='?', default='interactive',
-                       choices=['setup', 'chat', 'scan', 'install', 'portals', 'diagnostics', 'settings', 'help'],
+                       choices=[*MODE_HANDLERS, 'help'],
                        help='Command to execute')
     
     parser.add_argument('app_name', nargs='?', help='Application name for install command')
@@ -718,7 +795,13 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.command == 'help':
+        parser.print_help()
+        return
+    
     # Initialize UI with configuration
+    from ui.modern_terminal_ui import ModernTerminalUI, UIConfig, Theme
+    
     ui_config = UIConfig()
     ui_config.theme = Theme(args.theme)
     
@@ -729,57 +812,23 @@ Examples:
     ui = ModernTerminalUI(ui_config)
     
     try:
-        if args.command == 'help':
-            parser.print_help()
-            return
-        
         if args.command == 'interactive':
             # Show welcome screen and get mode
             mode = show_welcome_screen(ui)
-            
-            # Execute the selected mode
-            if mode == 'setup':
-                run_full_setup(ui, args.debug, args.lite)
-            elif mode == 'chat':
-                run_chat_mode(ui, args.debug)
-            elif mode == 'scan':
-                run_scan_mode(ui, args.debug)
-            elif mode == 'install':
-                run_install_mode(ui, args.app_name, args.debug)
-            elif mode == 'portals':
-                run_portal_mode(ui, args.debug)
-            elif mode == 'diagnostics':
-                run_diagnostics_mode(ui, args.debug)
-            elif mode == 'settings':
-                run_settings_mode(ui)
-            else:
-                ui.show_error_message(f"Unknown mode: {mode}")
-        
-        elif args.command == 'setup':
-            run_full_setup(ui, args.debug, args.lite)
-        
-        elif args.command == 'chat':
-            run_chat_mode(ui, args.debug)
-        
-        elif args.command == 'scan':
-            run_scan_mode(ui, args.debug)
-        
-        elif args.command == 'install':
-            run_install_mode(ui, args.app_name, args.debug)
-        
-        elif args.command == 'portals':
-            run_portal_mode(ui, args.debug)
-        
-        elif args.command == 'diagnostics':
-            run_diagnostics_mode(ui, args.debug)
+        else:
+            mode = args.command
         
-        elif args.command == 'settings':
-            run_settings_mode(ui)
+        # Execute the selected mode
+        handler = MODE_HANDLERS.get(mode)
+        if handler:
+            handler(ui, args)
+        else:
+            ui.show_error_message(f"Unknown mode: {mode}")
         
     except KeyboardInterrupt:
         ui.show_success_message("Goodbye! (Interrupted)")
     except Exception as e:
-        logger.error(f"Fatal error in main: {e}")
+        logger.error("Fatal error in main: %s", e)
         if args.debug:
             import traceback
             ui.show_error_message("Fatal error", suggestion=str(e), retry_info=traceback.format_exc())
@@ -7,12 +7,13 @@ Description: Provides AI-powered tool recommendations, chat functionality, and Y
 """
 
 import yaml
+import json
 import logging
 import os
 import time
 import requests
 import re
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 import sys
@@ -57,6 +58,14 @@ class LoginPortal:
     description: str = ""
 
 
+class ChatStreamError(Exception):
+    """
+    Raised when a streamed chat response breaks off after text was yielded.
+    
+    The text received so far is incomplete and should not be used as an answer.
+    """
+
+
 class LLMClient:
     """
     Enhanced LLM client for Gemini API integration with proper validation.
@@ -227,17 +236,6 @@ Keep responses conversational, helpful, and focused on the user's needs. You're
         try:
             logger.info("Calling Gemini API for chat response...")
             
-            # Create the full prompt with system prompt and context
-            full_prompt = f"{self.CHAT_AGENT_PROMPT}\n\n"
-            
-            if memory_context:
-                full_prompt += f"Memory Context:\n{memory_context}\n\n"
-            
-            if chat_context:
-                full_prompt += f"Recent Chat History:\n{chat_context}\n"
-            
-            full_prompt += f"User: {user_input}\n\nCONFIGO:"
-            
             headers = {
                 "Content-Type": "application/json",
             }
@@ -245,7 +243,7 @@ Keep responses conversational, helpful, and focused on the user's needs. You're
             data = {
                 "contents": [{
                     "parts": [{
-                        "text": full_prompt
+                        "text": self._build_chat_prompt(user_input, memory_context, chat_context)
                     }]
                 }]
             }
@@ -296,6 +294,114 @@ Keep responses conversational, helpful, and focused on the user's needs. You're
             logger.error(f"Error calling Gemini API for chat: {e}")
             return self._get_fallback_chat_response(user_input)
     
+    def stream_chat_response(self, user_input: str, memory_context: str = "", chat_context: str = "") -> Iterator[str]:
+        """
+        Generate a chat response, yielding text as the Gemini API produces it.
+        
+        Uses the streamGenerateContent endpoint so the first words can be shown
+        while the rest of the response is still being generated. If the request
+        fails before any text arrives, the fallback response is yielded instead.
+        
+        Args:
+            user_input: The user's input message
+            memory_context: Optional memory context to include
+            chat_context: Optional chat history context
+            
+        Yields:
+            str: Successive pieces of the response text
+            
+        Raises:
+            ChatStreamError: If the stream fails after some text was yielded
+        """
+        if not self._validate_api_key():
+            logger.error("Cannot generate chat response without valid API key")
+            yield self._get_fallback_chat_response(user_input)
+            return
+        
+        stream_url = self.api_url.replace(":generateContent", ":streamGenerateContent")
+        received = False
+        
+        try:
+            logger.info("Streaming chat response from Gemini API...")
+            
+            data = {
+                "contents": [{
+                    "parts": [{
+                        "text": self._build_chat_prompt(user_input, memory_context, chat_context)
+                    }]
+                }]
+            }
+            
+            with requests.post(
+                f"{stream_url}?alt=sse&key={self.api_key}",
+                headers={"Content-Type": "application/json"},
+                json=data,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.warning("Gemini API streaming error: %s", response.status_code)
+                    yield self._get_fallback_chat_response(user_input)
+                    return
+                
+                # Server-sent events: each "data:" line carries one JSON chunk
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    
+                    chunk = json.loads(line[5:])
+                    for candidate in chunk.get('candidates', [])[:1]:
+                        for part in candidate.get('content', {}).get('parts', []):
+                            text = part.get('text')
+                            if text:
+                                received = True
+                                yield text
+            
+            if not received:
+                logger.error("Gemini API stream ended without any text")
+                yield self._get_fallback_chat_response(user_input)
+            else:
+                logger.info("Successfully streamed chat response from Gemini API")
+                
+        except requests.exceptions.Timeout as e:
+            logger.warning("Gemini API request timed out")
+            if received:
+                raise ChatStreamError("response timed out before it was complete") from e
+            yield self._get_fallback_chat_response(user_input)
+        except requests.exceptions.ConnectionError as e:
+            logger.warning("Gemini API connection error")
+            if received:
+                raise ChatStreamError("connection lost before the response was complete") from e
+            yield self._get_fallback_chat_response(user_input)
+        except Exception as e:
+            logger.error("Error streaming chat response from Gemini API: %s", e)
+            if received:
+                raise ChatStreamError(f"response stream failed: {e}") from e
+            yield self._get_fallback_chat_response(user_input)
+    
+    def _build_chat_prompt(self, user_input: str, memory_context: str, chat_context: str) -> str:
+        """
+        Create the full chat prompt with system prompt and context.
+        
+        Args:
+            user_input: The user's input message
+            memory_context: Memory context to include, if any
+            chat_context: Chat history context to include, if any
+            
+        Returns:
+            str: Prompt to send to the Gemini API
+        """
+        full_prompt = f"{self.CHAT_AGENT_PROMPT}\n\n"
+        
+        if memory_context:
+            full_prompt += f"Memory Context:\n{memory_context}\n\n"
+        
+        if chat_context:
+            full_prompt += f"Recent Chat History:\n{chat_context}\n"
+        
+        full_prompt += f"User: {user_input}\n\nCONFIGO:"
+        return full_prompt
+    
     def _get_fallback_chat_response(self, user_input: str) -> str:
         """
         Return a fallback chat response with dynamic, conversational replies.
@@ -8,6 +8,7 @@ Handles various user input patterns and extracts clean app names.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, List
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,40 @@ class AppNameExtractor:
         'find', 'open', 'run', 'start', 'launch', 'execute', 'use', 'try'
     }
     
+    # Common prefixes and suffixes to remove, in priority order; only the
+    # first match of each is stripped
+    PREFIXES = (
+        'install', 'get', 'fetch', 'download', 'add', 'setup', 'set up',
+        'need', 'want', 'please', 'can you', 'could you', 'would you',
+        'i need', 'i want', 'i would like', 'i would love', 'i would appreciate',
+        'show me', 'find me', 'give me', 'bring me', 'bring up', 'open up',
+        'start up', 'launch', 'run', 'execute', 'use', 'try', 'let me',
+        'help me', 'assist me', 'support me', 'enable me', 'allow me'
+    )
+    SUFFIXES = (
+        'please', 'thanks', 'thank you', 'thx', 'app', 'application',
+        'program', 'software', 'tool', 'utility', 'package'
+    )
+    
+    # Alternations are tried left to right, so these match the same
+    # prefix/suffix the ordered lists above would
+    _PREFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, PREFIXES)) + ') ')
+    _SUFFIX_RE = re.compile(' (?:' + '|'.join(map(re.escape, SUFFIXES)) + ')$')
+    
+    # Names whose canonical spelling title case would get wrong
+    _SPECIAL_CASES = {
+        'vscode': 'VS Code', 'vs code': 'VS Code', 'visual studio code': 'VS Code',
+        'telegram': 'Telegram',
+        'discord': 'Discord',
+        'slack': 'Slack',
+        'chrome': 'Google Chrome', 'google chrome': 'Google Chrome',
+        'firefox': 'Firefox', 'mozilla firefox': 'Firefox',
+        'zoom': 'Zoom',
+        'teams': 'Microsoft Teams', 'microsoft teams': 'Microsoft Teams',
+        'spotify': 'Spotify',
+        'steam': 'Steam',
+    }
+    
     # Common app name mappings for better recognition
     APP_NAME_MAPPINGS = {
         'telegram': 'Telegram',
@@ -288,6 +323,23 @@ class AppNameExtractor:
         if not user_input or not user_input.strip():
             return ""
         
+        app_name = cls._extract(user_input)
+        
+        logger.info(f"Extracted app name: '{user_input}' -> '{app_name}'")
+        return app_name
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _extract(cls, user_input: str) -> str:
+        """
+        Extract the app name; memoized since users repeat common phrases.
+        
+        Args:
+            user_input: Non-empty raw user input
+            
+        Returns:
+            str: Clean app name
+        """
         # Convert to lowercase for processing
         input_lower = user_input.lower().strip()
         
@@ -305,10 +357,7 @@ class AppNameExtractor:
         app_name = cls._apply_app_mappings(app_name_raw)
         
         # Clean up the final app name
-        app_name = cls._clean_app_name(app_name)
-        
-        logger.info(f"Extracted app name: '{user_input}' -> '{app_name}'")
-        return app_name
+        return cls._clean_app_name(app_name)
     
     @classmethod
     def _remove_prefixes_and_suffixes(cls, text: str) -> str:
@@ -321,33 +370,15 @@ class AppNameExtractor:
         Returns:
             str: Cleaned text
         """
-        # Common prefixes to remove
-        prefixes = [
-            'install', 'get', 'fetch', 'download', 'add', 'setup', 'set up',
-            'need', 'want', 'please', 'can you', 'could you', 'would you',
-            'i need', 'i want', 'i would like', 'i would love', 'i would appreciate',
-            'show me', 'find me', 'give me', 'bring me', 'bring up', 'open up',
-            'start up', 'launch', 'run', 'execute', 'use', 'try', 'let me',
-            'help me', 'assist me', 'support me', 'enable me', 'allow me'
-        ]
-        
-        # Common suffixes to remove
-        suffixes = [
-            'please', 'thanks', 'thank you', 'thx', 'app', 'application',
-            'program', 'software', 'tool', 'utility', 'package'
-        ]
-        
         # Remove prefixes
-        for prefix in prefixes:
-            if text.startswith(prefix + ' '):
-                text = text[len(prefix):].strip()
-                break
+        match = cls._PREFIX_RE.match(text)
+        if match:
+            text = text[match.end():].strip()
         
         # Remove suffixes
-        for suffix in suffixes:
-            if text.endswith(' ' + suffix):
-                text = text[:-len(suffix)].strip()
-                break
+        match = cls._SUFFIX_RE.search(text)
+        if match:
+            text = text[:match.start()].strip()
         
         return text
     
@@ -389,26 +420,9 @@ class AppNameExtractor:
         app_name = ' '.join(app_name.split())
         
         # Handle special cases
-        if app_name.lower() in ['vscode', 'vs code', 'visual studio code']:
-            return 'VS Code'
-        elif app_name.lower() in ['telegram']:
-            return 'Telegram'
-        elif app_name.lower() in ['discord']:
-            return 'Discord'
-        elif app_name.lower() in ['slack']:
-            return 'Slack'
-        elif app_name.lower() in ['chrome', 'google chrome']:
-            return 'Google Chrome'
-        elif app_name.lower() in ['firefox', 'mozilla firefox']:
-            return 'Firefox'
-        elif app_name.lower() in ['zoom']:
-            return 'Zoom'
-        elif app_name.lower() in ['teams', 'microsoft teams']:
-            return 'Microsoft Teams'
-        elif app_name.lower() in ['spotify']:
-            return 'Spotify'
-        elif app_name.lower() in ['steam']:
-            return 'Steam'
+        special_case = cls._SPECIAL_CASES.get(app_name.lower())
+        if special_case:
+            return special_case
         
         # Default: proper title case
         return app_name.title()
@@ -11,9 +11,10 @@ Interactive conversational mode for CONFIGO that allows users to:
 import logging
 import re
 import subprocess
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Tuple
 from dataclasses import dataclass
-from core.ai import LLMClient
+from core.ai import ChatStreamError, LLMClient
 from core.memory import AgentMemory
 from core.enhanced_llm_agent import EnhancedLLMAgent
 
@@ -45,6 +46,10 @@ class ChatAgent:
         self.chat_history = []
         self.max_history = 5
         
+        # Memory context loaded in the background while the user types
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._context_future: Optional[Future] = None
+        
         # Command patterns for natural language
         self.command_patterns = {
             r"install\s+(\w+)": "install_tool",
@@ -95,7 +100,28 @@ class ChatAgent:
         print(f"🤖 LLM Response: {llm_response}")
         print("="*60 + "\n")
     
-    def process_message(self, user_input: str) -> ChatResponse:
+    def prefetch_context(self) -> None:
+        """
+        Start loading the memory context for the next message in the background.
+        
+        Call this right before waiting for user input, so the memory lookup
+        overlaps with the user typing instead of delaying the LLM call.
+        """
+        if self._context_future is None:
+            self._context_future = self._prefetch_pool.submit(self.memory.get_memory_context)
+    
+    def _take_memory_context(self) -> str:
+        """Get the prefetched memory context, or load it now if none is pending."""
+        future, self._context_future = self._context_future, None
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.debug("Prefetching memory context failed: %s", e)
+        
+        return self.memory.get_memory_context()
+    
+    def process_message(self, user_input: str, on_delta: Optional[Callable[[str], None]] = None) -> ChatResponse:
         """
         Process user input and return appropriate response using real LLM API calls.
         
@@ -104,6 +130,9 @@ class ChatAgent:
         
         Args:
             user_input: User's natural language input
+            on_delta: Optional callback receiving the response text as it streams
+                in. Only text that starts the final message is passed on; the
+                complete response is still returned once parsed
             
         Returns:
             ChatResponse: Structured response with action and message
@@ -118,14 +147,34 @@ class ChatAgent:
                 )
             
             # Get memory context for better responses
-            memory_context = self.memory.get_memory_context()
+            memory_context = self._take_memory_context()
             
             # Add chat history context
             chat_context = self._get_chat_context()
             
             # Call the actual LLM API for intelligent responses
-            logger.info(f"Calling LLM API for chat response to: {user_input[:50]}...")
-            llm_response = self.llm_client.chat_response(user_input, memory_context, chat_context)
+            logger.info("Calling LLM API for chat response to: %.50s...", user_input)
+            if on_delta is None:
+                llm_response = self.llm_client.chat_response(user_input, memory_context, chat_context)
+            else:
+                chunks = []
+                pending = ""
+                started = False
+                for delta in self.llm_client.stream_chat_response(user_input, memory_context, chat_context):
+                    chunks.append(delta)
+                    
+                    # The message is the stripped response, so leading whitespace
+                    # is dropped and trailing whitespace held back until more
+                    # text follows it
+                    pending += delta
+                    if not started:
+                        pending = pending.lstrip()
+                    visible = pending.rstrip()
+                    if visible:
+                        on_delta(visible)
+                        pending = pending[len(visible):]
+                        started = True
+                llm_response = "".join(chunks).strip()
             
             # Show debug info if enabled
             if self.debug_mode:
@@ -150,11 +199,19 @@ class ChatAgent:
             if response.action_type == "info":
                 response.message = self._enhance_with_memory(response.message, user_input)
             
-            logger.info(f"Chat response generated via LLM API: {response.action_type} - {response.message[:50]}...")
+            logger.info("Chat response generated via LLM API: %s - %.50s...", response.action_type, response.message)
             return response
             
+        except ChatStreamError as e:
+            # The text streamed so far is a fragment; never parse it as an answer
+            logger.error("Chat response stream broke off: %s", e)
+            return ChatResponse(
+                message="⚠️ My response was cut off before it finished. Please try again.",
+                action_type="error",
+                confidence=0.4
+            )
         except Exception as e:
-            logger.error(f"Error processing chat message via LLM API: {e}")
+            logger.error("Error processing chat message via LLM API: %s", e)
             return ChatResponse(
                 message="I'm having trouble connecting to my AI brain. Please check your GEMINI_API_KEY in the .env file and try again.",
                 action_type="error",
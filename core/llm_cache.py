@@ -0,0 +1,432 @@
+"""
+CONFIGO LLM Response Cache
+==========================
+
+Caches EnhancedLLMAgent responses on disk so that re-submitting the same
+request answers from the cache instead of another multi-second LLM round
+trip. With sentence-transformers and FAISS installed, paraphrased
+environment descriptions ("web developer" / "web development") are matched
+by embedding similarity as well.
+
+Usage:
+    llm_agent = EnhancedLLMAgent(memory)
+    llm_cache.init(llm_agent, system_info)
+"""
+
+import dataclasses
+import hashlib
+import importlib
+import json
+import logging
+import sqlite3
+import time
+from enum import Enum
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Try to import the embedding stack, fall back to exact matching if not available
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Cached responses are reused for this many seconds
+LLM_CACHE_TTL = 7 * 24 * 3600.0
+
+# Minimum cosine similarity for a paraphrased prompt to count as a hit
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+
+_EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# Recently embedded prompts kept in memory, so a lookup followed by storing
+# the same prompt embeds it once
+_EMBEDDING_CACHE_SIZE = 4096
+_CACHE_FILE = 'llm_cache.sqlite'
+
+
+def _is_usable_stack(response: Any) -> bool:
+    """Whether a stack recommendation is a real answer worth reusing."""
+    return bool(getattr(response, 'tools', None)) and not getattr(response, 'is_fallback', False)
+
+
+def _is_usable_install_plan(plan: Any) -> bool:
+    """Whether an install plan is a real answer worth reusing."""
+    return isinstance(plan, dict) and bool(plan.get('steps')) and not plan.get('error')
+
+
+# Agent methods wrapped by init(), whether their first argument is free text
+# worth matching semantically, and the check a response must pass to be
+# cached (fallback and error responses must not be replayed). App names are
+# matched exactly since similar names ("VS Code" / "VSCodium") are
+# different apps
+_CACHED_METHODS: Dict[str, Tuple[bool, Callable[[Any], bool]]] = {
+    'generate_enhanced_stack': (True, _is_usable_stack),
+    'get_install_plan': (False, _is_usable_install_plan),
+}
+
+_caches: Dict[str, 'LLMResponseCache'] = {}
+
+# Key marking a stored dataclass or enum, and the only package whose types a
+# stored value may name; nothing else is imported when reading the cache
+_TYPE_TAG = '__type__'
+_RESPONSE_TYPES_PACKAGE = 'core.'
+
+
+def _canonical(value: Any) -> str:
+    """Serialize a value to JSON that is identical for equal inputs."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Encode objects json cannot serialize.
+    
+    System analyses are encoded as their fingerprint, so their timestamps
+    do not make every key unique.
+    """
+    if hasattr(value, 'installed_tools') and hasattr(value, 'os_version'):
+        return system_fingerprint(value)
+    return str(value)
+
+
+def _digest(text: str) -> bytes:
+    """
+    Hash text to a cache key.
+    
+    BLAKE2b is collision resistant and faster than MD5 or SHA-256 without
+    a third-party dependency. Keys are stored as raw 16-byte blobs, which
+    keeps the sqlite indexes at less than half the size of hex text.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _dump_value(value: Any) -> str:
+    """
+    Serialize a response to JSON.
+    
+    Dataclasses and enums are tagged with their type so _load_value can
+    rebuild them; anything else json cannot encode raises TypeError.
+    """
+    return json.dumps(_encode_value(value), separators=(',', ':'))
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a response to JSON-compatible data."""
+    if isinstance(value, Enum):
+        return {_TYPE_TAG: _type_name(type(value)), 'value': _encode_value(value.value)}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            _TYPE_TAG: _type_name(type(value)),
+            'fields': {
+                field.name: _encode_value(getattr(value, field.name))
+                for field in dataclasses.fields(value) if field.init
+            }
+        }
+    if isinstance(value, dict):
+        return {key: _encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    return value
+
+
+def _type_name(cls: type) -> str:
+    """Name a response type so it can be found again when loading."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_value(text: str) -> Any:
+    """Rebuild a response serialized with _dump_value."""
+    return json.loads(text, object_hook=_decode_object)
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """Turn a tagged JSON object back into its dataclass or enum."""
+    type_name = obj.get(_TYPE_TAG)
+    if type_name is None:
+        return obj
+    
+    module_name, _, qualname = type_name.partition(':')
+    if not module_name.startswith(_RESPONSE_TYPES_PACKAGE):
+        raise ValueError(f"Refusing to load cached type {type_name}")
+    
+    cls = importlib.import_module(module_name)
+    for attr in qualname.split('.'):
+        cls = getattr(cls, attr)
+    
+    if isinstance(cls, type) and issubclass(cls, Enum):
+        return cls(obj['value'])
+    if dataclasses.is_dataclass(cls):
+        return cls(**obj['fields'])
+    raise ValueError(f"Cached type {type_name} is not a dataclass or enum")
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Fold case and whitespace so trivially different prompts share an entry."""
+    return ' '.join(str(prompt).lower().split())
+
+
+def system_fingerprint(system_info: Any) -> Dict[str, Any]:
+    """
+    Describe the parts of a system analysis that change LLM recommendations.
+    
+    A new OS version or a different set of installed tools yields a different
+    fingerprint, so responses cached for the old system are not reused.
+    
+    Args:
+        system_info: SystemIntelligence from SystemInspector.analyze(), or None
+    
+    Returns:
+        Dict[str, Any]: JSON-serializable fingerprint
+    """
+    if system_info is None:
+        return {}
+    
+    return {
+        'os_name': system_info.os_name,
+        'os_version': system_info.os_version,
+        'arch': system_info.arch,
+        'installed_tools': sorted(system_info.installed_tools)
+    }
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLM responses with optional semantic lookup.
+    
+    Entries are grouped by scope: a hash of everything that affects the
+    response besides the prompt (method, model, system fingerprint and the
+    remaining arguments). Semantic matches are only made within a scope.
+    """
+    
+    def __init__(self, memory_dir: str = ".configo_memory", max_age: float = LLM_CACHE_TTL,
+                 semantic: bool = True):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            memory_dir: Directory holding the cache database
+            max_age: Maximum age in seconds of a reusable response
+            semantic: Whether to match paraphrased prompts when embeddings are available
+        """
+        self.max_age = max_age
+        
+        memory_path = Path(memory_dir)
+        memory_path.mkdir(exist_ok=True)
+        self._db = sqlite3.connect(str(memory_path / _CACHE_FILE))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, scope BLOB NOT NULL, prompt TEXT NOT NULL, "
+            "value TEXT NOT NULL, created REAL NOT NULL, embedding BLOB)"
+        )
+        # Databases from before embeddings were stored lack the column
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+        if 'embedding' not in columns:
+            self._db.execute("ALTER TABLE responses ADD COLUMN embedding BLOB")
+        # Responses were once stored pickled; drop them unread
+        self._db.execute("DELETE FROM responses WHERE typeof(value) = 'blob'")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)")
+        self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - max_age,))
+        self._db.commit()
+        
+        # Per-scope FAISS index over prompt embeddings, built on first lookup
+        # from the embeddings stored with each response
+        self._encoder = None
+        self._embed_prompt = lru_cache(maxsize=_EMBEDDING_CACHE_SIZE)(self._embed_one)
+        self._indexes: Dict[bytes, Tuple[Any, List[bytes]]] = {}
+        if semantic and SEMANTIC_CACHE_AVAILABLE:
+            try:
+                self._encoder = SentenceTransformer(_EMBEDDING_MODEL)
+            except Exception as e:
+                logger.warning(f"Semantic LLM cache disabled, could not load embeddings: {e}")
+        
+        logger.info(f"LLM response cache opened ({'semantic' if self._encoder else 'exact'} matching)")
+    
+    def get(self, scope: bytes, prompt: str, semantic: bool = False) -> Optional[Any]:
+        """
+        Look up a cached response.
+        
+        Args:
+            scope: Scope key from the wrapped call
+            prompt: Prompt text of the call
+            semantic: Whether a similar prompt in the same scope may answer it
+        
+        Returns:
+            Optional[Any]: The cached response, or None on a miss
+        """
+        prompt = _normalize_prompt(prompt)
+        cutoff = time.time() - self.max_age
+        
+        row = self._db.execute(
+            "SELECT value FROM responses WHERE key = ? AND created >= ?",
+            (_digest(f"{scope}\0{prompt}"), cutoff)
+        ).fetchone()
+        if row:
+            logger.debug(f"LLM cache hit for '{prompt}'")
+            return _load_value(row[0])
+        
+        if not (semantic and self._encoder):
+            return None
+        
+        index, keys = self._scope_index(scope)
+        if not keys:
+            return None
+        
+        scores, ids = index.search(self._embed_prompt(prompt), 1)
+        if scores[0][0] < SEMANTIC_SIMILARITY_THRESHOLD:
+            return None
+        
+        row = self._db.execute(
+            "SELECT prompt, value FROM responses WHERE key = ? AND created >= ?",
+            (keys[ids[0][0]], cutoff)
+        ).fetchone()
+        if row:
+            logger.debug(f"LLM cache semantic hit for '{prompt}' via '{row[0]}' ({scores[0][0]:.2f})")
+            return _load_value(row[1])
+        
+        return None
+    
+    def put(self, scope: bytes, prompt: str, value: Any, semantic: bool = False) -> None:
+        """
+        Store a response.
+        
+        Args:
+            scope: Scope key from the wrapped call
+            prompt: Prompt text of the call
+            value: Response to cache: JSON data, dataclasses and enums
+            semantic: Whether to store the prompt's embedding for similar lookups
+        """
+        prompt = _normalize_prompt(prompt)
+        key = _digest(f"{scope}\0{prompt}")
+        vector = self._embed_prompt(prompt) if semantic and self._encoder else None
+        
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, scope, prompt, value, created, embedding) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, scope, prompt, _dump_value(value), time.time(),
+             vector.tobytes() if vector is not None else None)
+        )
+        self._db.commit()
+        
+        # Keep an already built index in step with the table
+        if vector is not None and scope in self._indexes:
+            index, keys = self._indexes[scope]
+            if key not in keys:
+                index.add(vector)
+                keys.append(key)
+    
+    def wrap(self, llm_agent: Any, system_info: Any = None) -> None:
+        """
+        Route an agent's LLM calls through this cache.
+        
+        Args:
+            llm_agent: EnhancedLLMAgent instance to patch
+            system_info: Current SystemIntelligence, part of every cache key
+        """
+        fingerprint = system_fingerprint(system_info)
+        model = getattr(llm_agent, 'model_name', None)
+        model = model if isinstance(model, str) else type(llm_agent).__name__
+        memory = getattr(llm_agent, 'memory', None)
+        
+        for name, (semantic, is_usable) in _CACHED_METHODS.items():
+            method = getattr(llm_agent, name, None)
+            if method is None or getattr(method, 'llm_cache', None) is not None:
+                continue
+            setattr(llm_agent, name, self._cached(method, name, semantic, is_usable, model, fingerprint, memory))
+    
+    def _cached(self, method: Callable, name: str, semantic: bool, is_usable: Callable[[Any], bool],
+                model: str, fingerprint: Dict[str, Any], memory: Any) -> Callable:
+        """Build the caching wrapper for one agent method."""
+        @wraps(method)
+        def cached_method(prompt, *args, **kwargs):
+            try:
+                # The agent adds its memory context to the prompt, so a response
+                # is only reused while that context (what is installed) is unchanged
+                memory_context = memory.get_memory_context() if memory is not None else None
+                scope = _digest(_canonical([name, model, fingerprint, memory_context, args, kwargs]))
+                cached = self.get(scope, prompt, semantic)
+            except Exception as e:
+                logger.debug(f"LLM cache lookup failed for {name}: {e}")
+                return method(prompt, *args, **kwargs)
+            
+            if cached is not None:
+                return cached
+            
+            result = method(prompt, *args, **kwargs)
+            if is_usable(result):
+                try:
+                    self.put(scope, prompt, result, semantic)
+                except Exception as e:
+                    logger.debug(f"Could not cache {name} response: {e}")
+            return result
+        
+        cached_method.llm_cache = self
+        return cached_method
+    
+    def _scope_index(self, scope: bytes) -> Tuple[Any, List[bytes]]:
+        """Get the embedding index of a scope's prompts, building it if needed."""
+        if scope not in self._indexes:
+            rows = self._db.execute(
+                "SELECT key, prompt, embedding FROM responses WHERE scope = ? AND created >= ?",
+                (scope, time.time() - self.max_age)
+            ).fetchall()
+            dimension = self._encoder.get_sentence_embedding_dimension()
+            
+            # Embed only prompts stored without an embedding, and save them
+            missing = [(key, prompt) for key, prompt, blob in rows if blob is None or len(blob) != dimension * 4]
+            if missing:
+                vectors = self._embed([prompt for _, prompt in missing])
+                self._db.executemany(
+                    "UPDATE responses SET embedding = ? WHERE key = ?",
+                    [(vector.tobytes(), key) for (key, _), vector in zip(missing, vectors)]
+                )
+                self._db.commit()
+                embedded = dict(zip((key for key, _ in missing), vectors))
+            else:
+                embedded = {}
+            
+            index = faiss.IndexFlatIP(dimension)
+            if rows:
+                index.add(np.vstack([
+                    embedded[key] if key in embedded else np.frombuffer(blob, dtype='float32')
+                    for key, _, blob in rows
+                ]))
+            self._indexes[scope] = (index, [key for key, _, _ in rows])
+        
+        return self._indexes[scope]
+    
+    def _embed_one(self, prompt: str) -> Any:
+        """Embed a single prompt as a one-row matrix."""
+        return self._embed([prompt])
+    
+    def _embed(self, texts: List[str]) -> Any:
+        """Embed texts as unit vectors, so inner product is cosine similarity."""
+        return self._encoder.encode(texts, normalize_embeddings=True, convert_to_numpy=True).astype('float32')
+
+
+def init(llm_agent: Any, system_info: Any = None, memory_dir: str = ".configo_memory") -> LLMResponseCache:
+    """
+    Enable response caching on an LLM agent.
+    
+    The cache for a memory directory is opened once per process and shared
+    by every agent passed here.
+    
+    Args:
+        llm_agent: EnhancedLLMAgent instance to patch
+        system_info: Current SystemIntelligence, part of every cache key
+        memory_dir: Directory holding the cache database
+    
+    Returns:
+        LLMResponseCache: The cache now serving the agent
+    """
+    cache = _caches.get(memory_dir)
+    if cache is None:
+        cache = _caches[memory_dir] = LLMResponseCache(memory_dir)
+    
+    cache.wrap(llm_agent, system_info)
+    return cache
@@ -19,7 +19,8 @@ Features:
 import json
 import os
 import logging
-from typing import Dict, List, Any, Optional, Set
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Dict, Any
@@ -27,6 +28,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Number of project analyses kept in the cache; the least recently used are dropped
+MAX_CACHED_ANALYSES = 32
+
 def dataclass_to_dict(obj) -> Dict[str, Any]:
     """
     Convert a dataclass instance to a dictionary.
@@ -50,6 +54,9 @@ def dataclass_to_dict(obj) -> Dict[str, Any]:
                     dataclass_to_dict(item) if hasattr(item, '__dataclass_fields__') else item
                     for item in value
                 ]
+            elif isinstance(value, (set, frozenset)):
+                # Sorted so the JSON form is stable between runs
+                result[field_name] = sorted(value)
             else:
                 result[field_name] = value
         return result
@@ -198,6 +205,10 @@ class EnhancedJSONMemory:
         self.storage_path = Path(storage_path)
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self.entries: List[SemanticMemoryEntry] = []
+        
+        # When False, save() only marks the entries unsaved until flush()
+        self.autosave = True
+        self._unsaved = False
         self._load_entries()
     
     def _load_entries(self) -> None:
@@ -257,7 +268,16 @@ class EnhancedJSONMemory:
         )
         
         self.entries.append(entry)
-        self._save_entries()
+        if self.autosave:
+            self._save_entries()
+        else:
+            self._unsaved = True
+    
+    def flush(self) -> None:
+        """Write entries added while autosave was off."""
+        if self._unsaved:
+            self._unsaved = False
+            self._save_entries()
     
     def query(self, query: str, limit: int = 5) -> List[str]:
         """
@@ -335,6 +355,17 @@ class AgentMemory:
         self.portals_file = self.memory_dir / "portals.json"
         self.profiles_file = self.memory_dir / "profiles.json"
         self.semantic_file = self.memory_dir / "semantic.json"
+        self.blobs_dir = self.memory_dir / "blobs"
+        self.installed_apps_file = self.memory_dir / "installed_apps.json"
+        
+        # Parsed installed_apps.json, keyed by the file's mtime so edits
+        # from other processes are still picked up
+        self._installed_apps_mtime: Optional[int] = None
+        self._installed_apps: Dict[str, Any] = {}
+        
+        # Set inside batched_writes(), where saves are held until the end
+        self._batching = False
+        self._save_pending = False
         
         # Initialize memory components
         self._initialize_memory()
@@ -488,8 +519,39 @@ class AgentMemory:
             self.portals_memory = {}
             self.profiles = {}
     
+    @contextmanager
+    def batched_writes(self) -> Iterator[None]:
+        """
+        Write the memory files once for a group of updates.
+        
+        Every update normally rewrites all memory files. Inside this block
+        updates only change the in-memory state, and the files are written
+        once when the block exits, so recording a batch of installations
+        costs one save instead of one per tool. Nested blocks are part of
+        the outermost one.
+        """
+        if self._batching:
+            yield
+            return
+        
+        self._batching = True
+        self.semantic_memory.autosave = False
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.semantic_memory.autosave = True
+            if self._save_pending:
+                self._save_pending = False
+                self._save_memory()
+            self.semantic_memory.flush()
+    
     def _save_memory(self) -> None:
         """Save all memory data to files."""
+        if self._batching:
+            self._save_pending = True
+            return
+        
         try:
             # Save tools memory
             tools_data = {
@@ -880,6 +942,11 @@ class AgentMemory:
         """
         Get memory context for LLM prompts.
         
+        The context is deterministic: tools are listed by name, and parts
+        that change between runs (recent sessions, semantic recall) come
+        last, so prompts built from it share the longest possible prefix
+        and provider-side prompt caching can reuse it.
+        
         Returns:
             Formatted string with memory context
         """
@@ -887,13 +954,17 @@ class AgentMemory:
         
         # Add tool installation history
         if self.tools_memory:
-            successful_tools = [name for name, tool in self.tools_memory.items() if tool.install_success]
-            failed_tools = [name for name, tool in self.tools_memory.items() if not tool.install_success]
+            successful_tools = sorted(name for name, tool in self.tools_memory.items() if tool.install_success)
+            failed_tools = sorted(name for name, tool in self.tools_memory.items() if not tool.install_success)
             
             context_parts.append(f"Previously installed tools: {', '.join(successful_tools)}")
             if failed_tools:
                 context_parts.append(f"Previously failed tools: {', '.join(failed_tools)}")
         
+        # Add user preferences
+        prefs = self.user_preferences
+        context_parts.append(f"User preferences: editor={prefs.preferred_editor}, package_manager={prefs.preferred_package_manager}")
+        
         # Add recent session information
         recent_sessions = self.get_recent_sessions(3)
         if recent_sessions:
@@ -902,10 +973,6 @@ class AgentMemory:
                 session_info.append(f"{session.environment} ({len(session.tools_installed)} tools installed)")
             context_parts.append(f"Recent sessions: {'; '.join(session_info)}")
         
-        # Add user preferences
-        prefs = self.user_preferences
-        context_parts.append(f"User preferences: editor={prefs.preferred_editor}, package_manager={prefs.preferred_package_manager}")
-        
         # Add semantic memory context
         if self.mem0_client or self.semantic_memory.entries:
             recent_memory = self.query_memory("tool installation", limit=3)
@@ -967,6 +1034,25 @@ class AgentMemory:
             }
         )
     
+    def get_login_portal_statuses(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the latest status recorded for each portal with record_login_portal_status.
+        
+        Returns:
+            Dictionary mapping portal name to its is_logged_in, last_check and
+            installation_status
+        """
+        statuses = {}
+        for entry in self.semantic_memory.entries:
+            metadata = entry.metadata or {}
+            if 'portal_name' in metadata and 'is_logged_in' in metadata:
+                statuses[metadata['portal_name']] = {
+                    'is_logged_in': metadata['is_logged_in'],
+                    'last_check': metadata.get('last_check'),
+                    'installation_status': metadata.get('installation_status', 'not_installed')
+                }
+        return statuses
+    
     def get_login_portals_memory(self) -> Dict[str, Any]:
         """
         Get login portals memory for context.
@@ -992,6 +1078,99 @@ class AgentMemory:
             ]
         }
     
+    def set_blob(self, key: str, value: str) -> bool:
+        """
+        Store an opaque serialized snapshot under a key.
+        
+        Args:
+            key: Blob identifier
+            value: Serialized content to store
+            
+        Returns:
+            True if the blob was written
+        """
+        try:
+            self.blobs_dir.mkdir(exist_ok=True)
+            
+            # Write a temporary file and swap it in, so a failed write never
+            # leaves a truncated blob behind
+            blob_file = self.blobs_dir / f"{key}.json"
+            temp_file = blob_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as f:
+                f.write(value)
+            os.replace(temp_file, blob_file)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving blob {key}: {e}")
+            return False
+    
+    def get_blob(self, key: str) -> Optional[str]:
+        """
+        Load a snapshot previously stored with set_blob.
+        
+        Args:
+            key: Blob identifier
+            
+        Returns:
+            Stored content, or None if the blob does not exist
+        """
+        blob_file = self.blobs_dir / f"{key}.json"
+        try:
+            if blob_file.exists():
+                with open(blob_file, 'r') as f:
+                    return f.read()
+        except Exception as e:
+            logger.error(f"Error loading blob {key}: {e}")
+        
+        return None
+    
+    def get_cached_analysis(self, project_path: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached project analysis for a directory if it is still valid.
+        
+        Args:
+            project_path: Absolute path of the scanned project
+            key: Fingerprint the cached analysis must have been stored under
+            
+        Returns:
+            Serialized analysis, or None if nothing matching is cached
+        """
+        try:
+            cache = json.loads(self.get_blob("project_analyses") or "{}")
+            entry = cache.get(project_path)
+            if entry and entry.get('key') == key:
+                # Move the entry to the end so it is the last one evicted
+                if next(reversed(cache)) != project_path:
+                    cache[project_path] = cache.pop(project_path)
+                    self.set_blob("project_analyses", json.dumps(cache))
+                return entry.get('analysis')
+        except Exception as e:
+            logger.error(f"Error loading cached analysis for {project_path}: {e}")
+        
+        return None
+    
+    def set_cached_analysis(self, project_path: str, key: str, analysis: Dict[str, Any]) -> None:
+        """
+        Cache a project analysis for a directory, replacing any older entry.
+        
+        At most MAX_CACHED_ANALYSES projects are kept. When the cache is full,
+        the least recently used project is dropped.
+        
+        Args:
+            project_path: Absolute path of the scanned project
+            key: Fingerprint of the project state the analysis describes
+            analysis: Serialized analysis
+        """
+        try:
+            cache = json.loads(self.get_blob("project_analyses") or "{}")
+            cache.pop(project_path, None)
+            cache[project_path] = {'key': key, 'analysis': analysis}
+            while len(cache) > MAX_CACHED_ANALYSES:
+                del cache[next(iter(cache))]
+            self.set_blob("project_analyses", json.dumps(cache))
+        except Exception as e:
+            logger.error(f"Error caching analysis for {project_path}: {e}")
+    
     def get_tool_justification_context(self, tool_name: str) -> str:
         """
         Get context for tool justification.
@@ -1025,6 +1204,10 @@ class AgentMemory:
             if file_path.exists():
                 file_path.unlink()
         
+        if self.blobs_dir.exists():
+            for blob_file in self.blobs_dir.glob("*.json"):
+                blob_file.unlink()
+        
         # Reset preferences to defaults
         self.user_preferences = UserPreferences()
         self._save_memory()
@@ -1258,23 +1441,16 @@ class AgentMemory:
             }
             
             # Load existing installed apps
-            installed_apps_file = self.memory_dir / 'installed_apps.json'
-            installed_apps = {}
-            
-            if installed_apps_file.exists():
-                try:
-                    with open(installed_apps_file, 'r') as f:
-                        installed_apps = json.load(f)
-                except Exception as e:
-                    logger.error(f"Error loading installed apps: {e}")
-                    installed_apps = {}
+            installed_apps = dict(self._load_installed_apps())
             
             # Add/update app record
             installed_apps[app_name] = app_record
             
             # Save to file
-            with open(installed_apps_file, 'w') as f:
+            with open(self.installed_apps_file, 'w') as f:
                 json.dump(installed_apps, f, indent=2)
+            self._installed_apps = installed_apps
+            self._installed_apps_mtime = self.installed_apps_file.stat().st_mtime_ns
             
             # Also save to semantic memory for context
             memory_context = f"App {app_name} was installed using {result.get('method', 'unknown')} method. "
@@ -1298,22 +1474,41 @@ class AgentMemory:
         except Exception as e:
             logger.error(f"Error recording app installation for {app_name}: {e}")
 
-    def get_installed_apps(self) -> Dict[str, Any]:
+    def _load_installed_apps(self) -> Dict[str, Any]:
         """
-        Get all installed apps from memory.
+        Return the parsed installed apps file, re-reading it only when it changed.
+        
+        The returned dictionary is shared; callers must not modify it.
         
         Returns:
             Dict[str, Any]: Dictionary of installed apps
         """
         try:
-            installed_apps_file = self.memory_dir / 'installed_apps.json'
-            if installed_apps_file.exists():
-                with open(installed_apps_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading installed apps: {e}")
+            mtime = self.installed_apps_file.stat().st_mtime_ns
+        except OSError:
+            self._installed_apps_mtime = None
+            self._installed_apps = {}
+            return self._installed_apps
         
-        return {}
+        if mtime != self._installed_apps_mtime:
+            try:
+                with open(self.installed_apps_file, 'r') as f:
+                    self._installed_apps = json.load(f)
+            except Exception as e:
+                logger.error(f"Error loading installed apps: {e}")
+                self._installed_apps = {}
+            self._installed_apps_mtime = mtime
+        
+        return self._installed_apps
+    
+    def get_installed_apps(self) -> Dict[str, Any]:
+        """
+        Get all installed apps from memory.
+        
+        Returns:
+            Dict[str, Any]: Dictionary of installed apps
+        """
+        return dict(self._load_installed_apps())
 
     def is_app_installed(self, app_name: str) -> bool:
         """
@@ -1325,8 +1520,7 @@ class AgentMemory:
         Returns:
             bool: True if app is installed, False otherwise
         """
-        installed_apps = self.get_installed_apps()
-        app_record = installed_apps.get(app_name)
+        app_record = self._load_installed_apps().get(app_name)
         
         if app_record:
             return app_record.get('success', False)
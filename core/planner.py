@@ -150,7 +150,7 @@ class PlanGenerator:
             total_steps=len(steps)
         )
         
-        logger.info(f"Generated plan {plan_id} with {len(steps)} steps")
+        logger.info("Generated plan %s with %s steps", plan_id, len(steps))
         return plan
     
     def _generate_base_tool_steps(self, tools: List[Dict[str, Any]], 
@@ -444,6 +444,13 @@ class PlanExecutor:
         
         return None
     
+    def get_ready_steps(self) -> List[PlanningStep]:
+        """Get all pending steps whose dependencies are satisfied; they can run concurrently."""
+        return [
+            step for step in self.plan.steps
+            if step.status == StepStatus.PENDING and self._can_execute_step(step)
+        ]
+    
     def _can_execute_step(self, step: PlanningStep) -> bool:
         """Check if a step can be executed (dependencies satisfied)."""
         for dep_id in step.dependencies:
@@ -464,7 +471,7 @@ class PlanExecutor:
         step.status = StepStatus.IN_PROGRESS
         step.start_time = datetime.now()
         self.execution_log.append(f"Started: {step.name}")
-        logger.info(f"Started step: {step.name}")
+        logger.info("Started step: %s", step.name)
     
     def complete_step(self, step: PlanningStep, version: Optional[str] = None) -> None:
         """Mark a step as completed."""
@@ -473,7 +480,7 @@ class PlanExecutor:
         step.version = version
         self.plan.completed_steps += 1
         self.execution_log.append(f"Completed: {step.name}")
-        logger.info(f"Completed step: {step.name}")
+        logger.info("Completed step: %s", step.name)
     
     def fail_step(self, step: PlanningStep, error: str) -> None:
         """Mark a step as failed."""
@@ -482,7 +489,7 @@ class PlanExecutor:
         step.error_message = error
         self.plan.failed_steps += 1
         self.execution_log.append(f"Failed: {step.name} - {error}")
-        logger.error(f"Failed step: {step.name} - {error}")
+        logger.error("Failed step: %s - %s", step.name, error)
     
     def skip_step(self, step: PlanningStep, reason: str) -> None:
         """Mark a step as skipped."""
@@ -491,7 +498,7 @@ class PlanExecutor:
         step.error_message = f"Skipped: {reason}"
         self.plan.skipped_steps += 1
         self.execution_log.append(f"Skipped: {step.name} - {reason}")
-        logger.info(f"Skipped step: {step.name} - {reason}")
+        logger.info("Skipped step: %s - %s", step.name, reason)
     
     def retry_step(self, step: PlanningStep) -> bool:
         """Retry a failed step if possible."""
@@ -502,7 +509,7 @@ class PlanExecutor:
             step.end_time = None
             step.error_message = None
             self.execution_log.append(f"Retrying: {step.name} (attempt {step.retry_count})")
-            logger.info(f"Retrying step: {step.name} (attempt {step.retry_count})")
+            logger.info("Retrying step: %s (attempt %s)", step.name, step.retry_count)
             return True
         return False
     
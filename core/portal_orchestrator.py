@@ -9,19 +9,74 @@ Handles browser-based logins for AI services and CLI tool installations:
 - Remembers login status per profile
 """
 
+import asyncio
+import atexit
+import importlib.metadata
+import json
 import logging
-import subprocess
+import os
+import shlex
+import shutil
+import signal
+import sys
+import threading
 import webbrowser
 import time
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Set, Tuple, Union
+from dataclasses import dataclass, field
 from pathlib import Path
-from core.memory import AgentMemory
+from core.memory import AgentMemory, dataclass_to_dict
 from core.ai import LLMClient
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Seconds a check command result is reused before the command is run again
+CHECK_CACHE_TTL = 30.0
+
+# Seconds between background saves of changed portal statuses
+STATUS_FLUSH_INTERVAL = 5.0
+
+# Number of trailing install output lines kept for error reporting
+INSTALL_OUTPUT_TAIL = 16
+
+# What `sudo -n` prints when it would have to prompt for a password
+_SUDO_PASSWORD_REQUIRED = "a password is required"
+
+# Orchestrators whose changed statuses the background flusher saves. Held
+# weakly so one dropped without close() can still be collected
+_open_orchestrators: "weakref.WeakSet[PortalOrchestrator]" = weakref.WeakSet()
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+
+def _flush_open_orchestrators() -> None:
+    """Periodically save changed portal statuses of every open orchestrator."""
+    while True:
+        time.sleep(STATUS_FLUSH_INTERVAL)
+        for orchestrator in list(_open_orchestrators):
+            orchestrator._save_portal_statuses()
+
+def _start_flusher() -> None:
+    """Start the shared flush thread if it is not running yet."""
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_flush_open_orchestrators, name="configo-portal-flush", daemon=True
+            )
+            _flusher.start()
+
+@atexit.register
+def _close_open_orchestrators() -> None:
+    """Save and close every orchestrator still open at interpreter exit."""
+    for orchestrator in list(_open_orchestrators):
+        orchestrator.close()
+
+@dataclass(slots=True)
 class PortalStatus:
     """Status of a login portal."""
     name: str
@@ -31,7 +86,7 @@ class PortalStatus:
     last_check: Optional[float] = None
     installation_status: str = "not_installed"  # not_installed, installing, installed, failed
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PortalConfig:
     """Configuration for a login portal."""
     name: str
@@ -40,6 +95,13 @@ class PortalConfig:
     install_command: Optional[str] = None
     check_command: Optional[str] = None
     description: str = ""
+    check_python_pkg: Optional[str] = None
+    check_argv: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    
+    def __post_init__(self):
+        # Pre-split the check command once so probes can exec it without a shell
+        if self.check_command:
+            object.__setattr__(self, "check_argv", tuple(shlex.split(self.check_command)))
 
 class PortalOrchestrator:
     """
@@ -48,7 +110,6 @@ class PortalOrchestrator:
     
     def __init__(self, memory: AgentMemory):
         self.memory = memory
-        self.llm_client = LLMClient()
         
         # Portal configurations
         self.portals = {
@@ -66,7 +127,8 @@ class PortalOrchestrator:
                 cli_tool="gemini",
                 install_command="pip install google-generativeai",
                 check_command="python -c 'import google.generativeai; print(\"Gemini available\")'",
-                description="Google's Gemini AI model"
+                description="Google's Gemini AI model",
+                check_python_pkg="google-generativeai"
             ),
             "grok": PortalConfig(
                 name="Grok",
@@ -74,7 +136,8 @@ class PortalOrchestrator:
                 cli_tool="grok",
                 install_command="pip install grok-sdk",
                 check_command="python -c 'import grok; print(\"Grok available\")'",
-                description="xAI's Grok AI assistant"
+                description="xAI's Grok AI assistant",
+                check_python_pkg="grok-sdk"
             ),
             "chatgpt": PortalConfig(
                 name="ChatGPT",
@@ -82,7 +145,8 @@ class PortalOrchestrator:
                 cli_tool="openai",
                 install_command="pip install openai",
                 check_command="python -c 'import openai; print(\"OpenAI available\")'",
-                description="OpenAI's ChatGPT"
+                description="OpenAI's ChatGPT",
+                check_python_pkg="openai"
             ),
             "cursor": PortalConfig(
                 name="Cursor",
@@ -96,18 +160,57 @@ class PortalOrchestrator:
                 name="GitHub",
                 url="https://github.com",
                 cli_tool="gh",
-                install_command="curl -fsSL https://cli.github.com/packages/githubcli-archive-keyring.gpg | sudo dd of=/usr/share/keyrings/githubcli-archive-keyring.gpg && echo 'deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/githubcli-archive-keyring.gpg] https://cli.github.com/packages stable main' | sudo tee /etc/apt/sources.list.d/github-cli.list > /dev/null && sudo apt update && sudo apt install gh",
+                install_command="curl -fsSL https://cli.github.com/packages/githubcli-archive-keyring.gpg | sudo -n dd of=/usr/share/keyrings/githubcli-archive-keyring.gpg && echo 'deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/githubcli-archive-keyring.gpg] https://cli.github.com/packages stable main' | sudo -n tee /etc/apt/sources.list.d/github-cli.list > /dev/null && sudo -n apt-get update && sudo -n apt-get install -y gh",
                 check_command="gh --version",
                 description="GitHub CLI tool"
             )
         }
         
+        # Guards status bookkeeping, which browser callbacks update from worker threads
+        self._lock = threading.RLock()
+        self._browser_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="configo-browser")
+        
         # Current portal statuses
         self.portal_statuses: Dict[str, PortalStatus] = {}
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._counts = {"installed": 0, "logged_in": 0}
+        self._needs_install: Set[str] = set()
+        self._needs_login: Set[str] = set()
         self._load_portal_statuses()
+        self._status_view = MappingProxyType(self.portal_statuses)
+        
+        # Recent check command results: portal name -> (timestamp, return code)
+        self._check_cache: Dict[str, Tuple[float, int]] = {}
+        
+        # Login checks currently running, shared by concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_async: Dict[str, asyncio.Task] = {}
+        
+        # Portals whose status changed since the last save (write-back cache),
+        # flushed by the shared background thread so mutations never wait on disk
+        self._dirty: Set[str] = set()
+        self._save_lock = threading.Lock()
+        self._closed = False
+        _open_orchestrators.add(self)
+        _start_flusher()
         
         logger.info("Portal orchestrator initialized")
     
+    def close(self) -> None:
+        """Stop background work and save any unsaved portal statuses."""
+        if self._closed:
+            return
+        
+        self._closed = True
+        _open_orchestrators.discard(self)
+        self._browser_pool.shutdown(wait=False)
+        self._save_portal_statuses()
+    
+    @cached_property
+    def llm_client(self) -> LLMClient:
+        """LLM client, created on first use."""
+        return LLMClient()
+    
     def open_login_portal(self, portal_name: str) -> bool:
         """
         Open a login portal in the browser.
@@ -125,27 +228,157 @@ class PortalOrchestrator:
             
             portal_config = self.portals[portal_name]
             
-            # Open browser
+            # Open browser off the caller's thread; webbrowser.open can block
             logger.info(f"🌐 Opening {portal_config.name} login portal...")
-            webbrowser.open(portal_config.url)
-            
-            # Update status
-            self._update_portal_status(portal_name, is_logged_in=False, last_check=time.time())
+            future = self._browser_pool.submit(webbrowser.open, portal_config.url)
+            future.add_done_callback(
+                lambda f: self._on_portal_opened(portal_name, f)
+            )
             
             # Record in memory
             self.memory.record_login_portal_visit(portal_name, portal_config.url)
             
-            logger.info(f"✅ Opened {portal_config.name} login portal")
             return True
             
         except Exception as e:
             logger.error(f"Error opening portal {portal_name}: {e}")
             return False
     
+    def _on_portal_opened(self, portal_name: str, future: Future) -> None:
+        """Record the outcome of a background browser launch."""
+        portal_config = self.portals[portal_name]
+        
+        try:
+            opened = future.result()
+        except Exception as e:
+            logger.error(f"Error opening portal {portal_name}: {e}")
+            opened = False
+        
+        self._update_portal_status(portal_name, is_logged_in=False, last_check=time.time())
+        
+        if opened:
+            logger.info(f"✅ Opened {portal_config.name} login portal")
+        else:
+            logger.warning(f"Could not open a browser for {portal_config.name}: {portal_config.url}")
+    
     def install_cli_tool(self, portal_name: str) -> Tuple[bool, str]:
         """
         Install CLI tool for a portal.
         
+        Runs install_cli_tool_async to completion on a private event loop;
+        coroutines should await that directly.
+        
+        Args:
+            portal_name: Name of the portal
+            
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        return asyncio.run(self.install_cli_tool_async(portal_name))
+    
+    def check_login_status(self, portal_name: str) -> bool:
+        """
+        Check if user is logged in to a portal.
+        
+        Concurrent calls for the same portal share a single check: the first
+        caller runs it and the others wait for its result.
+        
+        Args:
+            portal_name: Name of the portal
+            
+        Returns:
+            bool: True if logged in, False otherwise
+        """
+        with self._lock:
+            inflight = self._inflight.get(portal_name)
+            is_leader = inflight is None
+            if is_leader:
+                inflight = Future()
+                self._inflight[portal_name] = inflight
+        
+        if not is_leader:
+            return inflight.result()
+        
+        is_logged_in = False
+        try:
+            # One implementation for both entry points: run the async check
+            is_logged_in = asyncio.run(self._check_login_status_async(portal_name))
+        finally:
+            with self._lock:
+                del self._inflight[portal_name]
+            inflight.set_result(is_logged_in)
+        
+        return is_logged_in
+    
+    async def check_all_logins(self) -> Dict[str, bool]:
+        """
+        Check login status of every portal concurrently.
+        
+        Each portal's check command runs in its own child process and all
+        probes are awaited together, so the wall-clock cost is that of the
+        slowest probe rather than the sum of all of them.
+        
+        Returns:
+            Dict[str, bool]: Login status keyed by portal name
+        """
+        portal_names = list(self.portals)
+        results = await asyncio.gather(
+            *(self.check_login_status_async(name) for name in portal_names)
+        )
+        
+        return dict(zip(portal_names, results))
+    
+    async def check_login_status_async(self, portal_name: str) -> bool:
+        """
+        Check if user is logged in to a portal without blocking the event loop.
+        
+        Concurrent calls for the same portal await a single shared check.
+        
+        Args:
+            portal_name: Name of the portal
+            
+        Returns:
+            bool: True if logged in, False otherwise
+        """
+        task = self._inflight_async.get(portal_name)
+        if task is None:
+            task = asyncio.ensure_future(self._check_login_status_async(portal_name))
+            self._inflight_async[portal_name] = task
+            
+            def forget(done: asyncio.Task) -> None:
+                if self._inflight_async.get(portal_name) is done:
+                    del self._inflight_async[portal_name]
+            
+            task.add_done_callback(forget)
+        
+        # Shield so one caller being cancelled does not cancel the shared check
+        return await asyncio.shield(task)
+    
+    async def _check_login_status_async(self, portal_name: str) -> bool:
+        """Run a login status check for a portal on the event loop."""
+        try:
+            if portal_name not in self.portals:
+                return False
+            
+            portal_config = self.portals[portal_name]
+            
+            if portal_config.cli_tool and portal_config.check_argv:
+                is_logged_in = await self._probe(portal_name)
+                self._update_portal_status(portal_name, is_logged_in=is_logged_in, last_check=time.time())
+                
+                return is_logged_in
+            
+            # For portals without CLI tools, assume not logged in
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error checking login status for {portal_name}: {e}")
+            return False
+    
+    async def install_cli_tool_async(self, portal_name: str) -> Tuple[bool, str]:
+        """
+        Install CLI tool for a portal without blocking the event loop.
+        
         Args:
             portal_name: Name of the portal
             
@@ -166,18 +399,21 @@ class PortalOrchestrator:
             
             logger.info(f"🔧 Installing {portal_config.name} CLI tool...")
             
-            # Execute install command
-            result = subprocess.run(
+            returncode, stdout, stderr, timed_out = await self._run_with_timeout(
                 portal_config.install_command,
-                shell=True,
-                capture_output=True,
-                text=True,
                 timeout=300  # 5 minutes timeout
             )
             
-            if result.returncode == 0:
+            if timed_out:
+                self._update_portal_status(portal_name, installation_status="failed")
+                return False, "Installation timed out after 5 minutes"
+            
+            if returncode == 0:
+                # Any cached check result predates the install
+                self._check_cache.pop(portal_name, None)
+                
                 # Verify installation
-                if self._verify_cli_installation(portal_name):
+                if not portal_config.check_argv or await self._probe(portal_name):
                     self._update_portal_status(portal_name, installation_status="installed")
                     logger.info(f"✅ {portal_config.name} CLI tool installed successfully")
                     return True, f"{portal_config.name} CLI tool installed successfully"
@@ -186,63 +422,197 @@ class PortalOrchestrator:
                     return False, f"{portal_config.name} CLI tool installed but verification failed"
             else:
                 self._update_portal_status(portal_name, installation_status="failed")
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Installation failed"
+                if _SUDO_PASSWORD_REQUIRED in stderr:
+                    error_msg = "administrator rights are needed; run `sudo -v` and try again"
+                else:
+                    error_msg = stderr.strip() or stdout.strip() or "Installation failed"
                 logger.error(f"❌ {portal_config.name} CLI tool installation failed: {error_msg}")
                 return False, f"Installation failed: {error_msg}"
                 
-        except subprocess.TimeoutExpired:
-            self._update_portal_status(portal_name, installation_status="failed")
-            return False, "Installation timed out after 5 minutes"
+        except asyncio.CancelledError:
+            self._update_portal_status(portal_name, installation_status="not_installed")
+            raise
         except Exception as e:
             self._update_portal_status(portal_name, installation_status="failed")
             return False, f"Installation error: {str(e)}"
     
-    def check_login_status(self, portal_name: str) -> bool:
+    async def install_all(self, portal_names: Optional[List[str]] = None,
+                          fail_fast: bool = True) -> Dict[str, Tuple[Optional[bool], str]]:
         """
-        Check if user is logged in to a portal.
+        Install CLI tools for several portals concurrently.
+        
+        With fail_fast, the first failed installation cancels the ones still
+        running; their child processes are stopped and reaped before this
+        returns.
         
         Args:
-            portal_name: Name of the portal
+            portal_names: Portals to install (defaults to every portal with a CLI tool)
+            fail_fast: Cancel remaining installs after the first failure
             
         Returns:
-            bool: True if logged in, False otherwise
+            Dict[str, Tuple[Optional[bool], str]]: (success, message) keyed by portal
+            name in request order; success is None for cancelled installs
         """
+        if portal_names is None:
+            portal_names = [
+                name for name, config in self.portals.items()
+                if config.cli_tool and config.install_command
+            ]
+        
+        tasks = {
+            name: asyncio.ensure_future(self.install_cli_tool_async(name))
+            for name in portal_names
+        }
+        
         try:
-            if portal_name not in self.portals:
-                return False
-            
-            portal_config = self.portals[portal_name]
-            
-            # For now, we'll use a simple heuristic based on CLI tool availability
-            # In a real implementation, you might check API keys or tokens
-            if portal_config.cli_tool and portal_config.check_command:
-                result = subprocess.run(
-                    portal_config.check_command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=10
+            for next_done in asyncio.as_completed(list(tasks.values())):
+                success, message = await next_done
+                if fail_fast and not success:
+                    logger.error(f"Cancelling remaining installations: {message}")
+                    break
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        results = {}
+        for name, task in tasks.items():
+            if task.cancelled():
+                results[name] = (None, "Cancelled after another installation failed")
+            else:
+                results[name] = task.result()
+        
+        return results
+    
+    async def _probe(self, portal_name: str) -> bool:
+        """Run a portal's check command in a child process without blocking the event loop."""
+        portal_config = self.portals[portal_name]
+        
+        if not portal_config.cli_tool or not portal_config.check_argv:
+            return False
+        
+        cached = self._check_cache.get(portal_name)
+        if cached and time.time() - cached[0] < CHECK_CACHE_TTL:
+            return cached[1] == 0
+        
+        returncode = self._check_without_spawning(portal_config)
+        if returncode is None:
+            try:
+                returncode, _, _, timed_out = await self._run_with_timeout(
+                    portal_config.check_argv, timeout=10
                 )
-                
-                is_logged_in = result.returncode == 0
-                self._update_portal_status(portal_name, is_logged_in=is_logged_in, last_check=time.time())
-                
-                return is_logged_in
+            except FileNotFoundError:
+                returncode, timed_out = 127, False
             
-            # For portals without CLI tools, assume not logged in
-            return False
+            if timed_out:
+                return False
+        
+        self._check_cache[portal_name] = (time.time(), returncode)
+        return returncode == 0
+    
+    async def _run_with_timeout(self, command: Union[str, Sequence[str]],
+                                timeout: float) -> Tuple[Optional[int], str, str, bool]:
+        """
+        Run a command as an asyncio child process with a hard timeout.
+        
+        A string is run through the shell, a sequence is exec'd directly.
+        Output is drained as it arrives and only the last lines are kept.
+        If the wait ends early for any reason (timeout, cancellation, an
+        unreadable output line) the process (and, on POSIX, its whole
+        process group) is terminated, then killed if it does not exit within
+        5 seconds, and always reaped.
+        
+        The command runs in a background process group with no input, so it
+        cannot prompt; commands needing root must use `sudo -n` and fail
+        instead of waiting on a password nobody can type.
+        
+        Args:
+            command: Shell command string or argv sequence
+            timeout: Seconds to wait for the command to finish
             
-        except Exception as e:
-            logger.error(f"Error checking login status for {portal_name}: {e}")
-            return False
+        Returns:
+            Tuple[Optional[int], str, str, bool]: (return code, stdout tail, stderr tail, timed out)
+        """
+        # Own process group so shell grandchildren can be signalled together
+        if os.name != "posix":
+            spawn_options = {}
+        elif sys.version_info >= (3, 11):
+            spawn_options = {"process_group": 0}
+        else:
+            spawn_options = {"preexec_fn": os.setpgrp}
+        
+        if isinstance(command, str):
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **spawn_options
+            )
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **spawn_options
+            )
+        
+        stdout_tail = deque(maxlen=INSTALL_OUTPUT_TAIL)
+        stderr_tail = deque(maxlen=INSTALL_OUTPUT_TAIL)
+        
+        async def drain(stream: asyncio.StreamReader, tail: deque) -> None:
+            async for line in stream:
+                tail.append(line.decode(errors="replace").rstrip())
+        
+        async def communicate() -> None:
+            await asyncio.gather(drain(proc.stdout, stdout_tail), drain(proc.stderr, stderr_tail), proc.wait())
+        
+        timed_out = False
+        try:
+            await asyncio.wait_for(communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            # Never leave the child running or unreaped, whatever ended the wait
+            if proc.returncode is None:
+                await self._stop_process(proc)
+        
+        return proc.returncode, "\n".join(stdout_tail), "\n".join(stderr_tail), timed_out
+    
+    async def _stop_process(self, proc: asyncio.subprocess.Process) -> None:
+        """Terminate a child process, escalating to kill after 5 seconds, and reap it."""
+        def send(kill: bool) -> None:
+            try:
+                if os.name == "posix":
+                    os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+                elif kill:
+                    proc.kill()
+                else:
+                    proc.terminate()
+            except ProcessLookupError:
+                pass
+        
+        send(kill=False)
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            send(kill=True)
+            await proc.wait()
     
     def get_portal_status(self, portal_name: str) -> Optional[PortalStatus]:
         """Get status of a specific portal."""
         return self.portal_statuses.get(portal_name)
     
-    def get_all_portal_statuses(self) -> Dict[str, PortalStatus]:
-        """Get status of all portals."""
-        return self.portal_statuses.copy()
+    def get_all_portal_statuses(self) -> Mapping[str, PortalStatus]:
+        """Get a read-only live view of all portal statuses."""
+        return self._status_view
+    
+    def snapshot_portal_statuses(self) -> Dict[str, PortalStatus]:
+        """Get a mutable copy of all portal statuses."""
+        with self._lock:
+            return self.portal_statuses.copy()
     
     def list_available_portals(self) -> List[PortalConfig]:
         """Get list of available portals."""
@@ -250,111 +620,180 @@ class PortalOrchestrator:
     
     def get_portal_summary(self) -> Dict[str, Any]:
         """Get summary of all portal statuses."""
-        total_portals = len(self.portals)
-        installed_tools = sum(1 for status in self.portal_statuses.values() 
-                            if status.installation_status == "installed")
-        logged_in = sum(1 for status in self.portal_statuses.values() 
-                       if status.is_logged_in)
-        
-        return {
-            "total_portals": total_portals,
-            "installed_cli_tools": installed_tools,
-            "logged_in_portals": logged_in,
-            "installation_rate": (installed_tools / total_portals * 100) if total_portals > 0 else 0,
-            "login_rate": (logged_in / total_portals * 100) if total_portals > 0 else 0
-        }
-    
-    def _verify_cli_installation(self, portal_name: str) -> bool:
-        """Verify that CLI tool was installed correctly."""
-        try:
-            if portal_name not in self.portals:
-                return False
-            
-            portal_config = self.portals[portal_name]
+        if self._summary_cache is None:
+            total_portals = len(self.portals)
+            installed_tools = self._counts["installed"]
+            logged_in = self._counts["logged_in"]
             
-            if not portal_config.check_command:
-                return True  # No check command, assume success
-            
-            result = subprocess.run(
-                portal_config.check_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            return result.returncode == 0
-            
-        except Exception:
-            return False
+            self._summary_cache = {
+                "total_portals": total_portals,
+                "installed_cli_tools": installed_tools,
+                "logged_in_portals": logged_in,
+                "installation_rate": (installed_tools / total_portals * 100) if total_portals > 0 else 0,
+                "login_rate": (logged_in / total_portals * 100) if total_portals > 0 else 0
+            }
+        
+        return dict(self._summary_cache)
     
-    def _update_portal_status(self, portal_name: str, **updates) -> None:
-        """Update portal status."""
-        if portal_name not in self.portal_statuses:
-            portal_config = self.portals[portal_name]
-            self.portal_statuses[portal_name] = PortalStatus(
-                name=portal_config.name,
-                url=portal_config.url,
-                cli_tool=portal_config.cli_tool
-            )
+    def _check_without_spawning(self, portal_config: PortalConfig) -> Optional[int]:
+        """
+        Answer a check in-process when no child process is needed.
+        
+        Python-package portals are checked by looking up their installed
+        distribution metadata, without importing anything, and CLI portals
+        whose binary is not on PATH fail fast.
         
-        status = self.portal_statuses[portal_name]
+        Args:
+            portal_config: Configuration of the portal to check
+            
+        Returns:
+            Optional[int]: Return code equivalent, or None if the check command must run
+        """
+        if portal_config.check_python_pkg:
+            try:
+                importlib.metadata.version(portal_config.check_python_pkg)
+                return 0
+            except importlib.metadata.PackageNotFoundError:
+                return 1
         
-        for key, value in updates.items():
-            if hasattr(status, key):
-                setattr(status, key, value)
+        if shutil.which(portal_config.check_argv[0]) is None:
+            return 127
         
-        self._save_portal_statuses()
+        return None
     
+    def _update_portal_status(self, portal_name: str, **updates) -> None:
+        """Update portal status."""
+        portal_config = self.portals[portal_name]
+        
+        with self._lock:
+            status = self.portal_statuses.get(portal_name)
+            if status is None:
+                status = PortalStatus(
+                    name=portal_config.name,
+                    url=portal_config.url,
+                    cli_tool=portal_config.cli_tool
+                )
+                self.portal_statuses[portal_name] = status
+            
+            was_installed = status.installation_status == "installed"
+            was_logged_in = status.is_logged_in
+            
+            for key, value in updates.items():
+                if hasattr(status, key):
+                    setattr(status, key, value)
+            
+            # Keep summary counters in step with the change
+            is_installed = status.installation_status == "installed"
+            if is_installed != was_installed:
+                self._counts["installed"] += 1 if is_installed else -1
+                self._summary_cache = None
+            if status.is_logged_in != was_logged_in:
+                self._counts["logged_in"] += 1 if status.is_logged_in else -1
+                self._summary_cache = None
+            
+            # Keep recommendation sets in step with the change
+            if status.installation_status == "not_installed" and portal_config.cli_tool:
+                self._needs_install.add(portal_name)
+            else:
+                self._needs_install.discard(portal_name)
+            if status.is_logged_in:
+                self._needs_login.discard(portal_name)
+            else:
+                self._needs_login.add(portal_name)
+            
+            self._dirty.add(portal_name)
+            
     def _load_portal_statuses(self) -> None:
         """Load portal statuses from memory."""
         try:
-            # Load from memory system
-            portal_data = self.memory.get_login_portals_memory()
+            # Whole status snapshot is stored as a single blob
+            blob = self.memory.get_blob("portal_statuses")
+            if blob is not None:
+                portal_data = json.loads(blob)
+            else:
+                # Statuses saved before the blob existed were recorded in
+                # semantic memory; import them once into the blob
+                portal_data = self.memory.get_login_portal_statuses()
+                if portal_data:
+                    self.memory.set_blob("portal_statuses", json.dumps(portal_data))
             
-            for portal_name, data in portal_data.items():
-                if portal_name in self.portals:
-                    portal_config = self.portals[portal_name]
-                    
-                    self.portal_statuses[portal_name] = PortalStatus(
-                        name=portal_config.name,
-                        url=portal_config.url,
-                        cli_tool=portal_config.cli_tool,
-                        is_logged_in=data.get('is_logged_in', False),
-                        last_check=data.get('last_check'),
-                        installation_status=data.get('installation_status', 'not_installed')
-                    )
+            # Key statuses by the interned literals of self.portals rather than
+            # the fresh strings json.loads returns, so the dicts and sets built
+            # from them share one key object per portal
+            for portal_name, portal_config in self.portals.items():
+                data = portal_data.get(portal_name)
+                if data is None:
+                    continue
+                
+                self.portal_statuses[portal_name] = PortalStatus(
+                    name=portal_config.name,
+                    url=portal_config.url,
+                    cli_tool=portal_config.cli_tool,
+                    is_logged_in=data.get('is_logged_in', False),
+                    last_check=data.get('last_check'),
+                    installation_status=data.get('installation_status', 'not_installed')
+                )
                     
         except Exception as e:
             logger.error(f"Error loading portal statuses: {e}")
             self.portal_statuses = {}
+        
+        self._counts = {
+            "installed": sum(1 for status in self.portal_statuses.values()
+                             if status.installation_status == "installed"),
+            "logged_in": sum(1 for status in self.portal_statuses.values()
+                             if status.is_logged_in)
+        }
+        self._summary_cache = None
+        
+        statuses = self.portal_statuses
+        self._needs_install = set()
+        self._needs_login = set()
+        for name, config in self.portals.items():
+            status = statuses.get(name)
+            if config.cli_tool and (status is None or status.installation_status == "not_installed"):
+                self._needs_install.add(name)
+            if status is None or not status.is_logged_in:
+                self._needs_login.add(name)
     
     def _save_portal_statuses(self) -> None:
-        """Save portal statuses to memory."""
-        try:
-            for portal_name, status in self.portal_statuses.items():
-                self.memory.record_login_portal_status(
-                    portal_name,
-                    is_logged_in=status.is_logged_in,
-                    last_check=status.last_check,
-                    installation_status=status.installation_status
-                )
+        """Save portal statuses to memory if any have changed."""
+        if not self._dirty:
+            return
+        
+        # The flush thread and close() may save at once; keep writes in order
+        with self._save_lock:
+            try:
+                with self._lock:
+                    snapshot = {
+                        portal_name: dataclass_to_dict(status)
+                        for portal_name, status in self.portal_statuses.items()
+                    }
+                    saved, self._dirty = self._dirty, set()
                 
-        except Exception as e:
-            logger.error(f"Error saving portal statuses: {e}")
+                # Mark the changes unsaved again if the write fails, so the next
+                # flush retries them
+                written = False
+                try:
+                    written = self.memory.set_blob("portal_statuses", json.dumps(snapshot))
+                finally:
+                    if not written:
+                        with self._lock:
+                            self._dirty |= saved
+                    
+            except Exception as e:
+                logger.error(f"Error saving portal statuses: {e}")
     
     def get_portal_recommendations(self) -> List[str]:
         """Get recommendations for portal setup."""
-        recommendations = []
-        
-        # Check which portals are missing CLI tools
-        for portal_name, status in self.portal_statuses.items():
-            if status.installation_status == "not_installed" and self.portals[portal_name].cli_tool:
-                recommendations.append(f"Install {self.portals[portal_name].name} CLI tool")
-        
-        # Check which portals need login
-        for portal_name, status in self.portal_statuses.items():
-            if not status.is_logged_in:
-                recommendations.append(f"Login to {self.portals[portal_name].name}")
+        # Portals missing CLI tools, then portals that need login
+        recommendations = [
+            f"Install {config.name} CLI tool"
+            for name, config in self.portals.items() if name in self._needs_install
+        ]
+        recommendations.extend(
+            f"Login to {config.name}"
+            for name, config in self.portals.items() if name in self._needs_login
+        )
         
-        return recommendations 
\ No newline at end of file
+        return recommendations
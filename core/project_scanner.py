@@ -9,16 +9,332 @@ Intelligent project detection that scans directories for:
 - Provides context-aware tool recommendations
 """
 
+import fnmatch
+import hashlib
+import json
 import os
+import re
 import logging
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass
-from core.memory import AgentMemory
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, replace
+from core.memory import AgentMemory, dataclass_to_dict
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# TOML manifests (pyproject.toml, Pipfile) need tomllib, Python 3.11+
+try:
+    import tomllib
+    TOML_AVAILABLE = True
+except ImportError:
+    TOML_AVAILABLE = False
+
+# Directories never descended into while scanning (names as bytes, like
+# the directory entries they are compared with)
+_IGNORE_DIRS = frozenset({
+    b'.git', b'__pycache__', b'node_modules', b'.venv', b'venv', b'.pytest_cache', b'.mypy_cache'
+})
+
+# Patterns shared by every project type, matched once rather than per language
+_COMMON_PATTERNS: Dict[str, Dict[str, str]] = {
+    "Dockerfile": {"type": "build", "framework": "docker"},
+    "docker-compose.yml": {"type": "config", "framework": "docker"},
+    "docker-compose.yaml": {"type": "config", "framework": "docker"},
+}
+
+# File patterns for different project types
+_FILE_PATTERNS: Dict[str, Dict[str, Dict[str, str]]] = {
+    # Python
+    "python": {
+        "requirements.txt": {"type": "dependency", "framework": "pip"},
+        "pyproject.toml": {"type": "config", "framework": "poetry"},
+        "Pipfile": {"type": "dependency", "framework": "pipenv"},
+        "setup.py": {"type": "config", "framework": "setuptools"},
+        "poetry.lock": {"type": "dependency", "framework": "poetry"},
+        "Pipfile.lock": {"type": "dependency", "framework": "pipenv"},
+        "*.py": {"type": "source", "language": "python"},
+        ".python-version": {"type": "config", "framework": "pyenv"},
+        "venv/": {"type": "config", "framework": "venv"},
+        ".venv/": {"type": "config", "framework": "venv"},
+    },
+    
+    # JavaScript/Node.js
+    "javascript": {
+        "package.json": {"type": "config", "framework": "npm"},
+        "package-lock.json": {"type": "dependency", "framework": "npm"},
+        "yarn.lock": {"type": "dependency", "framework": "yarn"},
+        "pnpm-lock.yaml": {"type": "dependency", "framework": "pnpm"},
+        "*.js": {"type": "source", "language": "javascript"},
+        "*.ts": {"type": "source", "language": "typescript"},
+        "*.jsx": {"type": "source", "language": "javascript"},
+        "*.tsx": {"type": "source", "language": "typescript"},
+        "next.config.js": {"type": "config", "framework": "nextjs"},
+        "vite.config.js": {"type": "config", "framework": "vite"},
+        "webpack.config.js": {"type": "config", "framework": "webpack"},
+        "tailwind.config.js": {"type": "config", "framework": "tailwind"},
+    },
+    
+    # Go
+    "go": {
+        "go.mod": {"type": "dependency", "framework": "go"},
+        "go.sum": {"type": "dependency", "framework": "go"},
+        "*.go": {"type": "source", "language": "go"},
+    },
+    
+    # Rust
+    "rust": {
+        "Cargo.toml": {"type": "config", "framework": "cargo"},
+        "Cargo.lock": {"type": "dependency", "framework": "cargo"},
+        "*.rs": {"type": "source", "language": "rust"},
+    },
+    
+    # Java
+    "java": {
+        "pom.xml": {"type": "config", "framework": "maven"},
+        "build.gradle": {"type": "config", "framework": "gradle"},
+        "*.java": {"type": "source", "language": "java"},
+        "*.jar": {"type": "build", "framework": "java"},
+    },
+    
+    # PHP
+    "php": {
+        "composer.json": {"type": "config", "framework": "composer"},
+        "composer.lock": {"type": "dependency", "framework": "composer"},
+        "*.php": {"type": "source", "language": "php"},
+    },
+    
+    # General/DevOps
+    "devops": {
+        "kubernetes/": {"type": "config", "framework": "kubernetes"},
+        "k8s/": {"type": "config", "framework": "kubernetes"},
+        "*.yaml": {"type": "config", "framework": "yaml"},
+        "*.yml": {"type": "config", "framework": "yaml"},
+        "terraform/": {"type": "config", "framework": "terraform"},
+        "*.tf": {"type": "config", "framework": "terraform"},
+        ".github/": {"type": "config", "framework": "github"},
+        ".gitlab-ci.yml": {"type": "config", "framework": "gitlab"},
+        "Jenkinsfile": {"type": "config", "framework": "jenkins"},
+    }
+}
+
+# Framework-specific indicators
+_FRAMEWORK_INDICATORS: Dict[str, List[str]] = {
+    "fastapi": ["fastapi", "uvicorn"],
+    "django": ["django", "manage.py"],
+    "flask": ["flask"],
+    "react": ["react", "react-dom"],
+    "vue": ["vue", "@vue"],
+    "angular": ["@angular"],
+    "nextjs": ["next"],
+    "express": ["express"],
+    "spring": ["spring-boot", "spring-core"],
+    "laravel": ["laravel"],
+    "rails": ["rails"],
+    "dotnet": [".csproj", ".sln"],
+}
+
+
+# Project types that can be scored, and frameworks that count towards devops
+_PROJECT_TYPES = frozenset(_FILE_PATTERNS)
+_DEVOPS_FRAMEWORKS = frozenset({"docker", "kubernetes", "terraform"})
+
+# Source files recorded per language; further ones are still counted towards
+# the project type but are not listed or read for framework detection
+MAX_SOURCE_FILES_PER_LANG = 200
+
+# Dependency manifests whose contents name a project's frameworks, with the
+# language each one belongs to
+_MANIFESTS: Dict[str, str] = {
+    "requirements.txt": "python",
+    "pyproject.toml": "python",
+    "Pipfile": "python",
+    "package.json": "javascript",
+    "composer.json": "php",
+    "pom.xml": "java",
+    "build.gradle": "java",
+}
+_MANIFEST_NAMES = frozenset(map(os.fsencode, _MANIFESTS))
+_PYTHON_MANIFESTS = frozenset(name for name, language in _MANIFESTS.items() if language == "python")
+
+# Manifests are small; anything past this is not worth reading
+_MANIFEST_MAX_BYTES = 256 * 1024
+
+# Import statements that identify a Python framework, checked in priority order
+_PYTHON_FRAMEWORK_RE = re.compile(
+    rb'(?P<fastapi>from fastapi import|import fastapi)'
+    rb'|(?P<django>from django|import django)'
+    rb'|(?P<flask>from flask import|import flask)'
+    rb'|(?P<uvicorn>uvicorn\.run\()',
+    re.IGNORECASE
+)
+_PYTHON_FRAMEWORK_PRIORITY = ("fastapi", "django", "flask", "uvicorn")
+
+# Memory blob holding per-file framework detection results
+_PY_FRAMEWORK_CACHE_BLOB = "python_framework_cache"
+
+# Framework imports sit at the top of a module; only this much of each file is read
+_SOURCE_HEAD_BYTES = 4096
+
+# Python files opened together so the kernel can queue their readahead at once
+_READ_BATCH_SIZE = 128
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Below this many files to read, a thread pool costs more than it overlaps
+_PARALLEL_READ_THRESHOLD = 16
+
+
+def _build_pattern_tables(file_patterns: Dict[str, Dict[str, Dict[str, str]]],
+                          common_patterns: Dict[str, Dict[str, str]]):
+    """
+    Split file patterns into lookup tables.
+    
+    Each file can then be matched with a dict lookup plus a single regex
+    instead of testing every pattern. Common patterns are registered once,
+    under the "common" bucket.
+    
+    Names are keyed, and the regex compiled, as bytes so directory entries
+    scanned as bytes can be matched without decoding them.
+    
+    Returns:
+        Tuple of (exact names, directory names, wildcard regex, wildcard
+        group -> (language, info))
+    """
+    exact_names: Dict[bytes, List[Tuple[str, Dict[str, str]]]] = {}
+    dir_names: Dict[bytes, List[Tuple[str, Dict[str, str]]]] = {}
+    wildcard_infos: Dict[str, Tuple[str, Dict[str, str]]] = {}
+    wildcard_alternatives = []
+    
+    for language, patterns in [*file_patterns.items(), ("common", common_patterns)]:
+        for pattern, info in patterns.items():
+            if pattern.endswith('/'):
+                dir_names.setdefault(os.fsencode(pattern[:-1]), []).append((language, info))
+            elif '*' in pattern:
+                group = f"g{len(wildcard_alternatives)}"
+                # Drop the end-of-string anchor; the union is fullmatched
+                wildcard_alternatives.append(f"(?P<{group}>{fnmatch.translate(pattern)[:-2]})")
+                wildcard_infos[group] = (language, info)
+            else:
+                exact_names.setdefault(os.fsencode(pattern), []).append((language, info))
+    
+    wildcard_regex = re.compile("|".join(wildcard_alternatives).encode())
+    return exact_names, dir_names, wildcard_regex, wildcard_infos
+
+
+_EXACT_NAMES, _DIR_NAMES, _WILDCARD_REGEX, _WILDCARD_INFOS = _build_pattern_tables(_FILE_PATTERNS, _COMMON_PATTERNS)
+
+
+def _build_package_frameworks(framework_indicators: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Map package names to the framework each one indicates.
+    
+    Indicators that are file names (manage.py, .csproj) are left out; they
+    never appear as package names in a manifest.
+    """
+    return {
+        indicator.lower(): framework
+        for framework, indicators in framework_indicators.items()
+        for indicator in indicators if '.' not in indicator
+    }
+
+
+_PACKAGE_FRAMEWORKS = _build_package_frameworks(_FRAMEWORK_INDICATORS)
+
+# Distribution name at the start of a PEP 508 requirement ("django>=4.2")
+_REQUIREMENT_NAME_RE = re.compile(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# Java dependencies: <artifactId> in pom.xml, "group:artifact:version" in build.gradle
+_POM_ARTIFACT_RE = re.compile(r'<artifactId>\s*([\w.-]+)\s*</artifactId>')
+_GRADLE_ARTIFACT_RE = re.compile(r'[\'"][\w.-]+:([\w.-]+)(?::[^\'"]*)?[\'"]')
+
+# package.json and composer.json sections that declare dependencies
+_JSON_DEPENDENCY_SECTIONS = (
+    "dependencies", "devDependencies", "peerDependencies", "optionalDependencies",
+    "require", "require-dev",
+)
+
+
+def _requirement_names(requirements: Iterable[str]) -> List[str]:
+    """Extract the package names from PEP 508 requirement strings."""
+    names = []
+    for requirement in requirements:
+        match = _REQUIREMENT_NAME_RE.match(requirement)
+        if match:
+            names.append(match.group(1))
+    return names
+
+
+def _manifest_packages(name: str, content: str) -> List[str]:
+    """
+    List the packages a dependency manifest declares.
+    
+    Only dependency declarations are read, so a framework named in a
+    description, a script or a comment is not mistaken for a dependency.
+    
+    Args:
+        name: File name of the manifest, one of _MANIFESTS
+        content: Text of the manifest
+        
+    Returns:
+        List[str]: Declared package names
+        
+    Raises:
+        ValueError: If the manifest cannot be parsed
+    """
+    if name == "requirements.txt":
+        lines = (line.split('#', 1)[0] for line in content.splitlines())
+        # Option lines (-r, -e, --index-url) name no package
+        return _requirement_names(line for line in lines if not line.lstrip().startswith('-'))
+    
+    if name in ("package.json", "composer.json"):
+        data = json.loads(content)
+        return [
+            package
+            for section in _JSON_DEPENDENCY_SECTIONS
+            for package in (data.get(section) or {})
+        ]
+    
+    if name in ("pyproject.toml", "Pipfile"):
+        if not TOML_AVAILABLE:
+            logger.debug(f"tomllib unavailable; not reading {name}")
+            return []
+        data = tomllib.loads(content)
+        
+        if name == "Pipfile":
+            return [*data.get("packages", {}), *data.get("dev-packages", {})]
+        
+        project = data.get("project", {})
+        packages = _requirement_names(project.get("dependencies", []))
+        for group in project.get("optional-dependencies", {}).values():
+            packages.extend(_requirement_names(group))
+        
+        poetry = data.get("tool", {}).get("poetry", {})
+        packages.extend(poetry.get("dependencies", {}))
+        packages.extend(poetry.get("dev-dependencies", {}))
+        for group in poetry.get("group", {}).values():
+            packages.extend(group.get("dependencies", {}))
+        return packages
+    
+    if name == "pom.xml":
+        return _POM_ARTIFACT_RE.findall(content)
+    
+    if name == "build.gradle":
+        return _GRADLE_ARTIFACT_RE.findall(content)
+    
+    return []
+
+
+def _package_framework(package: str) -> Optional[str]:
+    """Get the framework a package name indicates, if any."""
+    name = package.lower().replace('_', '-')
+    framework = _PACKAGE_FRAMEWORKS.get(name)
+    if framework is None and name.startswith('@'):
+        # Scoped npm packages (@angular/core) are matched by their scope
+        framework = _PACKAGE_FRAMEWORKS.get(name.split('/', 1)[0])
+    return framework
+
+@dataclass(slots=True, frozen=True)
 class ProjectFile:
     """Represents a detected project file."""
     name: str
@@ -27,12 +343,12 @@ class ProjectFile:
     framework: Optional[str] = None
     language: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectAnalysis:
     """Complete project analysis."""
     project_type: str
-    detected_frameworks: List[str]
-    languages: List[str]
+    detected_frameworks: FrozenSet[str]
+    languages: FrozenSet[str]
     files: List[ProjectFile]
     recommendations: List[str]
     confidence: float
@@ -43,110 +359,16 @@ class ProjectScanner:
     Intelligent project scanner that detects project types and recommends tools.
     """
     
-    def __init__(self, memory: AgentMemory):
+    def __init__(self, memory: AgentMemory, max_source_files_per_language: int = MAX_SOURCE_FILES_PER_LANG):
         self.memory = memory
+        self.max_source_files_per_language = max_source_files_per_language
         
-        # File patterns for different project types
-        self.file_patterns = {
-            # Python
-            "python": {
-                "requirements.txt": {"type": "dependency", "framework": "pip"},
-                "pyproject.toml": {"type": "config", "framework": "poetry"},
-                "Pipfile": {"type": "dependency", "framework": "pipenv"},
-                "setup.py": {"type": "config", "framework": "setuptools"},
-                "poetry.lock": {"type": "dependency", "framework": "poetry"},
-                "Pipfile.lock": {"type": "dependency", "framework": "pipenv"},
-                "*.py": {"type": "source", "language": "python"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-                "docker-compose.yml": {"type": "config", "framework": "docker"},
-                ".python-version": {"type": "config", "framework": "pyenv"},
-                "venv/": {"type": "config", "framework": "venv"},
-                ".venv/": {"type": "config", "framework": "venv"},
-            },
-            
-            # JavaScript/Node.js
-            "javascript": {
-                "package.json": {"type": "config", "framework": "npm"},
-                "package-lock.json": {"type": "dependency", "framework": "npm"},
-                "yarn.lock": {"type": "dependency", "framework": "yarn"},
-                "pnpm-lock.yaml": {"type": "dependency", "framework": "pnpm"},
-                "*.js": {"type": "source", "language": "javascript"},
-                "*.ts": {"type": "source", "language": "typescript"},
-                "*.jsx": {"type": "source", "language": "javascript"},
-                "*.tsx": {"type": "source", "language": "typescript"},
-                "next.config.js": {"type": "config", "framework": "nextjs"},
-                "vite.config.js": {"type": "config", "framework": "vite"},
-                "webpack.config.js": {"type": "config", "framework": "webpack"},
-                "tailwind.config.js": {"type": "config", "framework": "tailwind"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-                "docker-compose.yml": {"type": "config", "framework": "docker"},
-            },
-            
-            # Go
-            "go": {
-                "go.mod": {"type": "dependency", "framework": "go"},
-                "go.sum": {"type": "dependency", "framework": "go"},
-                "*.go": {"type": "source", "language": "go"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-            },
-            
-            # Rust
-            "rust": {
-                "Cargo.toml": {"type": "config", "framework": "cargo"},
-                "Cargo.lock": {"type": "dependency", "framework": "cargo"},
-                "*.rs": {"type": "source", "language": "rust"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-            },
-            
-            # Java
-            "java": {
-                "pom.xml": {"type": "config", "framework": "maven"},
-                "build.gradle": {"type": "config", "framework": "gradle"},
-                "*.java": {"type": "source", "language": "java"},
-                "*.jar": {"type": "build", "framework": "java"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-            },
-            
-            # PHP
-            "php": {
-                "composer.json": {"type": "config", "framework": "composer"},
-                "composer.lock": {"type": "dependency", "framework": "composer"},
-                "*.php": {"type": "source", "language": "php"},
-                "Dockerfile": {"type": "build", "framework": "docker"},
-            },
-            
-            # General/DevOps
-            "devops": {
-                "Dockerfile": {"type": "build", "framework": "docker"},
-                "docker-compose.yml": {"type": "config", "framework": "docker"},
-                "docker-compose.yaml": {"type": "config", "framework": "docker"},
-                "kubernetes/": {"type": "config", "framework": "kubernetes"},
-                "k8s/": {"type": "config", "framework": "kubernetes"},
-                "*.yaml": {"type": "config", "framework": "yaml"},
-                "*.yml": {"type": "config", "framework": "yaml"},
-                "terraform/": {"type": "config", "framework": "terraform"},
-                "*.tf": {"type": "config", "framework": "terraform"},
-                ".github/": {"type": "config", "framework": "github"},
-                ".gitlab-ci.yml": {"type": "config", "framework": "gitlab"},
-                "Jenkinsfile": {"type": "config", "framework": "jenkins"},
-            }
-        }
-        
-        # Framework-specific indicators
-        self.framework_indicators = {
-            "fastapi": ["fastapi", "uvicorn"],
-            "django": ["django", "manage.py"],
-            "flask": ["flask"],
-            "react": ["react", "react-dom"],
-            "vue": ["vue", "@vue"],
-            "angular": ["@angular"],
-            "nextjs": ["next"],
-            "express": ["express"],
-            "spring": ["spring-boot", "spring-core"],
-            "laravel": ["laravel"],
-            "rails": ["rails"],
-            "dotnet": [".csproj", ".sln"],
-        }
+        self.file_patterns = _FILE_PATTERNS
+        self.framework_indicators = _FRAMEWORK_INDICATORS
+        
+        # Framework detection results keyed by path: [mtime_ns, size, framework]
+        self._py_framework_cache: Dict[str, List[Any]] = {}
+        self._py_framework_seen: Dict[str, List[Any]] = {}
         
         logger.info("Project scanner initialized")
     
@@ -161,30 +383,36 @@ class ProjectScanner:
             ProjectAnalysis: Complete analysis of the project
         """
         try:
-            project_path = Path(project_path).resolve()
-            if not project_path.exists():
+            # Plain strings throughout: relative paths are sliced off the root
+            project_path = os.path.realpath(project_path)
+            if not os.path.exists(project_path):
                 return self._create_empty_analysis("No project directory found")
             
+            # Reuse the previous analysis while the top level is unchanged
+            cache_key = self._cache_key(project_path)
+            cached = self.memory.get_cached_analysis(project_path, cache_key)
+            if cached:
+                logger.info(f"Using cached project analysis for: {project_path}")
+                return self._analysis_from_dict(cached)
+            
             logger.info(f"Scanning project at: {project_path}")
             
             # Scan for files
-            detected_files = self._scan_files(project_path)
-            
-            # Analyze project type
-            project_type = self._determine_project_type(detected_files)
+            self._load_py_framework_cache()
+            detected_files, uncollected_sources = self._scan_files(project_path)
+            self._save_py_framework_cache()
             
-            # Extract frameworks and languages
-            frameworks = self._extract_frameworks(detected_files)
-            languages = self._extract_languages(detected_files)
+            # Analyze project type, frameworks and languages in one pass
+            project_type, frameworks, languages, file_count = self._analyze(detected_files, uncollected_sources)
             
             # Generate recommendations
             recommendations = self._generate_recommendations(project_type, frameworks, languages)
             
             # Calculate confidence
-            confidence = self._calculate_confidence(detected_files, frameworks)
+            confidence = self._calculate_confidence(file_count, frameworks)
             
             # Create summary
-            summary = self._create_summary(project_type, frameworks, languages, detected_files)
+            summary = self._create_summary(project_type, frameworks, languages, file_count)
             
             analysis = ProjectAnalysis(
                 project_type=project_type,
@@ -196,6 +424,8 @@ class ProjectScanner:
                 summary=summary
             )
             
+            self.memory.set_cached_analysis(project_path, cache_key, dataclass_to_dict(analysis))
+            
             logger.info(f"Project analysis complete: {project_type} ({confidence:.1%} confidence)")
             return analysis
             
@@ -203,132 +433,366 @@ class ProjectScanner:
             logger.error(f"Error scanning project: {e}")
             return self._create_empty_analysis(f"Error scanning project: {e}")
     
-    def _scan_files(self, project_path: Path) -> List[ProjectFile]:
-        """Scan project directory for relevant files."""
+    def _cache_key(self, root: str) -> str:
+        """
+        Fingerprint a project from its root and top-level entries.
+        
+        Hashes the name, mtime and size of the root, every top-level
+        directory that would be descended into, and every top-level file with a
+        known name (requirements.txt, package.json, ...). Adding or removing
+        files in those directories, or editing a manifest, changes the key.
+        
+        Only top-level entries are checked. Editing or adding a file deeper
+        in the tree (src/app/views.py, frontend/package.json) does not update
+        the mtime of the top-level directory. The cached analysis stays in use
+        until something at the top level changes, so it can be stale after
+        nested changes.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        st = os.stat(root)
+        digest.update(f"{root}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        
+        with os.scandir(os.fsencode(root)) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name in _IGNORE_DIRS:
+                        continue
+                elif name not in _EXACT_NAMES:
+                    continue
+                
+                st = entry.stat(follow_symlinks=False)
+                digest.update(name + f"\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        
+        return digest.hexdigest()
+    
+    def _analysis_from_dict(self, data: Dict[str, Any]) -> ProjectAnalysis:
+        """Rebuild a ProjectAnalysis from its cached dictionary form."""
+        return ProjectAnalysis(**{
+            **data,
+            "detected_frameworks": frozenset(data["detected_frameworks"]),
+            "languages": frozenset(data["languages"]),
+            "files": [ProjectFile(**file) for file in data["files"]]
+        })
+    
+    def _scan_files(self, root: str) -> Tuple[List[ProjectFile], Counter]:
+        """
+        Scan project directory for relevant files.
+        
+        Returns:
+            Tuple[List[ProjectFile], Counter]: Detected files, and the number of
+            source files per language left out of them by the per-language cap
+        """
         files = []
+        manifests: List[Tuple[bytes, str, str]] = []
+        seen: Set[Tuple[str, Optional[str]]] = set()
+        source_counts: Counter = Counter()
+        uncollected: Counter = Counter()
+        
+        # Iterative scandir walk: DirEntry type checks reuse the d_type from
+        # the directory listing, so no extra stat() per entry. Paths stay
+        # bytes so entries are matched undecoded; only matches are decoded.
+        base = os.fsencode(root)
+        base_len = len(os.path.join(base, b""))
+        stack = [base]
         
         try:
-            for root, dirs, filenames in os.walk(project_path):
-                # Skip common directories to ignore
-                dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '.pytest_cache', '.mypy_cache'}]
+            while stack:
+                try:
+                    entries = os.scandir(stack.pop())
+                except OSError:
+                    continue
                 
-                for filename in filenames:
-                    file_path = Path(root) / filename
-                    relative_path = file_path.relative_to(project_path)
-                    
-                    # Check against all patterns
-                    for language, patterns in self.file_patterns.items():
-                        for pattern, info in patterns.items():
-                            if self._matches_pattern(filename, pattern):
-                                project_file = ProjectFile(
-                                    name=filename,
-                                    path=str(relative_path),
-                                    type=info["type"],
-                                    framework=info.get("framework"),
-                                    language=info.get("language")
-                                )
-                                files.append(project_file)
-                                break
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        
+                        # Symlinked directories are not dirs here, so the walk
+                        # never follows a link and cannot loop
+                        if entry.is_dir(follow_symlinks=False):
+                            # Record directories that mark a framework (e.g. k8s/, .github/)
+                            for language, info in _DIR_NAMES.get(name, ()):
+                                files.append(self._make_project_file(
+                                    os.fsdecode(name), os.fsdecode(entry.path[base_len:]), info
+                                ))
+                            
+                            if name not in _IGNORE_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        
+                        # At most one match per language: exact names take
+                        # precedence over wildcards
+                        matches = list(_EXACT_NAMES.get(name, ()))
+                        wildcard = _WILDCARD_REGEX.fullmatch(name)
+                        if wildcard:
+                            language, info = _WILDCARD_INFOS[wildcard.lastgroup]
+                            if all(language != matched for matched, _ in matches):
+                                if info["type"] == "source":
+                                    source_counts[language] += 1
+                                
+                                # Past the cap a source file is only counted
+                                if info["type"] == "source" and source_counts[language] > self.max_source_files_per_language:
+                                    uncollected[info.get("language")] += 1
+                                else:
+                                    matches.append((language, info))
+                        
+                        if not matches:
+                            continue
+                        
+                        decoded_name = os.fsdecode(name)
+                        relative_path = os.fsdecode(entry.path[base_len:])
+                        for language, info in matches:
+                            key = (relative_path, info.get("framework"))
+                            if key not in seen:
+                                seen.add(key)
+                                files.append(self._make_project_file(decoded_name, relative_path, info))
                         
-                        # Check for framework-specific files
-                        if language == "python" and filename.endswith('.py'):
-                            # Check for framework indicators in Python files
-                            framework = self._detect_python_framework(file_path)
-                            if framework:
-                                project_file = ProjectFile(
-                                    name=filename,
-                                    path=str(relative_path),
-                                    type="source",
-                                    framework=framework,
-                                    language="python"
-                                )
-                                files.append(project_file)
+                        # Manifests are checked for framework indicators after the walk
+                        if name in _MANIFEST_NAMES:
+                            manifests.append((entry.path, decoded_name, relative_path))
+            
+            python_frameworks_pinned = False
+            for path, name, relative_path in manifests:
+                frameworks = self._detect_manifest_frameworks(path, name)
+                
+                # Nested manifests (docs/, vendored projects) do not speak for the project
+                if name in _PYTHON_MANIFESTS and relative_path == name:
+                    python_frameworks_pinned |= any(
+                        framework in _PYTHON_FRAMEWORK_PRIORITY for framework in frameworks
+                    )
+                
+                for framework in frameworks:
+                    key = (relative_path, framework)
+                    if key not in seen:
+                        seen.add(key)
+                        # No language: a manifest is not a source file and must
+                        # not add to the language scores
+                        files.append(ProjectFile(
+                            name=name,
+                            path=relative_path,
+                            type="dependency",
+                            framework=framework
+                        ))
+            
+            # A root Python manifest that names a framework is authoritative;
+            # otherwise fall back to grepping the sources for framework imports
+            if python_frameworks_pinned:
+                # Keep earlier per-file results for when the manifest goes away
+                self._py_framework_seen = self._py_framework_cache
+            else:
+                self._annotate_frameworks(root, files)
         
         except Exception as e:
             logger.error(f"Error scanning files: {e}")
         
-        return files
-    
-    def _matches_pattern(self, filename: str, pattern: str) -> bool:
-        """Check if filename matches a pattern."""
-        if pattern.endswith('/'):
-            # Directory pattern
-            return filename == pattern[:-1]
-        elif '*' in pattern:
-            # Wildcard pattern
-            import fnmatch
-            return fnmatch.fnmatch(filename, pattern)
-        else:
-            # Exact match
-            return filename == pattern
-    
-    def _detect_python_framework(self, file_path: Path) -> Optional[str]:
-        """Detect Python framework from file content."""
+        return files, uncollected
+    
+    def _annotate_frameworks(self, root: str, files: List[ProjectFile]) -> None:
+        """
+        Tag detected Python source files with the framework they import.
+        
+        Entries are replaced in place rather than duplicated, so each file
+        appears once whether or not a framework was found.
+        
+        Args:
+            root: Absolute path of the scanned project
+            files: Detected project files, updated in place
+        """
+        indexes = [
+            index for index, file in enumerate(files)
+            if file.type == "source" and file.language == "python"
+        ]
+        frameworks = self._detect_python_frameworks([os.path.join(root, files[index].path) for index in indexes])
+        
+        for index, framework in zip(indexes, frameworks):
+            if framework:
+                files[index] = replace(files[index], framework=framework)
+    
+    def _make_project_file(self, name: str, relative_path: str, info: Dict[str, str]) -> ProjectFile:
+        """Build a ProjectFile from a matched pattern's info."""
+        return ProjectFile(
+            name=name,
+            path=relative_path,
+            type=info["type"],
+            framework=info.get("framework"),
+            language=info.get("language")
+        )
+    
+    def _detect_manifest_frameworks(self, path: bytes, name: str) -> List[str]:
+        """
+        Detect the frameworks a dependency manifest depends on.
+        
+        Args:
+            path: Absolute path of the manifest
+            name: File name of the manifest
+            
+        Returns:
+            List[str]: Frameworks of the declared dependencies, in order of declaration
+        """
         try:
-            if file_path.suffix == '.py':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().lower()
-                    
-                    if 'from fastapi import' in content or 'import fastapi' in content:
-                        return 'fastapi'
-                    elif 'from django' in content or 'import django' in content:
-                        return 'django'
-                    elif 'from flask import' in content or 'import flask' in content:
-                        return 'flask'
-                    elif 'uvicorn.run(' in content:
-                        return 'uvicorn'
-        except Exception:
-            pass
+            with open(path, 'rb') as f:
+                content = f.read(_MANIFEST_MAX_BYTES).decode('utf-8', errors='replace')
+            packages = _manifest_packages(name, content)
+        except OSError as e:
+            logger.error(f"Error reading manifest {os.fsdecode(path)}: {e}")
+            return []
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Could not parse manifest {os.fsdecode(path)}: {e}")
+            return []
         
-        return None
+        frameworks = (_package_framework(package) for package in packages)
+        return list(dict.fromkeys(framework for framework in frameworks if framework))
     
-    def _determine_project_type(self, files: List[ProjectFile]) -> str:
-        """Determine the primary project type based on detected files."""
-        type_scores = {
-            "python": 0,
-            "javascript": 0,
-            "go": 0,
-            "rust": 0,
-            "java": 0,
-            "php": 0,
-            "devops": 0
-        }
-        
-        for file in files:
-            if file.language:
-                if file.language in type_scores:
-                    type_scores[file.language] += 1
-            if file.framework:
-                if file.framework in ["docker", "kubernetes", "terraform"]:
-                    type_scores["devops"] += 1
+    def _detect_python_frameworks(self, paths: List[str]) -> List[Optional[str]]:
+        """
+        Detect the framework of each Python file.
         
-        # Find the type with highest score
-        if not any(type_scores.values()):
-            return "unknown"
+        Files unchanged since the last scan reuse their cached result; the
+        rest are read in batches.
+        
+        Args:
+            paths: Absolute paths of Python files
+            
+        Returns:
+            List[Optional[str]]: Detected framework per path, in order
+        """
+        results: List[Optional[str]] = []
+        misses = []
+        
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                results.append(None)
+                continue
+            
+            cached = self._py_framework_cache.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._py_framework_seen[path] = cached
+                results.append(cached[2])
+            else:
+                misses.append((len(results), path, st))
+                results.append(None)
+        
+        if not misses:
+            return results
+        
+        # Reads release the GIL, so a thread pool overlaps them on larger projects
+        pool = None
+        if len(misses) >= _PARALLEL_READ_THRESHOLD:
+            pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
         
-        return max(type_scores, key=type_scores.get)
+        try:
+            for start in range(0, len(misses), _READ_BATCH_SIZE):
+                batch = misses[start:start + _READ_BATCH_SIZE]
+                frameworks = self._detect_batch([path for _, path, _ in batch], pool)
+                for (index, path, st), framework in zip(batch, frameworks):
+                    self._py_framework_seen[path] = [st.st_mtime_ns, st.st_size, framework]
+                    results[index] = framework
+        finally:
+            if pool:
+                pool.shutdown()
+        
+        return results
     
-    def _extract_frameworks(self, files: List[ProjectFile]) -> List[str]:
-        """Extract unique frameworks from detected files."""
-        frameworks = set()
+    def _detect_batch(self, paths: List[str], pool: Optional[Executor] = None) -> List[Optional[str]]:
+        """
+        Detect frameworks for a batch of files opened together.
         
-        for file in files:
-            if file.framework:
-                frameworks.add(file.framework)
+        All files in the batch are opened first and, where supported, the
+        kernel is told they will be needed so their reads are queued in
+        one go rather than issued one blocking read at a time. With a pool,
+        the reads themselves also run concurrently.
+        """
+        fds = []
+        try:
+            for path in paths:
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    fds.append(-1)
+                    continue
+                
+                fds.append(fd)
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, _SOURCE_HEAD_BYTES, os.POSIX_FADV_WILLNEED)
+            
+            def detect(fd: int) -> Optional[str]:
+                return self._detect_python_framework(fd) if fd >= 0 else None
+            
+            if pool:
+                return list(pool.map(detect, fds))
+            return [detect(fd) for fd in fds]
+        finally:
+            for fd in fds:
+                if fd >= 0:
+                    os.close(fd)
+    
+    def _load_py_framework_cache(self) -> None:
+        """Load framework detection results from the previous scan."""
+        try:
+            self._py_framework_cache = json.loads(self.memory.get_blob(_PY_FRAMEWORK_CACHE_BLOB) or "{}")
+        except Exception as e:
+            logger.error(f"Error loading framework cache: {e}")
+            self._py_framework_cache = {}
+        self._py_framework_seen = {}
+    
+    def _save_py_framework_cache(self) -> None:
+        """Persist framework detection results for files seen in this scan."""
+        if self._py_framework_seen != self._py_framework_cache:
+            self.memory.set_blob(_PY_FRAMEWORK_CACHE_BLOB, json.dumps(self._py_framework_seen))
+        self._py_framework_cache = self._py_framework_seen
+    
+    def _detect_python_framework(self, fd: int) -> Optional[str]:
+        """Detect Python framework from the head of an open file."""
+        try:
+            # Search the raw bytes directly, without a decoded copy
+            head = os.read(fd, _SOURCE_HEAD_BYTES)
+            found = {match.lastgroup for match in _PYTHON_FRAMEWORK_RE.finditer(head)}
+            
+            for framework in _PYTHON_FRAMEWORK_PRIORITY:
+                if framework in found:
+                    return framework
+        except Exception:
+            pass
         
-        return list(frameworks)
+        return None
     
-    def _extract_languages(self, files: List[ProjectFile]) -> List[str]:
-        """Extract unique languages from detected files."""
-        languages = set()
+    def _analyze(self, files: List[ProjectFile],
+                 uncollected: Optional[Counter] = None) -> Tuple[str, FrozenSet[str], FrozenSet[str], int]:
+        """
+        Derive project type, frameworks and languages from detected files.
         
-        for file in files:
-            if file.language:
-                languages.add(file.language)
+        Args:
+            files: Detected project files
+            uncollected: Source files per language counted but not listed in files
+            
+        Returns:
+            Tuple[str, FrozenSet[str], FrozenSet[str], int]: (project type,
+            frameworks, languages, number of files)
+        """
+        uncollected = uncollected or Counter()
+        
+        # Counting attributes with map() keeps the per-file loop in C
+        language_counts = Counter(map(attrgetter("language"), files)) + uncollected
+        framework_counts = Counter(map(attrgetter("framework"), files))
+        del language_counts[None], framework_counts[None]
+        
+        type_scores = Counter({
+            language: count for language, count in language_counts.items()
+            if language in _PROJECT_TYPES
+        })
+        devops_score = sum(framework_counts[framework] for framework in _DEVOPS_FRAMEWORKS)
+        if devops_score:
+            type_scores["devops"] = devops_score
+        
+        # Find the type with highest score
+        project_type = type_scores.most_common(1)[0][0] if type_scores else "unknown"
         
-        return list(languages)
+        return (project_type, frozenset(framework_counts), frozenset(language_counts),
+                len(files) + sum(uncollected.values()))
     
-    def _generate_recommendations(self, project_type: str, frameworks: List[str], languages: List[str]) -> List[str]:
+    def _generate_recommendations(self, project_type: str, frameworks: FrozenSet[str], languages: FrozenSet[str]) -> List[str]:
         """Generate tool recommendations based on project analysis."""
         recommendations = []
         
@@ -392,22 +856,22 @@ class ProjectScanner:
             "Postman or Insomnia"
         ])
         
-        return list(set(recommendations))  # Remove duplicates
+        return list(dict.fromkeys(recommendations))  # Remove duplicates, keeping order
     
-    def _calculate_confidence(self, files: List[ProjectFile], frameworks: List[str]) -> float:
+    def _calculate_confidence(self, file_count: int, frameworks: FrozenSet[str]) -> float:
         """Calculate confidence score for the analysis."""
-        if not files:
+        if not file_count:
             return 0.0
         
         # Base confidence from number of detected files
-        base_confidence = min(len(files) / 10.0, 0.8)
+        base_confidence = min(file_count / 10.0, 0.8)
         
         # Boost confidence for specific frameworks
         framework_boost = min(len(frameworks) * 0.1, 0.2)
         
         return min(base_confidence + framework_boost, 1.0)
     
-    def _create_summary(self, project_type: str, frameworks: List[str], languages: List[str], files: List[ProjectFile]) -> str:
+    def _create_summary(self, project_type: str, frameworks: FrozenSet[str], languages: FrozenSet[str], file_count: int) -> str:
         """Create a human-readable summary of the project."""
         if project_type == "unknown":
             return "No clear project type detected. This might be an empty directory or a project with unusual structure."
@@ -415,12 +879,12 @@ class ProjectScanner:
         summary_parts = [f"Detected {project_type.title()} project"]
         
         if frameworks:
-            summary_parts.append(f"using {', '.join(frameworks)}")
+            summary_parts.append(f"using {', '.join(sorted(frameworks))}")
         
         if languages:
-            summary_parts.append(f"with {', '.join(languages)}")
+            summary_parts.append(f"with {', '.join(sorted(languages))}")
         
-        summary_parts.append(f"({len(files)} relevant files found)")
+        summary_parts.append(f"({file_count} relevant files found)")
         
         return " ".join(summary_parts)
     
@@ -428,8 +892,8 @@ class ProjectScanner:
         """Create an empty analysis when scanning fails."""
         return ProjectAnalysis(
             project_type="unknown",
-            detected_frameworks=[],
-            languages=[],
+            detected_frameworks=frozenset(),
+            languages=frozenset(),
             files=[],
             recommendations=["Git", "VS Code"],
             confidence=0.0,
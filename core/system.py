@@ -1,5 +1,6 @@
 import platform
 import shutil
+from functools import lru_cache
 
 try:
     import distro
@@ -7,13 +8,19 @@ except ImportError:
     distro = None
 
 def get_system_info():
+    # Probe once per process; hand out copies so callers can't alter the cache
+    info = _probe_system_info()
+    return {**info, "package_managers": list(info["package_managers"])}
+
+@lru_cache(maxsize=None)
+def _probe_system_info():
     return {
         "os": platform.system(),                 # Linux, Darwin, Windows
         "version": platform.version(),
         "arch": platform.machine(),
         "distro": distro.id() if distro and platform.system() == "Linux" else "",
-        "package_managers": detect_pkg_managers()
+        "package_managers": tuple(detect_pkg_managers())
     }
 
 def detect_pkg_managers():
-    return [cmd for cmd in ["apt", "snap", "flatpak", "brew", "winget", "choco"] if shutil.which(cmd)] 
\ No newline at end of file
+    return [cmd for cmd in ["apt", "snap", "flatpak", "brew", "winget", "choco"] if shutil.which(cmd)]
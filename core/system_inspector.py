@@ -10,36 +10,131 @@ Description: Provides detailed system analysis including OS, architecture, packa
 
 import os
 import sys
+import asyncio
+import functools
 import platform
 import subprocess
-import shutil
 import logging
 import json
-import requests
-from typing import Dict, List, Any, Optional, Tuple
+import copy
+import ctypes
+import re
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 
-# System analysis libraries
-import psutil
-import distro
+# System analysis libraries (distro, psutil, cpuinfo, GPUtil) are imported
+# inside the detectors that use them, so importing this module stays cheap
 
-# Optional GPU detection
-try:
-    import GPUtil
-    GPU_AVAILABLE = True
-except ImportError:
-    GPU_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-# Optional CPU info
+# Rich is only needed for display_system_summary; fall back to plain print
 try:
-    import cpuinfo
-    CPUINFO_AVAILABLE = True
+    from rich.console import Console
+    from rich.table import Table
+    RICH_AVAILABLE = True
 except ImportError:
-    CPUINFO_AVAILABLE = False
+    RICH_AVAILABLE = False
 
-logger = logging.getLogger(__name__)
+# lspci display controller lines from a known GPU vendor, e.g.
+# "01:00.0 VGA compatible controller: NVIDIA Corporation GA102 [GeForce RTX 3080] (rev a1)"
+# Matched against raw bytes, so non-matching lines are never decoded
+_LSPCI_GPU_RE = re.compile(
+    rb'^\S+ (?:VGA|3D|Display)[^:\n]*: '
+    rb'(?:(?P<nvidia>NVIDIA(?: Corporation)?)'
+    rb'|(?P<amd>Advanced Micro Devices(?:, Inc\.)?(?: \[AMD(?:/ATI)?\])?|AMD|ATI Technologies Inc)'
+    rb'|(?P<intel>Intel(?: Corporation)?))'
+    rb' (?P<model>[^\n]+?)(?: \(rev [^)]*\))?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_GPU_VENDOR_LABELS = {'nvidia': 'NVIDIA', 'amd': 'AMD', 'intel': 'Intel'}
+
+# PCI devices in sysfs, and the GPU vendors known by their PCI vendor ID
+_PCI_DEVICES_DIR = '/sys/bus/pci/devices'
+_NVIDIA_PCI_VENDOR = '0x10de'
+_GPU_PCI_VENDORS = {_NVIDIA_PCI_VENDOR: 'NVIDIA', '0x1002': 'AMD', '0x8086': 'Intel'}
+
+# Noise removed from CPU model names: leading "CPU"/"Intel(R)"/"AMD",
+# (R)/(TM) marks, and the "CPU" before the clock speed, e.g.
+# "Intel(R) Core(TM) i7-9700K CPU @ 3.60GHz" -> "Core i7-9700K @ 3.60GHz"
+_CPU_MODEL_NOISE_RE = re.compile(r'^\s*(?:(?:CPU|Intel\(R\)|AMD)\s+)+|\((?:R|TM)\)|\s+CPU(?=\s+@)')
+
+# Saved analyses are reused for this many seconds
+SYSTEM_CACHE_TTL = 3600.0
+_SYSTEM_CACHE_FILE = 'system_intelligence.json'
+
+# Analyses this process has saved or loaded, by memory directory, with the
+# mtime of the file they match; a file rewritten by another run is reread
+_recent_analyses: Dict[str, Tuple[int, 'SystemIntelligence']] = {}
+
+# Warnings are saved next to the analysis as JSON Lines: a header line
+# followed by one warning per line, so they can be read incrementally
+_SYSTEM_WARNINGS_FILE = 'system_warnings.jsonl'
+_WARNINGS_SCHEMA_VERSION = 1
+
+# Groups conventionally granted sudo in sudoers
+_SUDO_GROUPS = frozenset({'sudo', 'wheel', 'admin'})
+
+# Public DNS resolver reached to confirm internet access
+_INTERNET_PROBE_ADDRESS = ('1.1.1.1', 53)
+_INTERNET_PROBE_TIMEOUT = 2.0
+
+# DMI product name substrings that identify a hypervisor, in match order
+_VIRTUALIZATION_MARKERS = (
+    ('VirtualBox', 'VirtualBox'),
+    ('VMware', 'VMware'),
+    ('KVM', 'KVM/QEMU'),
+    ('QEMU', 'KVM/QEMU'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_path(search_path: str) -> Mapping[str, str]:
+    """
+    Map the command names available on a search path to their locations.
+    
+    Each PATH directory is listed once with os.scandir, instead of every
+    shutil.which() call stat()ing every directory for one name. Results
+    are cached per PATH value, so a changed PATH is rescanned.
+    
+    Args:
+        search_path: PATH-style list of directories
+        
+    Returns:
+        Mapping[str, str]: Command name -> absolute path of the first match,
+        in PATH order (read-only, as it is shared between callers)
+    """
+    # On Windows a command is found by name without its PATHEXT extension
+    extensions = ()
+    if os.name == 'nt':
+        extensions = tuple(ext.lower() for ext in os.environ.get('PATHEXT', '.EXE;.BAT;.CMD').split(os.pathsep) if ext)
+    
+    paths: Dict[str, str] = {}
+    for directory in search_path.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Like shutil.which(), skip files the user cannot execute
+                    if entry.is_file() and os.access(entry.path, os.X_OK):
+                        path = os.path.abspath(entry.path)
+                        paths.setdefault(entry.name, path)
+                        if extensions:
+                            stem, ext = os.path.splitext(entry.name)
+                            if ext.lower() in extensions:
+                                paths.setdefault(stem, path)
+        except OSError:
+            continue
+    
+    return MappingProxyType(paths)
 
 
 @dataclass
@@ -60,9 +155,9 @@ class SystemIntelligence:
     arch: str
     shell: str
     
-    # Package managers and tools
+    # Package managers and tools (tool name -> absolute path)
     package_managers: List[str]
-    installed_tools: List[str]
+    installed_tools: Dict[str, str]
     
     # Hardware info
     gpu: Optional[str]
@@ -89,6 +184,99 @@ class SystemIntelligence:
     # Analysis metadata
     analysis_timestamp: datetime
     analysis_duration: float
+    
+    # NVIDIA details, when nvidia-smi reports them
+    gpu_memory_mb: Optional[int] = None
+    gpu_driver: Optional[str] = None
+
+
+def _run_command(argv: List[str], timeout: float) -> Optional[Tuple[int, bytes]]:
+    """
+    Run a probe command quietly.
+    
+    Probes read nothing and their errors are not shown, so stdin and stderr
+    go to the null device: no pipes are set up for them, and messages such
+    as sudo's password prompt never reach the user's terminal.
+    
+    Args:
+        argv: Command and arguments
+        timeout: Seconds to wait for the command
+        
+    Returns:
+        Optional[Tuple[int, bytes]]: (return code, raw stdout), or None if the
+        command is missing, failed to start or timed out
+    """
+    try:
+        result = subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, timeout=timeout, check=False)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug("%s failed: %s", argv[0], e)
+        return None
+    
+    return result.returncode, result.stdout
+
+
+def _run_commands(commands: Dict[str, List[str]], timeout: float) -> Dict[str, Optional[Tuple[int, bytes]]]:
+    """
+    Run several commands concurrently and collect their output.
+    
+    All processes are started before any is waited on, so the total time is
+    that of the slowest command rather than the sum.
+    
+    Args:
+        commands: Argument lists keyed by a name for each command
+        timeout: Seconds to wait for each command
+        
+    Returns:
+        Dict[str, Optional[Tuple[int, bytes]]]: (return code, raw stdout) per
+        name, or None for commands that are missing, failed to start or timed out
+    """
+    async def run(name: str, argv: List[str]) -> Optional[Tuple[int, bytes]]:
+        try:
+            # A session of its own lets a timeout kill any children too,
+            # which would otherwise hold the pipes open
+            process = await asyncio.create_subprocess_exec(
+                *argv, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL, start_new_session=(os.name == 'posix')
+            )
+        except OSError as e:
+            logger.debug("%s not available: %s", name, e)
+            return None
+        
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            logger.debug("%s timed out after %ss", name, timeout)
+            try:
+                if os.name == 'posix':
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            return None
+        
+        return process.returncode, stdout
+    
+    async def run_all() -> List[Optional[Tuple[int, bytes]]]:
+        return await asyncio.gather(*(run(name, argv) for name, argv in commands.items()))
+    
+    return dict(zip(commands, asyncio.run(run_all())))
+
+
+@functools.lru_cache(maxsize=1)
+def _is_wsl() -> bool:
+    """Check if running in WSL; read once, as it cannot change within a process."""
+    try:
+        with open('/proc/version', 'r') as f:
+            version = f.read().lower()
+            return 'microsoft' in version or 'wsl' in version
+    except OSError:
+        return False
+
+
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
 class SystemInspector:
@@ -104,39 +292,72 @@ class SystemInspector:
         """Initialize the system inspector."""
         self.analysis_start = None
         self.warnings = []
+        self._warnings_lock = threading.Lock()
         logger.info("SystemInspector initialized")
     
-    def analyze(self) -> SystemIntelligence:
+    def analyze(self, max_age: float = SYSTEM_CACHE_TTL, memory_dir: str = ".configo_memory",
+                check_sudo: bool = False) -> SystemIntelligence:
         """
         Perform comprehensive system analysis.
         
+        A previous analysis saved in memory is reused while it is younger
+        than max_age and the machine has not rebooted since.
+        
+        Args:
+            max_age: Maximum age in seconds of a reusable analysis; 0 forces a fresh one
+            memory_dir: Memory directory holding the saved analysis
+            check_sudo: Confirm sudo access by running `sudo -n true`, which can
+                block for seconds; otherwise it is inferred from user and groups
+            
         Returns:
             SystemIntelligence: Complete system intelligence data
         """
+        if max_age > 0:
+            cached = self._load_from_memory(memory_dir, max_age)
+            if cached:
+                logger.info("Using cached system analysis")
+                if check_sudo:
+                    cached.has_sudo = self._check_sudo_access()
+                return cached
+        
         self.analysis_start = datetime.now()
+        started = time.perf_counter()
         self.warnings = []
         
         logger.info("Starting comprehensive system analysis...")
         
         try:
-            # Basic system detection
-            os_info = self._detect_os()
-            arch = self._detect_architecture()
-            shell = self._detect_shell()
-            
-            # Package managers and tools
-            package_managers = self._detect_package_managers()
-            installed_tools = self._detect_installed_tools()
+            # Detectors are independent and mostly wait on subprocesses,
+            # files or the network, so they run side by side
+            detectors = {
+                'os': self._detect_os,
+                'package_managers': self._detect_package_managers,
+                'installed_tools': self._detect_installed_tools,
+                'gpu': self._detect_gpu,
+                'ram': self._detect_ram,
+                'cpu': self._detect_cpu,
+                'virtualization': self._detect_virtualization,
+                'has_sudo': self._check_sudo_access if check_sudo else self._infer_sudo_access,
+                'internet': self._check_internet,
+            }
+            results = {}
+            with ThreadPoolExecutor(max_workers=len(detectors)) as pool:
+                futures = {pool.submit(detector): name for name, detector in detectors.items()}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
             
-            # Hardware detection
-            gpu_info = self._detect_gpu()
-            ram_info = self._detect_ram()
-            cpu_info = self._detect_cpu()
+            os_info = results['os']
+            package_managers = results['package_managers']
+            installed_tools = results['installed_tools']
+            gpu_info = results['gpu']
+            ram_info = results['ram']
+            cpu_info = results['cpu']
+            virtualization = results['virtualization']
+            has_sudo = results['has_sudo']
+            internet = results['internet']
             
-            # Environment detection
-            virtualization = self._detect_virtualization()
-            has_sudo = self._check_sudo_access()
-            internet = self._check_internet()
+            arch = self._detect_architecture()
+            shell = self._detect_shell()
             python_version = self._get_python_version()
             
             # Additional metadata
@@ -145,7 +366,7 @@ class SystemInspector:
             system_timezone = self._get_timezone()
             
             # Calculate analysis duration
-            analysis_duration = (datetime.now() - self.analysis_start).total_seconds()
+            analysis_duration = time.perf_counter() - started
             
             # Create system intelligence object
             system_intelligence = SystemIntelligence(
@@ -157,6 +378,8 @@ class SystemInspector:
                 installed_tools=installed_tools,
                 gpu=gpu_info['gpu'],
                 cuda_available=gpu_info['cuda_available'],
+                gpu_memory_mb=gpu_info['gpu_memory_mb'],
+                gpu_driver=gpu_info['gpu_driver'],
                 ram_gb=ram_info['ram_gb'],
                 cpu_model=cpu_info['model'],
                 cpu_cores=cpu_info['cores'],
@@ -173,27 +396,34 @@ class SystemInspector:
                 analysis_duration=analysis_duration
             )
             
-            logger.info(f"System analysis completed in {analysis_duration:.2f}s")
+            logger.info("System analysis completed in %.2fs", analysis_duration)
+            self.save_to_memory(system_intelligence, memory_dir)
             return system_intelligence
             
         except Exception as e:
-            logger.error(f"Error during system analysis: {e}")
+            logger.error("Error during system analysis: %s", e)
             # Return minimal system info on error
             return self._create_fallback_intelligence()
     
+    def _add_warning(self, warning: SystemWarning) -> None:
+        """Record a warning; detectors may call this from worker threads."""
+        with self._warnings_lock:
+            self.warnings.append(warning)
+    
     def _detect_os(self) -> Dict[str, str]:
         """Detect operating system and version."""
         try:
             if platform.system() == "Linux":
                 # Use distro for Linux distribution detection
                 try:
+                    import distro
                     distro_info = distro.info()
                     return {
                         'name': distro_info.get('name', 'Linux'),
                         'version': distro_info.get('version', 'Unknown')
                     }
                 except Exception as distro_error:
-                    logger.warning(f"Distro detection failed: {distro_error}")
+                    logger.warning("Distro detection failed: %s", distro_error)
                     # Fallback to basic Linux detection
                     return {
                         'name': 'Linux',
@@ -219,7 +449,7 @@ class SystemInspector:
                     'version': 'Unknown'
                 }
         except Exception as e:
-            logger.warning(f"Error detecting OS: {e}")
+            logger.warning("Error detecting OS: %s", e)
             return {
                 'name': platform.system(),
                 'version': 'Unknown'
@@ -254,13 +484,14 @@ class SystemInspector:
             'cargo': 'cargo'
         }
         
+        available = self._path_executables()
         for name, command in managers.items():
-            if shutil.which(command):
+            if command in available:
                 package_managers.append(name)
         
         # Check for WSL-specific limitations
         if self._is_wsl() and 'snap' in package_managers:
-            self.warnings.append(SystemWarning(
+            self._add_warning(SystemWarning(
                 level='warning',
                 message='Snap may not work properly in WSL',
                 category='virtualization',
@@ -269,9 +500,14 @@ class SystemInspector:
         
         return package_managers
     
-    def _detect_installed_tools(self) -> List[str]:
-        """Detect commonly installed development tools."""
-        tools = []
+    def _detect_installed_tools(self) -> Dict[str, str]:
+        """
+        Detect commonly installed development tools.
+        
+        Returns:
+            Dict[str, str]: Tool name -> absolute path of its executable
+        """
+        tools = {}
         
         # Common development tools to check
         common_tools = [
@@ -282,110 +518,111 @@ class SystemInspector:
             'go', 'rustc', 'java', 'javac', 'mvn', 'gradle'
         ]
         
+        available = self._path_executables()
         for tool in common_tools:
-            if shutil.which(tool):
-                tools.append(tool)
+            if tool in available:
+                tools[tool] = available[tool]
         
         return tools
     
+    def _path_executables(self) -> Mapping[str, str]:
+        """Get the commands available on the current PATH, with their locations."""
+        return _scan_path(os.environ.get('PATH', os.defpath))
+    
     def _detect_gpu(self) -> Dict[str, Any]:
         """Detect GPU information and CUDA availability with improved accuracy."""
         gpu_info = {
             'gpu': [],
             'cuda_available': False,
+            'gpu_memory_mb': None,
+            'gpu_driver': None,
             'nvidia_smi_available': False,
             'lshw_available': False
         }
         
         try:
-            # Check if nvidia-smi is available
-            try:
-                result = subprocess.run(['which', 'nvidia-smi'], 
-                                     capture_output=True, text=True, timeout=3)
-                gpu_info['nvidia_smi_available'] = result.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            # Probe tool availability from the cached PATH scan, not `which`
+            available = self._path_executables()
+            gpu_info['nvidia_smi_available'] = 'nvidia-smi' in available
+            gpu_info['lshw_available'] = 'lshw' in available
             
-            # Check if lshw is available
-            try:
-                result = subprocess.run(['which', 'lshw'], 
-                                     capture_output=True, text=True, timeout=3)
-                gpu_info['lshw_available'] = result.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            # sysfs lists display controllers by PCI ID without a subprocess;
+            # lspci is then only needed to name them, which nvidia-smi
+            # does for NVIDIA cards
+            devices = self._read_pci_display_devices()
+            if devices is None:
+                need_lspci = True
+            else:
+                need_lspci = any(
+                    vendor != _NVIDIA_PCI_VENDOR or not gpu_info['nvidia_smi_available']
+                    for vendor, _ in devices
+                )
+            
+            # lspci and nvidia-smi are independent, so start them together
+            commands = {}
+            if need_lspci:
+                commands['lspci'] = ['lspci']
+            if gpu_info['nvidia_smi_available']:
+                # One query returns name, memory and driver for every GPU
+                commands['nvidia-smi'] = ['nvidia-smi', '--query-gpu=name,memory.total,driver_version',
+                                          '--format=csv,noheader,nounits']
+            outputs = _run_commands(commands, timeout=5) if commands else {}
             
             # Method 1: Use lspci to detect all GPUs
-            try:
-                result = subprocess.run(['lspci'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    gpu_lines = []
-                    for line in result.stdout.split('\n'):
-                        if any(keyword in line.lower() for keyword in ['vga', '3d', 'display']):
-                            gpu_lines.append(line.strip())
-                    
-                    # Parse GPU information from lspci output
-                    for line in gpu_lines:
-                        if 'nvidia' in line.lower():
-                            # Extract NVIDIA GPU name
-                            gpu_name = self._extract_nvidia_name(line)
-                            if gpu_name:
-                                gpu_info['gpu'].append(f"NVIDIA {gpu_name}")
-                        elif 'amd' in line.lower() or 'radeon' in line.lower():
-                            # Extract AMD GPU name
-                            gpu_name = self._extract_amd_name(line)
-                            if gpu_name:
-                                gpu_info['gpu'].append(f"AMD {gpu_name}")
-                        elif 'intel' in line.lower() and 'graphics' in line.lower():
-                            # Extract Intel GPU name
-                            gpu_name = self._extract_intel_name(line)
-                            if gpu_name:
-                                gpu_info['gpu'].append(f"Intel {gpu_name}")
-            except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                logger.debug(f"lspci not available: {e}")
+            lspci = outputs.get('lspci')
+            if lspci and lspci[0] == 0:
+                # One pass over the whole output finds every display
+                # controller from a known vendor along with its model
+                for match in _LSPCI_GPU_RE.finditer(lspci[1]):
+                    vendor = next(group for group in _GPU_VENDOR_LABELS if match.group(group))
+                    model = match.group('model').decode(errors='replace')
+                    gpu_info['gpu'].append(f"{_GPU_VENDOR_LABELS[vendor]} {model}")
             
             # Method 2: Use nvidia-smi for detailed NVIDIA info
-            if gpu_info['nvidia_smi_available']:
-                try:
-                    result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'],
-                                         capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0 and result.stdout.strip():
-                        nvidia_gpus = result.stdout.strip().split('\n')
-                        # Update or add NVIDIA GPUs
-                        for gpu_name in nvidia_gpus:
-                            if gpu_name.strip():
-                                nvidia_full_name = f"NVIDIA {gpu_name.strip()}"
-                                # Replace if already exists, otherwise add
-                                if not any('NVIDIA' in gpu for gpu in gpu_info['gpu']):
-                                    gpu_info['gpu'].append(nvidia_full_name)
-                                else:
-                                    # Replace the generic NVIDIA entry with specific one
-                                    gpu_info['gpu'] = [gpu for gpu in gpu_info['gpu'] if 'NVIDIA' not in gpu]
-                                    gpu_info['gpu'].append(nvidia_full_name)
-                        gpu_info['cuda_available'] = True
-                except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                    logger.debug(f"nvidia-smi failed: {e}")
+            nvidia_smi = outputs.get('nvidia-smi')
+            if nvidia_smi and nvidia_smi[0] == 0 and nvidia_smi[1].strip():
+                nvidia_gpus = []
+                for line in nvidia_smi[1].decode(errors='replace').strip().split('\n'):
+                    fields = [field.strip() for field in line.split(',')]
+                    if len(fields) != 3 or not fields[0]:
+                        continue
+                    name, memory_mb, driver = fields
+                    nvidia_gpus.append(name if name.startswith('NVIDIA') else f"NVIDIA {name}")
+                    if gpu_info['gpu_memory_mb'] is None and memory_mb.isdigit():
+                        gpu_info['gpu_memory_mb'] = int(memory_mb)
+                    gpu_info['gpu_driver'] = gpu_info['gpu_driver'] or driver
+                
+                # Replace the lspci NVIDIA entries with the specific names
+                if nvidia_gpus:
+                    gpu_info['gpu'] = [gpu for gpu in gpu_info['gpu'] if 'NVIDIA' not in gpu] + nvidia_gpus
+            
+            # Without names from lspci or nvidia-smi, name the sysfs devices
+            # by vendor and PCI ID
+            if not gpu_info['gpu'] and devices:
+                for vendor, device in devices:
+                    label = _GPU_PCI_VENDORS.get(vendor)
+                    if label:
+                        gpu_info['gpu'].append(f"{label} GPU [{vendor[2:]}:{device[2:]}]")
             
             # Method 3: Use lshw for detailed hardware info (if available)
             if gpu_info['lshw_available'] and not gpu_info['gpu']:
-                try:
-                    result = subprocess.run(['lshw', '-C', 'display'], 
-                                         capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        # Parse lshw output for GPU information
-                        gpu_info['gpu'] = self._parse_lshw_gpu_info(result.stdout)
-                except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                    logger.debug(f"lshw failed: {e}")
+                gpu_info['gpu'] = self._detect_lshw_gpus()
             
             # Method 4: Use GPUtil as fallback
-            if not gpu_info['gpu'] and GPU_AVAILABLE:
+            if not gpu_info['gpu']:
                 try:
+                    import GPUtil
                     gpus = GPUtil.getGPUs()
                     if gpus:
                         for gpu in gpus:
                             gpu_info['gpu'].append(f"NVIDIA {gpu.name}")
-                        gpu_info['cuda_available'] = True
                 except Exception as e:
-                    logger.debug(f"GPUtil failed: {e}")
+                    logger.debug("GPUtil failed: %s", e)
+            
+            # A listed GPU does not mean CUDA works (e.g. containers that ship
+            # nvidia-smi without the driver library), so check the driver itself
+            if any('NVIDIA' in gpu for gpu in gpu_info['gpu']):
+                gpu_info['cuda_available'] = self._cuda_driver_available()
             
             # Ensure we have at least one GPU entry or None
             if not gpu_info['gpu']:
@@ -394,81 +631,92 @@ class SystemInspector:
                 gpu_info['gpu'] = gpu_info['gpu'][0]
                     
         except Exception as e:
-            logger.warning(f"Error detecting GPU: {e}")
+            logger.warning("Error detecting GPU: %s", e)
             gpu_info['gpu'] = None
         
         return gpu_info
     
-    def _extract_nvidia_name(self, lspci_line: str) -> Optional[str]:
-        """Extract NVIDIA GPU name from lspci output."""
+    def _read_pci_display_devices(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        List display controllers from sysfs.
+        
+        Returns:
+            Optional[List[Tuple[str, str]]]: (vendor ID, device ID) of each PCI
+            device with a display class (0x03xxxx), or None where sysfs does
+            not list PCI devices
+        """
         try:
-            # Look for common NVIDIA patterns
-            if 'nvidia' in lspci_line.lower():
-                # Extract the model part after NVIDIA Corporation
-                if 'nvidia corporation' in lspci_line.lower():
-                    # Find the GPU model after "NVIDIA Corporation"
-                    parts = lspci_line.split()
-                    for i, part in enumerate(parts):
-                        if part.lower() == 'corporation':
-                            # Get the model name after "Corporation"
-                            model_parts = parts[i+1:]
-                            # Remove common suffixes like "(rev xx)"
-                            model_name = ' '.join(model_parts)
-                            if '(' in model_name:
-                                model_name = model_name.split('(')[0].strip()
-                            return model_name
-                else:
-                    # Fallback: extract after "NVIDIA"
-                    parts = lspci_line.split()
-                    for i, part in enumerate(parts):
-                        if 'nvidia' in part.lower():
-                            model_parts = parts[i+1:i+4]
-                            return ' '.join(model_parts).strip()
-            return None
-        except Exception:
+            device_dirs = os.listdir(_PCI_DEVICES_DIR)
+        except OSError:
             return None
+        
+        devices = []
+        for name in device_dirs:
+            device_dir = os.path.join(_PCI_DEVICES_DIR, name)
+            try:
+                with open(os.path.join(device_dir, 'class'), 'r') as f:
+                    if not f.read().startswith('0x03'):
+                        continue
+                with open(os.path.join(device_dir, 'vendor'), 'r') as f:
+                    vendor = f.read().strip()
+                with open(os.path.join(device_dir, 'device'), 'r') as f:
+                    device = f.read().strip()
+            except OSError:
+                continue
+            devices.append((vendor, device))
+        
+        return devices
     
-    def _extract_amd_name(self, lspci_line: str) -> Optional[str]:
-        """Extract AMD GPU name from lspci output."""
+    def _cuda_driver_available(self) -> bool:
+        """
+        Check that the NVIDIA kernel driver is loaded and the CUDA driver
+        library can be loaded.
+        """
+        system = platform.system()
+        if system == "Linux":
+            if not os.path.exists('/proc/driver/nvidia/version'):
+                return False
+            library = 'libcuda.so.1'
+        elif system == "Windows":
+            library = 'nvcuda.dll'
+        else:
+            return False
+        
         try:
-            if 'amd' in lspci_line.lower() or 'radeon' in lspci_line.lower():
-                # Extract AMD model information
-                parts = lspci_line.split()
-                for i, part in enumerate(parts):
-                    if 'amd' in part.lower() or 'radeon' in part.lower():
-                        model_parts = parts[i+1:i+4]
-                        return ' '.join(model_parts).strip()
-            return None
-        except Exception:
-            return None
+            ctypes.CDLL(library)
+            return True
+        except OSError:
+            return False
     
-    def _extract_intel_name(self, lspci_line: str) -> Optional[str]:
-        """Extract Intel GPU name from lspci output."""
-        try:
-            if 'intel' in lspci_line.lower() and 'graphics' in lspci_line.lower():
-                # Extract Intel graphics model
-                if 'intel corporation' in lspci_line.lower():
-                    # Find the GPU model after "Intel Corporation"
-                    parts = lspci_line.split()
-                    for i, part in enumerate(parts):
-                        if part.lower() == 'corporation':
-                            # Get the model name after "Corporation"
-                            model_parts = parts[i+1:]
-                            # Remove common suffixes like "(rev xx)"
-                            model_name = ' '.join(model_parts)
-                            if '(' in model_name:
-                                model_name = model_name.split('(')[0].strip()
-                            return model_name
-                else:
-                    # Fallback: extract after "Intel"
-                    parts = lspci_line.split()
-                    for i, part in enumerate(parts):
-                        if 'intel' in part.lower():
-                            model_parts = parts[i+1:i+4]
-                            return ' '.join(model_parts).strip()
-            return None
-        except Exception:
-            return None
+    def _detect_lshw_gpus(self) -> List[str]:
+        """
+        List GPUs reported by lshw.
+        
+        Structured JSON output is used where lshw supports it; older builds
+        without -json fall back to parsing the text report.
+        """
+        result = _run_command(['lshw', '-json', '-C', 'display'], timeout=10)
+        if result and result[0] == 0:
+            try:
+                nodes = json.loads(result[1])
+                # A single device may be reported as a bare object
+                if isinstance(nodes, dict):
+                    nodes = [nodes]
+                
+                gpus = []
+                for node in nodes:
+                    vendor = node.get('vendor', '')
+                    product = node.get('product', '')
+                    if product and product != 'UNKNOWN':
+                        gpus.append(f"{vendor} {product}".strip())
+                return gpus
+            except (ValueError, AttributeError) as e:
+                logger.debug("lshw JSON output not usable: %s", e)
+        
+        result = _run_command(['lshw', '-C', 'display'], timeout=10)
+        if result and result[0] == 0:
+            return self._parse_lshw_gpu_info(result[1].decode(errors='replace'))
+        return []
     
     def _parse_lshw_gpu_info(self, lshw_output: str) -> List[str]:
         """Parse lshw output to extract GPU information."""
@@ -494,78 +742,84 @@ class SystemInspector:
             
             return gpus
         except Exception as e:
-            logger.debug(f"Error parsing lshw output: {e}")
+            logger.debug("Error parsing lshw output: %s", e)
             return []
     
     def _detect_ram(self) -> Dict[str, int]:
         """Detect RAM information."""
         try:
-            ram_bytes = psutil.virtual_memory().total
+            if platform.system() == "Linux":
+                ram_bytes = self._read_mem_total()
+            else:
+                import psutil
+                ram_bytes = psutil.virtual_memory().total
             ram_gb = round(ram_bytes / (1024**3), 1)
             return {'ram_gb': ram_gb}
         except Exception as e:
-            logger.warning(f"Error detecting RAM: {e}")
+            logger.warning("Error detecting RAM: %s", e)
             return {'ram_gb': 0}
     
     def _detect_cpu(self) -> Dict[str, Any]:
         """Detect CPU information with improved accuracy."""
         try:
-            # Get physical and logical core counts
-            cpu_cores_physical = psutil.cpu_count(logical=False)
-            cpu_cores_logical = psutil.cpu_count(logical=True)
-            
             # Get CPU model with multiple fallback methods
             cpu_model = "Unknown"
+            # CPUs this process may run on, which respects cpusets and
+            # container limits; os.cpu_count() reports the whole host
+            if hasattr(os, 'sched_getaffinity'):
+                cpu_cores_logical = len(os.sched_getaffinity(0))
+            else:
+                cpu_cores_logical = os.cpu_count() or 0
+            cpu_cores_physical = 0
             
-            # Method 1: Use cpuinfo for detailed brand information
-            if CPUINFO_AVAILABLE:
+            if platform.system() == "Linux":
+                # Method 1: Parse /proc/cpuinfo on Linux
                 try:
+                    model_name, cpu_cores_physical = self._read_proc_cpuinfo()
+                    if model_name:
+                        cpu_model = model_name
+                except Exception as e:
+                    logger.debug("/proc/cpuinfo failed: %s", e)
+            else:
+                # Method 2: Use psutil and cpuinfo elsewhere
+                try:
+                    import psutil
+                    cpu_cores_physical = psutil.cpu_count(logical=False) or 0
+                except Exception as e:
+                    logger.debug("psutil failed: %s", e)
+                
+                try:
+                    import cpuinfo
                     cpu_info = cpuinfo.get_cpu_info()
                     if cpu_info.get('brand_raw'):
                         cpu_model = cpu_info['brand_raw']
                 except Exception as e:
-                    logger.debug(f"cpuinfo failed: {e}")
+                    logger.debug("cpuinfo failed: %s", e)
             
-            # Method 2: Use /proc/cpuinfo on Linux
+            # Without core IDs (e.g. some ARM kernels) count each thread as a
+            # core; never report more cores than usable threads
+            if not cpu_cores_physical or cpu_cores_physical > cpu_cores_logical:
+                cpu_cores_physical = cpu_cores_logical
+            
+            # Method 3: Use lscpu on Linux only when /proc/cpuinfo had no model
             if cpu_model == "Unknown" and platform.system() == "Linux":
-                try:
-                    with open('/proc/cpuinfo', 'r') as f:
-                        cpuinfo_content = f.read()
-                        for line in cpuinfo_content.split('\n'):
-                            if line.startswith('model name'):
-                                cpu_model = line.split(':')[1].strip()
-                                break
-                except Exception as e:
-                    logger.debug(f"/proc/cpuinfo failed: {e}")
+                result = _run_command(['lscpu'], timeout=5)
+                if result and result[0] == 0:
+                    for line in result[1].decode(errors='replace').split('\n'):
+                        if 'Model name:' in line:
+                            model_name = line.split(':')[1].strip()
+                            if model_name and model_name != "Unknown":
+                                cpu_model = model_name
+                            break
             
-            # Method 3: Use platform.processor() as fallback
+            # Method 4: Use platform.processor() as fallback
             if cpu_model == "Unknown":
                 cpu_model = platform.processor()
             
-            # Method 4: Use lscpu on Linux for additional info
-            if platform.system() == "Linux":
-                try:
-                    result = subprocess.run(['lscpu'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        for line in result.stdout.split('\n'):
-                            if 'Model name:' in line:
-                                model_name = line.split(':')[1].strip()
-                                if model_name and model_name != "Unknown":
-                                    cpu_model = model_name
-                                break
-                except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                    logger.debug(f"lscpu failed: {e}")
-            
             # Clean up CPU model name
             if cpu_model and cpu_model != "Unknown":
-                # Remove extra whitespace and common prefixes
-                cpu_model = cpu_model.strip()
-                if cpu_model.startswith('CPU '):
-                    cpu_model = cpu_model[4:]
-                if cpu_model.startswith('Intel(R) '):
-                    cpu_model = cpu_model[9:]
-                if cpu_model.startswith('AMD '):
-                    cpu_model = cpu_model[4:]
+                # Remove vendor prefixes and trademark marks, then extra whitespace
+                cpu_model = ' '.join(_CPU_MODEL_NOISE_RE.sub('', cpu_model).split())
             
             return {
                 'model': cpu_model,
@@ -573,13 +827,50 @@ class SystemInspector:
                 'threads': cpu_cores_logical
             }
         except Exception as e:
-            logger.warning(f"Error detecting CPU: {e}")
+            logger.warning("Error detecting CPU: %s", e)
             return {
                 'model': 'Unknown',
                 'cores': 0,
                 'threads': 0
             }
     
+    def _read_mem_total(self) -> int:
+        """Read total RAM in bytes from /proc/meminfo."""
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    # Reported in kB
+                    return int(line.split()[1]) * 1024
+        raise ValueError("MemTotal not found in /proc/meminfo")
+    
+    def _read_proc_cpuinfo(self) -> Tuple[Optional[str], int]:
+        """
+        Read the CPU model and physical core count from /proc/cpuinfo.
+        
+        Physical cores are the distinct (physical id, core id) pairs across
+        all logical CPUs.
+        
+        Returns:
+            Tuple[Optional[str], int]: Model name (None if not listed) and
+            physical core count (0 if core IDs are not listed)
+        """
+        model_name = None
+        physical_id = None
+        cores = set()
+        
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                key = key.strip()
+                if key == 'model name' and model_name is None:
+                    model_name = value.strip()
+                elif key == 'physical id':
+                    physical_id = value.strip()
+                elif key == 'core id':
+                    cores.add((physical_id, value.strip()))
+        
+        return model_name, len(cores)
+    
     def _detect_virtualization(self) -> str:
         """Detect virtualization environment."""
         try:
@@ -591,73 +882,87 @@ class SystemInspector:
             if os.path.exists('/.dockerenv'):
                 return "Docker"
             
-            # Check for VirtualBox
-            try:
-                result = subprocess.run(['dmidecode', '-s', 'system-product-name'],
-                                     capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and 'VirtualBox' in result.stdout:
-                    return "VirtualBox"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-            
-            # Check for VMware
-            try:
-                result = subprocess.run(['dmidecode', '-s', 'system-product-name'],
-                                     capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and 'VMware' in result.stdout:
-                    return "VMware"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-            
-            # Check for KVM/QEMU
-            try:
-                result = subprocess.run(['dmidecode', '-s', 'system-product-name'],
-                                     capture_output=True, text=True, timeout=5)
-                if result.returncode == 0 and ('KVM' in result.stdout or 'QEMU' in result.stdout):
-                    return "KVM/QEMU"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+            # Hypervisors are identified by the DMI product name
+            product_name = self._get_product_name()
+            for marker, label in _VIRTUALIZATION_MARKERS:
+                if marker in product_name:
+                    return label
             
             return "None"
             
         except Exception as e:
-            logger.warning(f"Error detecting virtualization: {e}")
+            logger.warning("Error detecting virtualization: %s", e)
             return "Unknown"
     
+    def _get_product_name(self) -> str:
+        """
+        Get the DMI system product name.
+        
+        sysfs exposes it without a subprocess or root; dmidecode is only
+        run where that file is missing.
+        """
+        try:
+            with open('/sys/class/dmi/id/product_name', 'r') as f:
+                return f.read().strip()
+        except OSError:
+            pass
+        
+        result = _run_command(['dmidecode', '-s', 'system-product-name'], timeout=5)
+        if result and result[0] == 0:
+            return result[1].decode(errors='replace').strip()
+        
+        return ""
+    
     def _is_wsl(self) -> bool:
         """Check if running in WSL."""
-        try:
-            with open('/proc/version', 'r') as f:
-                version = f.read()
-                return 'microsoft' in version.lower() or 'wsl' in version.lower()
-        except:
-            return False
+        return _is_wsl()
     
     def _check_sudo_access(self) -> bool:
         """Check if user has sudo access."""
-        try:
-            result = subprocess.run(['sudo', '-n', 'true'], 
-                                 capture_output=True, timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        result = _run_command(['sudo', '-n', 'true'], timeout=5)
+        return bool(result) and result[0] == 0
+    
+    def _infer_sudo_access(self) -> bool:
+        """
+        Infer sudo access without running sudo.
+        
+        Root, or membership of a group that sudoers conventionally grants
+        (sudo, wheel, admin), is taken to mean sudo access.
+        """
+        if not hasattr(os, 'geteuid'):
             return False
+        if os.geteuid() == 0:
+            return True
+        
+        import grp
+        for gid in os.getgroups():
+            try:
+                if grp.getgrgid(gid).gr_name in _SUDO_GROUPS:
+                    return True
+            except KeyError:
+                continue
+        return False
     
     def _check_internet(self) -> bool:
-        """Check internet connectivity."""
+        """
+        Check internet connectivity.
+        
+        Opening a TCP connection to a public DNS resolver takes a single
+        round trip, with no DNS lookup, TLS handshake or HTTP request.
+        """
         try:
-            response = requests.get('https://httpbin.org/get', timeout=5)
-            return response.status_code == 200
-        except:
+            with socket.create_connection(_INTERNET_PROBE_ADDRESS, timeout=_INTERNET_PROBE_TIMEOUT):
+                return True
+        except OSError:
             return False
     
     def _get_python_version(self) -> str:
         """Get Python version."""
-        return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        return _PYTHON_VERSION
     
     def _get_timezone(self) -> str:
         """Get system timezone."""
         try:
-            import time
             return time.tzname[time.daylight]
         except:
             return "UTC"
@@ -670,7 +975,7 @@ class SystemInspector:
             arch=platform.machine(),
             shell=os.environ.get('SHELL', 'unknown'),
             package_managers=[],
-            installed_tools=[],
+            installed_tools={},
             gpu=None,
             cuda_available=False,
             ram_gb=0,
@@ -703,34 +1008,14 @@ class SystemInspector:
         Returns:
             List[str]: List of installation recommendations
         """
-        recommendations = []
-        
-        # Package manager recommendations
-        if 'apt' in system_info.package_managers:
-            recommendations.append("Use apt for system packages")
-        if 'snap' in system_info.package_managers and system_info.virtualization != "WSL":
-            recommendations.append("Use snap for containerized applications")
-        if 'flatpak' in system_info.package_managers:
-            recommendations.append("Use flatpak for sandboxed applications")
-        
-        # GPU-specific recommendations
-        if system_info.gpu and "NVIDIA" in system_info.gpu:
-            if system_info.cuda_available:
-                recommendations.append("CUDA available - use GPU-accelerated AI tools")
-            else:
-                recommendations.append("NVIDIA GPU detected but CUDA not available")
-        
-        # Virtualization warnings
-        if system_info.virtualization == "WSL":
-            recommendations.append("WSL detected - some tools may have limitations")
-        
-        # Performance recommendations
-        if system_info.ram_gb < 8:
-            recommendations.append("Low RAM detected - consider lightweight tools")
-        if system_info.cpu_cores < 4:
-            recommendations.append("Limited CPU cores - avoid resource-intensive tools")
-        
-        return recommendations
+        return list(_installation_recommendations(
+            tuple(system_info.package_managers),
+            str(system_info.gpu or ""),
+            system_info.cuda_available,
+            system_info.virtualization,
+            system_info.ram_gb,
+            system_info.cpu_cores,
+        ))
     
     def save_to_memory(self, system_info: SystemIntelligence, memory_dir: str = ".configo_memory") -> None:
         """
@@ -754,6 +1039,8 @@ class SystemInspector:
                 'installed_tools': system_info.installed_tools,
                 'gpu': system_info.gpu,
                 'cuda_available': system_info.cuda_available,
+                'gpu_memory_mb': system_info.gpu_memory_mb,
+                'gpu_driver': system_info.gpu_driver,
                 'ram_gb': system_info.ram_gb,
                 'cpu_model': system_info.cpu_model,
                 'cpu_cores': system_info.cpu_cores,
@@ -765,27 +1052,211 @@ class SystemInspector:
                 'user_home': system_info.user_home,
                 'temp_dir': system_info.temp_dir,
                 'system_timezone': system_info.system_timezone,
-                'warnings': [
-                    {
+                'warning_count': len(system_info.warnings),
+                'analysis_timestamp': system_info.analysis_timestamp.isoformat(),
+                'analysis_duration': system_info.analysis_duration
+            }
+            
+            # Identify the boot the analysis belongs to; hardware and
+            # drivers can change across reboots
+            system_dict['boot_id'] = _get_boot_id()
+            system_dict['kernel'] = platform.release()
+            
+            # Write temporary files and rename them so readers never see a
+            # partial file; warnings go first so a saved analysis always has them
+            warnings_file = memory_path / _SYSTEM_WARNINGS_FILE
+            temp_file = warnings_file.with_suffix('.tmp')
+            header = {
+                'schema': _WARNINGS_SCHEMA_VERSION,
+                'analysis_timestamp': system_dict['analysis_timestamp']
+            }
+            with open(temp_file, 'w', encoding='utf-8', buffering=65536) as f:
+                f.write(json.dumps(header) + '\n')
+                f.writelines(
+                    json.dumps({
                         'level': w.level,
                         'message': w.message,
                         'category': w.category,
                         'recommendation': w.recommendation
-                    } for w in system_info.warnings
-                ],
-                'analysis_timestamp': system_info.analysis_timestamp.isoformat(),
-                'analysis_duration': system_info.analysis_duration
-            }
+                    }) + '\n'
+                    for w in system_info.warnings
+                )
+            os.replace(temp_file, warnings_file)
             
-            # Save to file
-            system_file = memory_path / 'system_intelligence.json'
-            with open(system_file, 'w') as f:
-                json.dump(system_dict, f, indent=2)
+            # Serialize in one pass and hand the encoded document to a single
+            # buffered write instead of many small writes from json.dump
+            system_file = memory_path / _SYSTEM_CACHE_FILE
+            temp_file = system_file.with_suffix('.tmp')
+            payload = json.dumps(system_dict, indent=2).encode('utf-8')
+            with open(temp_file, 'wb', buffering=65536) as f:
+                f.write(payload)
+            os.replace(temp_file, system_file)
+            _recent_analyses[memory_dir] = (system_file.stat().st_mtime_ns, copy.deepcopy(system_info))
             
-            logger.info(f"System intelligence saved to {system_file}")
+            logger.info("System intelligence saved to %s", system_file)
             
         except Exception as e:
-            logger.error(f"Error saving system intelligence: {e}")
+            logger.error("Error saving system intelligence: %s", e)
+
+    def _load_from_memory(self, memory_dir: str, max_age: float) -> Optional[SystemIntelligence]:
+        """
+        Load a saved analysis if it is still valid.
+        
+        Args:
+            memory_dir: Memory directory path
+            max_age: Maximum age in seconds of a reusable analysis
+            
+        Returns:
+            Optional[SystemIntelligence]: The saved analysis, or None if it is
+            missing, too old or from a different boot
+        """
+        try:
+            system_file = Path(memory_dir) / _SYSTEM_CACHE_FILE
+            mtime = system_file.stat().st_mtime_ns
+            
+            # Skip parsing when this process already has the saved analysis;
+            # hand out deep copies so callers cannot change the shared one,
+            # including its tool map and warning list
+            recent = _recent_analyses.get(memory_dir)
+            if recent and recent[0] == mtime:
+                age = (datetime.now() - recent[1].analysis_timestamp).total_seconds()
+                return copy.deepcopy(recent[1]) if 0 <= age <= max_age else None
+            
+            with open(system_file, 'r') as f:
+                system_dict = json.load(f)
+            
+            if system_dict.pop('boot_id', None) != _get_boot_id():
+                return None
+            if system_dict.pop('kernel', None) != platform.release():
+                return None
+            # Analyses saved before tools carried their paths listed names only
+            if not isinstance(system_dict.get('installed_tools'), dict):
+                return None
+            
+            analysis_timestamp = datetime.fromisoformat(system_dict['analysis_timestamp'])
+            age = (datetime.now() - analysis_timestamp).total_seconds()
+            if not 0 <= age <= max_age:
+                return None
+            
+            # The warnings file must belong to this analysis and be complete
+            warning_count = system_dict.pop('warning_count')
+            warnings = list(_iter_saved_warnings(Path(memory_dir) / _SYSTEM_WARNINGS_FILE,
+                                                 system_dict['analysis_timestamp']))
+            if len(warnings) != warning_count:
+                return None
+            
+            system_info = SystemIntelligence(**{
+                **system_dict,
+                'warnings': warnings,
+                'analysis_timestamp': analysis_timestamp
+            })
+            _recent_analyses[memory_dir] = (mtime, system_info)
+            return copy.deepcopy(system_info)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring saved system intelligence: %s", e)
+            return None
+
+
+def _iter_saved_warnings(path: Path, analysis_timestamp: str) -> Iterator[SystemWarning]:
+    """
+    Read saved warnings one line at a time.
+    
+    Args:
+        path: Path of the warnings JSON Lines file
+        analysis_timestamp: Timestamp of the analysis the warnings must belong to
+        
+    Yields:
+        SystemWarning: Each saved warning, in order
+        
+    Raises:
+        ValueError: If the file has an unknown schema or belongs to another analysis
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if header.get('schema') != _WARNINGS_SCHEMA_VERSION:
+            raise ValueError(f"unsupported warnings schema {header.get('schema')!r}")
+        if header.get('analysis_timestamp') != analysis_timestamp:
+            raise ValueError("warnings belong to a different analysis")
+        for line in f:
+            yield SystemWarning(**json.loads(line))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_boot_id() -> str:
+    """Get the kernel's boot ID, or an empty string where there is none."""
+    try:
+        with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+@functools.lru_cache(maxsize=32)
+def _installation_recommendations(package_managers: Tuple[str, ...], gpu: str,
+                                  cuda_available: bool, virtualization: str,
+                                  ram_gb: float, cpu_cores: int) -> Tuple[str, ...]:
+    """
+    Build installation recommendations from the system facts they depend on.
+    
+    Keyed on those facts alone, so repeated summaries of the same analysis
+    reuse the result.
+    
+    Returns:
+        Tuple[str, ...]: Installation recommendations
+    """
+    recommendations = []
+    
+    # Package manager recommendations
+    if 'apt' in package_managers:
+        recommendations.append("Use apt for system packages")
+    if 'snap' in package_managers and virtualization != "WSL":
+        recommendations.append("Use snap for containerized applications")
+    if 'flatpak' in package_managers:
+        recommendations.append("Use flatpak for sandboxed applications")
+    
+    # GPU-specific recommendations
+    if "NVIDIA" in gpu:
+        if cuda_available:
+            recommendations.append("CUDA available - use GPU-accelerated AI tools")
+        else:
+            recommendations.append("NVIDIA GPU detected but CUDA not available")
+    
+    # Virtualization warnings
+    if virtualization == "WSL":
+        recommendations.append("WSL detected - some tools may have limitations")
+    
+    # Performance recommendations
+    if ram_gb < 8:
+        recommendations.append("Low RAM detected - consider lightweight tools")
+    if cpu_cores < 4:
+        recommendations.append("Limited CPU cores - avoid resource-intensive tools")
+    
+    return tuple(recommendations)
+
+
+def invalidate_system_cache(memory_dir: str = ".configo_memory") -> None:
+    """
+    Discard the saved analysis after CONFIGO has changed the system.
+    
+    A saved analysis is otherwise reused for up to SYSTEM_CACHE_TTL, so
+    tools CONFIGO just installed would be missing from installed_tools and
+    a changed network state would not show. The next analyze() runs a
+    fresh analysis and PATH is rescanned.
+    
+    Args:
+        memory_dir: Memory directory holding the saved analysis
+    """
+    _recent_analyses.pop(memory_dir, None)
+    _scan_path.cache_clear()
+    
+    try:
+        os.remove(Path(memory_dir) / _SYSTEM_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not discard saved system intelligence: %s", e)
 
 
 def display_system_summary(system_info: SystemIntelligence) -> None:
@@ -795,13 +1266,7 @@ def display_system_summary(system_info: SystemIntelligence) -> None:
     Args:
         system_info: System intelligence data to display
     """
-    try:
-        from rich.console import Console
-        from rich.table import Table
-        from rich.panel import Panel
-        from rich.text import Text
-        from rich.columns import Columns
-        
+    if RICH_AVAILABLE:
         console = Console()
         
         # Create main table
@@ -809,20 +1274,14 @@ def display_system_summary(system_info: SystemIntelligence) -> None:
         table.add_column("Category", style="cyan", no_wrap=True)
         table.add_column("Value", style="white")
         
-        # Basic system info
-        table.add_row("🖥️  OS", f"{system_info.os_name} {system_info.os_version}")
-        table.add_row("🧠 Architecture", system_info.arch)
-        table.add_row("💻 Shell", system_info.shell)
-        
         # Package managers
         pm_text = ", ".join(system_info.package_managers) if system_info.package_managers else "None detected"
-        table.add_row("🔧 Package Mgrs", pm_text)
         
         # Installed tools (show first 5)
-        tools_text = ", ".join(system_info.installed_tools[:5])
-        if len(system_info.installed_tools) > 5:
-            tools_text += f" (+{len(system_info.installed_tools) - 5} more)"
-        table.add_row("📦 Tools Found", tools_text)
+        tool_count = len(system_info.installed_tools)
+        tools_text = ", ".join(list(system_info.installed_tools)[:5])
+        if tool_count > 5:
+            tools_text = f"{tools_text} (+{tool_count - 5} more)"
         
         # GPU info
         if isinstance(system_info.gpu, list):
@@ -830,49 +1289,60 @@ def display_system_summary(system_info: SystemIntelligence) -> None:
         else:
             gpu_text = system_info.gpu or "None detected"
         
-        if system_info.gpu and "NVIDIA" in str(system_info.gpu):
+        if "NVIDIA" in gpu_text:
             cuda_status = "✅" if system_info.cuda_available else "❌"
-            gpu_text += f" (CUDA: {cuda_status})"
-        table.add_row("🎮 GPU", gpu_text)
-        
-        # Hardware info
-        table.add_row("💾 RAM", f"{system_info.ram_gb} GB")
-        table.add_row("🖥️  CPU", f"{system_info.cpu_model} ({system_info.cpu_cores} cores, {system_info.cpu_threads} threads)")
-        
-        # Environment info
-        sudo_status = "✅" if system_info.has_sudo else "❌"
-        table.add_row("🔐 Sudo Access", sudo_status)
-        
-        internet_status = "✅ Online" if system_info.internet else "❌ Offline"
-        table.add_row("🌐 Internet", internet_status)
-        
-        table.add_row("🧪 Virtualization", system_info.virtualization)
-        table.add_row("🐍 Python", system_info.python_version)
-        
-        # Display the table
-        console.print(table)
-        
-        # Display warnings if any
-        if system_info.warnings:
-            console.print("\n⚠️  Warnings:")
-            for warning in system_info.warnings:
-                color = "yellow" if warning.level == "warning" else "red"
-                console.print(f"  • [{color}]{warning.message}[/{color}]")
-                if warning.recommendation:
-                    console.print(f"    💡 Recommendation: {warning.recommendation}")
-        
-        # Display recommendations
-        inspector = SystemInspector()
-        recommendations = inspector.get_installation_recommendations(system_info)
-        if recommendations:
-            console.print("\n💡 Installation Recommendations:")
-            for rec in recommendations:
-                console.print(f"  • {rec}")
-        
-        # Analysis info
-        console.print(f"\n[dim]Analysis completed in {system_info.analysis_duration:.2f}s[/dim]")
-        
-    except ImportError:
+            gpu_text = f"{gpu_text} (CUDA: {cuda_status})"
+        
+        rows = (
+            ("🖥️  OS", f"{system_info.os_name} {system_info.os_version}"),
+            ("🧠 Architecture", system_info.arch),
+            ("💻 Shell", system_info.shell),
+            ("🔧 Package Mgrs", pm_text),
+            ("📦 Tools Found", tools_text),
+            ("🎮 GPU", gpu_text),
+            ("💾 RAM", f"{system_info.ram_gb} GB"),
+            ("🖥️  CPU", f"{system_info.cpu_model} ({system_info.cpu_cores} cores, {system_info.cpu_threads} threads)"),
+            ("🔐 Sudo Access", "✅" if system_info.has_sudo else "❌"),
+            ("🌐 Internet", "✅ Online" if system_info.internet else "❌ Offline"),
+            ("🧪 Virtualization", system_info.virtualization),
+            ("🐍 Python", system_info.python_version),
+        )
+        for category, value in rows:
+            table.add_row(category, value)
+        
+        # Buffer the whole report so it reaches the terminal in one write
+        # instead of a flush per line
+        with console:
+            # Display the table
+            console.print(table)
+            
+            # Display warnings if any
+            if system_info.warnings:
+                console.print("\n⚠️  Warnings:")
+                for warning in system_info.warnings:
+                    color = "yellow" if warning.level == "warning" else "red"
+                    console.print(f"  • [{color}]{warning.message}[/{color}]")
+                    if warning.recommendation:
+                        console.print(f"    💡 Recommendation: {warning.recommendation}")
+            
+            # Display recommendations
+            recommendations = _installation_recommendations(
+                tuple(system_info.package_managers),
+                str(system_info.gpu or ""),
+                system_info.cuda_available,
+                system_info.virtualization,
+                system_info.ram_gb,
+                system_info.cpu_cores,
+            )
+            if recommendations:
+                console.print("\n💡 Installation Recommendations:")
+                for rec in recommendations:
+                    console.print(f"  • {rec}")
+            
+            # Analysis info
+            console.print(f"\n[dim]Analysis completed in {system_info.analysis_duration:.2f}s[/dim]")
+        
+    else:
         # Fallback to simple print if rich is not available
         print("📡 CONFIGO System Intelligence Report")
         print("=" * 50)
@@ -880,7 +1350,7 @@ def display_system_summary(system_info: SystemIntelligence) -> None:
         print(f"🧠 Architecture: {system_info.arch}")
         print(f"💻 Shell: {system_info.shell}")
         print(f"🔧 Package Mgrs: {', '.join(system_info.package_managers)}")
-        print(f"📦 Tools Found: {', '.join(system_info.installed_tools[:5])}")
+        print(f"📦 Tools Found: {', '.join(list(system_info.installed_tools)[:5])}")
         print(f"🎮 GPU: {system_info.gpu or 'None detected'}")
         print(f"💾 RAM: {system_info.ram_gb} GB")
         print(f"🖥️  CPU: {system_info.cpu_model}")
@@ -1,5 +1,25 @@
+import copy
+from functools import lru_cache
+from pathlib import Path
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Templates ship with CONFIGO, so they are found relative to this module
+# rather than the current working directory
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+@lru_cache(maxsize=128)
+def _parse_template(name):
+    with open(TEMPLATES_DIR / f"{name}.yaml", "rb", buffering=65536) as f:
+        return yaml.load(f, Loader=_Loader)
+
+
 def load_template(name):
-    with open(f"templates/{name}.yaml") as f:
-        return yaml.safe_load(f) 
\ No newline at end of file
+    # Callers get their own copy, so changing it never touches the cache
+    return copy.deepcopy(_parse_template(name))
@@ -16,8 +16,11 @@ Features:
 
 import subprocess
 import logging
+import operator
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from core.ai import Tool
@@ -26,6 +29,31 @@ from core.enhanced_llm_agent import EnhancedLLMAgent
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on check commands run at the same time by validate_tools
+MAX_VALIDATION_WORKERS = 16
+
+# Fields of a recommended tool copied into the dicts the installer and
+# validator work with
+TOOL_FIELDS = (
+    'name', 'install_command', 'check_command', 'is_extension',
+    'extension_id', 'justification', 'confidence_score', 'priority'
+)
+_get_tool_fields = operator.attrgetter(*TOOL_FIELDS)
+
+
+def tool_to_dict(tool) -> Dict[str, Any]:
+    """
+    Convert a recommended tool into the dict form validate_tools expects.
+    
+    Args:
+        tool: ToolRecommendation from the LLM agent
+        
+    Returns:
+        Dict with one entry per name in TOOL_FIELDS
+    """
+    return dict(zip(TOOL_FIELDS, _get_tool_fields(tool)))
+
+
 @dataclass
 class ValidationResult:
     """Result of a tool validation"""
@@ -58,6 +86,10 @@ class ToolValidator:
         self.llm_agent = llm_agent
         self.validation_timeout = 10  # seconds
         
+        # validate_tools checks tools on several threads; recovery calls the
+        # LLM agent and runs trial commands, so only one tool recovers at a time
+        self._recovery_lock = threading.Lock()
+        
         # Version extraction patterns
         self.version_patterns = {
             "python": r"Python (\d+\.\d+\.\d+)",
@@ -439,10 +471,8 @@ class ToolValidator:
         """
         logger.info(f"🔍 Starting validation of {len(tools)} tools...")
         
-        validation_results = []
-        successful_validations = 0
-        failed_validations = 0
-        skipped_validations = 0
+        validation_results: List[Optional[ValidationResult]] = []
+        pending = []
         
         for tool_data in tools:
             tool_name = tool_data.get('name', 'Unknown Tool')
@@ -452,7 +482,6 @@ class ToolValidator:
             # Check if we should skip this tool
             if self.memory.should_skip_tool(tool_name):
                 logger.info(f"⏭️ Skipping {tool_name} (already installed)")
-                skipped_validations += 1
                 validation_results.append(ValidationResult(
                     tool_name=tool_name,
                     is_installed=True,
@@ -461,14 +490,24 @@ class ToolValidator:
                 ))
                 continue
             
-            # Validate the tool
-            result = self._validate_single_tool(tool_name, check_command, is_extension)
-            validation_results.append(result)
+            # Reserve the tool's slot so the report keeps the input order
+            pending.append((len(validation_results), tool_name, check_command, is_extension))
+            validation_results.append(None)
+        
+        # Each check mostly waits on a subprocess, so run them concurrently
+        checked_results = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(MAX_VALIDATION_WORKERS, len(pending))) as executor:
+                checked_results = list(executor.map(
+                    lambda args: self._validate_single_tool(*args[1:]), pending
+                ))
             
-            if result.is_installed:
-                successful_validations += 1
-            else:
-                failed_validations += 1
+            for (index, *_), result in zip(pending, checked_results):
+                validation_results[index] = result
+        
+        successful_validations = sum(1 for result in checked_results if result.is_installed)
+        failed_validations = len(checked_results) - successful_validations
+        skipped_validations = len(tools) - len(checked_results)
         
         # Calculate overall success rate
         total_validations = successful_validations + failed_validations
@@ -783,7 +822,7 @@ class ToolValidator:
         
         # Check success rate
         total_tools = len(results)
-        successful_tools = len([r for r in results if r.is_installed])
+        successful_tools = sum(1 for r in results if r.is_installed)
         success_rate = (successful_tools / total_tools * 100) if total_tools > 0 else 0
         
         if success_rate < 80:
@@ -827,25 +866,26 @@ class ToolValidator:
             Optional[str]: New command to try, or None if recovery failed
         """
         try:
-            # Get recovery suggestions from LLM if available
-            if self.llm_agent:
-                recovery_command = self.llm_agent.generate_command_fix(
-                    original_command, error_msg, tool_name
-                )
-                if recovery_command:
-                    logger.info(f"🧠 LLM suggested recovery for {tool_name}: {recovery_command}")
-                    return recovery_command
-            
-            # Fallback to common recovery patterns
-            recovery_patterns = self._get_recovery_patterns(tool_name, error_msg)
-            
-            for pattern in recovery_patterns:
-                if self._test_recovery_command(pattern):
-                    logger.info(f"🔧 Found working recovery for {tool_name}: {pattern}")
-                    return pattern
-            
-            logger.warning(f"❌ No recovery found for {tool_name}")
-            return None
+            with self._recovery_lock:
+                # Get recovery suggestions from LLM if available
+                if self.llm_agent:
+                    recovery_command = self.llm_agent.generate_command_fix(
+                        original_command, error_msg, tool_name
+                    )
+                    if recovery_command:
+                        logger.info(f"🧠 LLM suggested recovery for {tool_name}: {recovery_command}")
+                        return recovery_command
+                
+                # Fallback to common recovery patterns
+                recovery_patterns = self._get_recovery_patterns(tool_name, error_msg)
+                
+                for pattern in recovery_patterns:
+                    if self._test_recovery_command(pattern):
+                        logger.info(f"🔧 Found working recovery for {tool_name}: {pattern}")
+                        return pattern
+                
+                logger.warning(f"❌ No recovery found for {tool_name}")
+                return None
             
         except Exception as e:
             logger.error(f"Error during smart recovery for {tool_name}: {e}")
@@ -40,12 +40,16 @@ def demo_environment_intelligence():
     ]
     
     for environment in test_environments:
-        print(f"🧠 Testing Environment: '{environment}'")
-        print("-" * 50)
+        # Collect this environment's report and write it in one go
+        lines = []
+        out = lines.append
+        
+        out(f"🧠 Testing Environment: '{environment}'")
+        out("-" * 50)
         
         # Detect domain
         detected_domain = llm_agent._detect_domain(environment)
-        print(f"🎯 Detected Domain: {detected_domain.upper()}")
+        out(f"🎯 Detected Domain: {detected_domain.upper()}")
         
         # Test domain completion with empty response
         empty_response = {
@@ -63,34 +67,37 @@ def demo_environment_intelligence():
         extensions = [tool for tool in completed_response['tools'] if tool.is_extension]
         login_portals = len(completed_response['login_portals'])
         
-        print(f"📦 Total Tools Generated: {total_tools}")
-        print(f"🔌 Extensions: {len(extensions)}")
-        print(f"🌐 Login Portals: {login_portals}")
-        print(f"✅ Target Met (8+ tools): {total_tools >= 8}")
+        out(f"📦 Total Tools Generated: {total_tools}")
+        out(f"🔌 Extensions: {len(extensions)}")
+        out(f"🌐 Login Portals: {login_portals}")
+        out(f"✅ Target Met (8+ tools): {total_tools >= 8}")
         
         # Show some example tools
-        print(f"\n🛠️ Example Tools:")
+        out(f"\n🛠️ Example Tools:")
         for i, tool in enumerate(completed_response['tools'][:5]):
-            print(f"  {i+1}. {tool.name} (Priority: {tool.priority}, Confidence: {tool.confidence_score:.2f})")
+            out(f"  {i+1}. {tool.name} (Priority: {tool.priority}, Confidence: {tool.confidence_score:.2f})")
         
         if total_tools > 5:
-            print(f"  ... and {total_tools - 5} more tools")
+            out(f"  ... and {total_tools - 5} more tools")
         
         # Show login portals
-        print(f"\n🌐 Login Portals:")
+        out(f"\n🌐 Login Portals:")
         for portal in completed_response['login_portals'][:3]:
-            print(f"  • {portal['name']}: {portal['url']}")
+            out(f"  • {portal['name']}: {portal['url']}")
         
         if login_portals > 3:
-            print(f"  ... and {login_portals - 3} more portals")
+            out(f"  ... and {login_portals - 3} more portals")
         
-        print(f"\n💡 Domain Completion Info:")
+        out(f"\n💡 Domain Completion Info:")
         domain_info = completed_response['domain_completion']
-        print(f"  Detected Domain: {domain_info.get('detected_domain', 'Unknown')}")
-        print(f"  Total Tools: {domain_info.get('total_tools', 0)}")
-        print(f"  Target Met: {domain_info.get('target_met', False)}")
+        out(f"  Detected Domain: {domain_info.get('detected_domain', 'Unknown')}")
+        out(f"  Total Tools: {domain_info.get('total_tools', 0)}")
+        out(f"  Target Met: {domain_info.get('target_met', False)}")
+        
+        out("\n" + "="*60 + "\n")
         
-        print("\n" + "="*60 + "\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
     
     print("🎉 Demo completed!")
     print("\n✅ Key Improvements:")
@@ -100,6 +107,7 @@ def demo_environment_intelligence():
     print("  • Quality validation and retry logic")
     print("  • Enhanced prompt engineering")
     print("  • Memory-aware recommendations")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     demo_environment_intelligence() 
\ No newline at end of file
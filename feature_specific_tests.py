@@ -11,11 +11,16 @@ Targeted tests for specific CONFIGO features:
 - Tool detection and validation
 """
 
+import functools
+import io
 import os
 import sys
 import subprocess
+import tempfile
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 
 # Add the project root to the path
@@ -29,6 +34,33 @@ from core.validator import ToolValidator
 from ui.enhanced_messages import EnhancedMessageDisplay
 from rich.console import Console
 
+# Worker processes running the tests
+MAX_TEST_WORKERS = 3
+
+# Memory directory of the test being run. Every test gets its own temporary
+# one, so tests running at once in other workers never rewrite its files
+_memory_dir = None
+
+# Fixtures are built on first use within a test and shared by that test
+# only; run_isolated() discards them before the next test, so chat history
+# and recorded tools never leak between tests
+@functools.lru_cache(maxsize=None)
+def shared_memory():
+    """Agent memory shared within the test being run."""
+    return AgentMemory(_memory_dir)
+
+@functools.lru_cache(maxsize=None)
+def shared_llm_agent():
+    """LLM agent shared within the test being run."""
+    return EnhancedLLMAgent(shared_memory())
+
+@functools.lru_cache(maxsize=None)
+def shared_chat_agent():
+    """Chat agent shared within the test being run."""
+    return ChatAgent(shared_memory())
+
+FIXTURES = (shared_memory, shared_llm_agent, shared_chat_agent)
+
 def test_app_installation_extraction():
     """Test app name extraction for installation commands."""
     print("\n🔧 Testing App Installation Extraction")
@@ -72,8 +104,7 @@ def test_chat_mode_questions():
     print("\n💬 Testing Chat Mode Questions")
     print("=" * 50)
     
-    memory = AgentMemory()
-    chat_agent = ChatAgent(memory)
+    chat_agent = shared_chat_agent()
     
     test_questions = [
         "Who are you?",
@@ -111,7 +142,7 @@ def test_memory_persistence():
     print("\n🧠 Testing Memory Persistence")
     print("=" * 50)
     
-    memory = AgentMemory()
+    memory = shared_memory()
     
     # Test 1: Record some installations
     test_tools = [
@@ -153,9 +184,8 @@ def test_tool_validation():
     print("\n✅ Testing Tool Validation")
     print("=" * 50)
     
-    memory = AgentMemory()
-    llm_agent = EnhancedLLMAgent(memory)
-    validator = ToolValidator(memory, llm_agent)
+    memory = shared_memory()
+    validator = ToolValidator(memory, shared_llm_agent())
     
     # Test tools that should be available
     test_tools = [
@@ -193,8 +223,7 @@ def test_environment_detection():
     print("\n🎯 Testing Environment Detection")
     print("=" * 50)
     
-    memory = AgentMemory()
-    llm_agent = EnhancedLLMAgent(memory)
+    llm_agent = shared_llm_agent()
     
     test_environments = [
         ("Full Stack AI Developer on Linux", "ai_ml"),
@@ -231,7 +260,7 @@ def test_ui_components():
     
     console = Console()
     messages = EnhancedMessageDisplay(console)
-    memory = AgentMemory()
+    memory = shared_memory()
     
     try:
         # Test banner display
@@ -257,9 +286,9 @@ def test_integration_workflow():
     print("=" * 50)
     
     try:
-        memory = AgentMemory()
-        llm_agent = EnhancedLLMAgent(memory)
-        chat_agent = ChatAgent(memory)
+        memory = shared_memory()
+        llm_agent = shared_llm_agent()
+        chat_agent = shared_chat_agent()
         
         # 1. Start a session
         session_id = memory.start_session("Integration Test Environment")
@@ -292,6 +321,27 @@ def test_integration_workflow():
         print(f"❌ Integration workflow failed: {e}")
         return False
 
+def run_isolated(test_name, test_func):
+    """Run a test in a worker process, capturing its output for ordered printing."""
+    global _memory_dir
+    
+    # Start from fresh fixtures whichever tests this worker ran before
+    for fixture in FIXTURES:
+        fixture.cache_clear()
+    
+    output = io.StringIO()
+    with tempfile.TemporaryDirectory(prefix="configo-test-memory-") as memory_dir, redirect_stdout(output):
+        _memory_dir = memory_dir
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            result = False
+        finally:
+            for fixture in FIXTURES:
+                fixture.cache_clear()
+    return result, output.getvalue()
+
 def main():
     """Run all feature-specific tests."""
     print("🚀 CONFIGO Feature-Specific Tests")
@@ -311,15 +361,21 @@ def main():
     total_passed = 0
     total_tests = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results[test_name] = result
-            if result:
-                total_passed += 1
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results[test_name] = False
+    # The tests are independent, each with its own memory directory, and
+    # mostly wait on LLM calls, so run them concurrently in separate
+    # processes and print their output in order
+    with ProcessPoolExecutor(max_workers=min(MAX_TEST_WORKERS, total_tests)) as pool:
+        futures = [(test_name, pool.submit(run_isolated, test_name, test_func)) for test_name, test_func in tests]
+        for test_name, future in futures:
+            try:
+                result, output = future.result()
+                print(output, end="")
+                results[test_name] = result
+                if result:
+                    total_passed += 1
+            except Exception as e:
+                print(f"❌ {test_name} failed with exception: {e}")
+                results[test_name] = False
     
     # Print summary
     print("\n" + "=" * 60)
@@ -1533,10 +1533,11 @@ class GraphDBManager:
             recent_events = [e for e in self.simulator.install_events 
                            if e.timestamp > datetime.now() - timedelta(days=7)]
             
+            successful = sum(1 for e in recent_events if e.success)
             recent_stats = {
                 "recent_installs": len(recent_events),
-                "successful": len([e for e in recent_events if e.success]),
-                "failed": len([e for e in recent_events if not e.success])
+                "successful": successful,
+                "failed": len(recent_events) - successful
             }
             
             # Category distribution
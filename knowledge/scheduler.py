@@ -228,8 +228,8 @@ class KnowledgeScheduler:
         recent_results = [r for r in self.expansion_history 
                          if r.end_time > datetime.now() - timedelta(days=7)]
         
-        success_count = len([r for r in recent_results if r.success])
-        failure_count = len([r for r in recent_results if not r.success])
+        success_count = sum(1 for r in recent_results if r.success)
+        failure_count = len(recent_results) - success_count
         
         total_nodes_added = sum(r.nodes_added for r in recent_results)
         total_relationships_added = sum(r.relationships_added for r in recent_results)
@@ -51,12 +51,12 @@ load_dotenv()
 from core.memory import AgentMemory
 from core.planner import PlanGenerator, PlanExecutor, InstallationPlan
 from core.enhanced_llm_agent import EnhancedLLMAgent
-from core.validator import ToolValidator, ValidationReport
+from core.validator import ToolValidator, ValidationReport, tool_to_dict
 from core.project_scan import scan_project
 from core.chat_agent import ChatAgent
 from core.project_scanner import ProjectScanner
 from core.portal_orchestrator import PortalOrchestrator
-from core.system_inspector import SystemInspector, display_system_summary
+from core.system_inspector import SystemInspector, display_system_summary, invalidate_system_cache
 
 # UI components
 from ui.layout import ConfigoLayout
@@ -111,6 +111,9 @@ def execute_tool_installation(step, messages: EnhancedMessageDisplay) -> bool:
             'check_command': step.check_command
         }])
         
+        # The saved system analysis no longer lists every installed tool
+        invalidate_system_cache()
+        
         # Extract results from installation
         success = result.get('success', False)
         version = result.get('version')
@@ -314,9 +317,6 @@ def main(debug: bool = False, lite_mode: bool = False) -> None:
         # Display system intelligence summary
         display_system_summary(system_info)
         
-        # Save system intelligence to memory
-        system_inspector.save_to_memory(system_info)
-        
         # Display memory context and statistics
         memory_stats = memory.get_memory_stats()
         ui.show_memory_context(memory_stats)
@@ -357,19 +357,7 @@ System Environment:
         llm_response = llm_agent.generate_enhanced_stack(env, str(stack_info) if stack_info else "", debug=debug)
         
         # Convert LLM response to tool list format
-        tools = []
-        for tool in llm_response.tools:
-            tool_dict = {
-                'name': tool.name,
-                'install_command': tool.install_command,
-                'check_command': tool.check_command,
-                'is_extension': tool.is_extension,
-                'extension_id': tool.extension_id,
-                'justification': tool.justification,
-                'confidence_score': tool.confidence_score,
-                'priority': tool.priority
-            }
-            tools.append(tool_dict)
+        tools = [tool_to_dict(tool) for tool in llm_response.tools]
         
         # Display generation results
         print(f"✅ Generated {len(tools)} tools and {len(llm_response.login_portals)} login portals")
@@ -663,8 +651,8 @@ def scan_mode() -> None:
         # Show results
         ui.show_ai_reasoning(
             f"Project Analysis: {analysis.project_type.title()}",
-            f"Detected frameworks: {', '.join(analysis.detected_frameworks) if analysis.detected_frameworks else 'None'}\n"
-            f"Languages: {', '.join(analysis.languages) if analysis.languages else 'None'}\n"
+            f"Detected frameworks: {', '.join(sorted(analysis.detected_frameworks)) if analysis.detected_frameworks else 'None'}\n"
+            f"Languages: {', '.join(sorted(analysis.languages)) if analysis.languages else 'None'}\n"
             f"Confidence: {analysis.confidence:.1%}",
             analysis.confidence
         )
@@ -809,6 +797,7 @@ def app_install_mode() -> None:
         
         logger.info(f"Executing install plan for {app_name}")
         result = executor.execute_install_plan(plan, llm_agent, messages)
+        invalidate_system_cache()
         
         # Record installation in memory
         memory.record_app_install(app_name, plan, result)
@@ -98,7 +98,7 @@ System Environment:
 - RAM: {system_info.ram_gb} GB
 - Virtualization: {system_info.virtualization}
 - Sudo Access: {'Yes' if system_info.has_sudo else 'No'}
-- Installed Tools: {', '.join(system_info.installed_tools[:10])}
+- Installed Tools: {', '.join(list(system_info.installed_tools)[:10])}
 """
     
     print("📋 System Context for LLM:")
@@ -0,0 +1,7 @@
+"""
+CONFIGO Core Tests
+==================
+
+Unit tests for the core agent modules including project scanning, portal
+status persistence and the LLM response cache.
+"""
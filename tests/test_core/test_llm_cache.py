@@ -0,0 +1,139 @@
+"""
+Test LLM Cache
+==============
+
+Unit tests for the CONFIGO LLM response cache.
+"""
+
+import unittest
+import tempfile
+import shutil
+import time
+
+from core.llm_cache import LLMResponseCache
+from core.project_scanner import ProjectFile
+
+
+class FakeMemory:
+    """Agent memory stand-in with a settable context."""
+    
+    def __init__(self):
+        self.context = "Installed tools: git"
+    
+    def get_memory_context(self):
+        return self.context
+
+
+class FakeAgent:
+    """LLM agent stand-in that counts its calls."""
+    
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self.memory = FakeMemory()
+    
+    def get_install_plan(self, app_name):
+        self.calls += 1
+        if self.error:
+            return {'steps': [], 'error': self.error}
+        return {'steps': [f'install {app_name}'], 'call': self.calls}
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """Test cases for the LLMResponseCache class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = LLMResponseCache(self.test_dir, semantic=False)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.cache._db.close()
+        shutil.rmtree(self.test_dir)
+    
+    def test_prompt_normalization(self):
+        """Test that case and whitespace differences share an entry."""
+        self.cache.put(b'scope', 'Install  Python', ['python3'])
+        
+        self.assertEqual(self.cache.get(b'scope', '  install python '), ['python3'])
+        self.assertIsNone(self.cache.get(b'scope', 'install pip'))
+    
+    def test_dataclass_round_trip(self):
+        """Test that dataclass responses are stored as JSON and rebuilt."""
+        files = [ProjectFile(name='app.py', path='src/app.py', type='source', language='python')]
+        self.cache.put(b'scope', 'scan', {'files': files})
+        
+        stored = self.cache._db.execute("SELECT typeof(value) FROM responses").fetchone()[0]
+        self.assertEqual(stored, 'text')
+        self.assertEqual(self.cache.get(b'scope', 'scan'), {'files': files})
+    
+    def test_scopes_are_separate(self):
+        """Test that a response is only returned for its own scope."""
+        self.cache.put(b'first', 'install python', 'first answer')
+        self.cache.put(b'second', 'install python', 'second answer')
+        
+        self.assertEqual(self.cache.get(b'first', 'install python'), 'first answer')
+        self.assertEqual(self.cache.get(b'second', 'install python'), 'second answer')
+        self.assertIsNone(self.cache.get(b'third', 'install python'))
+    
+    def test_keys_are_digests(self):
+        """Test that keys are stored as 16-byte digests."""
+        self.cache.put(b'scope', 'install python', 'answer')
+        
+        keys = [row[0] for row in self.cache._db.execute("SELECT key FROM responses")]
+        self.assertEqual(len(keys), 1)
+        self.assertIsInstance(keys[0], bytes)
+        self.assertEqual(len(keys[0]), 16)
+    
+    def test_expired_responses(self):
+        """Test that responses older than max_age are ignored and purged."""
+        self.cache.put(b'scope', 'install python', 'answer')
+        self.cache._db.execute("UPDATE responses SET created = ?", (time.time() - 120,))
+        self.cache._db.commit()
+        
+        self.cache.max_age = 60
+        self.assertIsNone(self.cache.get(b'scope', 'install python'))
+        
+        # Reopening drops expired rows from the database
+        self.cache._db.close()
+        self.cache = LLMResponseCache(self.test_dir, max_age=60, semantic=False)
+        count = self.cache._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self.assertEqual(count, 0)
+    
+    def test_wrapped_agent(self):
+        """Test that a wrapped agent method is only called on a miss."""
+        agent = FakeAgent()
+        self.cache.wrap(agent)
+        
+        first = agent.get_install_plan('VS Code')
+        second = agent.get_install_plan('vs code')
+        agent.get_install_plan('VSCodium')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(agent.calls, 2)
+    
+    def test_error_responses_not_cached(self):
+        """Test that a failed call is retried instead of replayed."""
+        agent = FakeAgent(error='LLM unavailable')
+        self.cache.wrap(agent)
+        
+        agent.get_install_plan('VS Code')
+        agent.get_install_plan('VS Code')
+        
+        self.assertEqual(agent.calls, 2)
+    
+    def test_memory_context_in_key(self):
+        """Test that a response is not reused once the agent's memory changes."""
+        agent = FakeAgent()
+        self.cache.wrap(agent)
+        
+        agent.get_install_plan('VS Code')
+        agent.memory.context = "Installed tools: git, code"
+        agent.get_install_plan('VS Code')
+        
+        self.assertEqual(agent.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Test Portal Orchestrator
+========================
+
+Unit tests for saving and restoring CONFIGO portal statuses.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+
+from core.memory import AgentMemory
+from core.portal_orchestrator import PortalOrchestrator
+
+
+class TestPortalStatusPersistence(unittest.TestCase):
+    """Test cases for portal statuses stored in agent memory."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.memory = AgentMemory(os.path.join(self.test_dir, 'memory'))
+        self.orchestrator = PortalOrchestrator(self.memory)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.orchestrator.close()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def test_statuses_round_trip(self):
+        """Test that saved statuses are restored by a new orchestrator."""
+        self.orchestrator._update_portal_status('claude', is_logged_in=True)
+        self.orchestrator._update_portal_status('github', installation_status='installed')
+        self.orchestrator.close()
+        
+        restored = PortalOrchestrator(self.memory)
+        try:
+            self.assertTrue(restored.get_portal_status('claude').is_logged_in)
+            self.assertEqual(restored.get_portal_status('github').installation_status, 'installed')
+            
+            summary = restored.get_portal_summary()
+            self.assertEqual(summary['logged_in_portals'], 1)
+            self.assertEqual(summary['installed_cli_tools'], 1)
+        finally:
+            restored.close()
+    
+    def test_failed_save_is_retried(self):
+        """Test that changes stay unsaved until a write succeeds."""
+        self.orchestrator._update_portal_status('claude', is_logged_in=True)
+        
+        set_blob = self.memory.set_blob
+        self.memory.set_blob = lambda key, value: False
+        self.orchestrator._save_portal_statuses()
+        self.assertIsNone(self.memory.get_blob('portal_statuses'))
+        
+        self.memory.set_blob = set_blob
+        self.orchestrator._save_portal_statuses()
+        self.assertIn('"claude"', self.memory.get_blob('portal_statuses'))
+    
+    def test_imports_statuses_from_old_store(self):
+        """Test that statuses recorded before the blob existed are kept."""
+        self.orchestrator.close()
+        memory = AgentMemory(os.path.join(self.test_dir, 'old_memory'))
+        memory.record_login_portal_status('claude', is_logged_in=True, installation_status='installed')
+        
+        self.orchestrator = PortalOrchestrator(memory)
+        
+        status = self.orchestrator.get_portal_status('claude')
+        self.assertTrue(status.is_logged_in)
+        self.assertEqual(status.installation_status, 'installed')
+        self.assertIn('"claude"', memory.get_blob('portal_statuses'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Test Project Scanner
+====================
+
+Unit tests for CONFIGO project type detection.
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+import os
+
+from core.memory import AgentMemory, MAX_CACHED_ANALYSES
+from core.project_scanner import ProjectScanner
+
+
+class TestProjectScanner(unittest.TestCase):
+    """Test cases for the ProjectScanner class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.project_dir = os.path.join(self.test_dir, 'project')
+        os.makedirs(self.project_dir)
+        
+        self.memory = AgentMemory(os.path.join(self.test_dir, 'memory'))
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def _write(self, relative_path: str, content: str = "") -> None:
+        """Create a file inside the test project."""
+        path = os.path.join(self.project_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+    
+    def test_detects_python_project(self):
+        """Test detection of a small Python project."""
+        self._write('app.py', 'print("hello")\n')
+        self._write('utils.py')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        self.assertEqual(analysis.project_type, 'python')
+        self.assertIn('python', analysis.languages)
+    
+    def test_source_cap_keeps_counting(self):
+        """Test that files past the per-language cap still decide the type."""
+        for i in range(8):
+            self._write(f'src/module{i}.js')
+        for i in range(6):
+            self._write(f'src/module{i}.py')
+        
+        scanner = ProjectScanner(self.memory, max_source_files_per_language=5)
+        analysis = scanner.scan_project(self.project_dir)
+        
+        # Both languages are over the cap; the larger one must still win
+        self.assertEqual(analysis.project_type, 'javascript')
+        self.assertIn('(14 relevant files found)', analysis.summary)
+        
+        # Only the capped number of files per language is listed
+        self.assertEqual(sum(1 for f in analysis.files if f.language == 'javascript'), 5)
+        self.assertEqual(sum(1 for f in analysis.files if f.language == 'python'), 5)
+    
+    def test_source_cap_keeps_config_files(self):
+        """Test that config files are still detected once a language is capped."""
+        for i in range(6):
+            self._write(f'src/module{i}.js')
+        self._write('web/next.config.js')
+        self._write('web/Dockerfile')
+        
+        scanner = ProjectScanner(self.memory, max_source_files_per_language=3)
+        analysis = scanner.scan_project(self.project_dir)
+        
+        self.assertIn('nextjs', analysis.detected_frameworks)
+        self.assertIn('docker', analysis.detected_frameworks)
+    
+    def test_nested_manifest_keeps_import_scan(self):
+        """Test that only a root manifest turns off the source import scan."""
+        self._write('app.py', 'from flask import Flask\n')
+        self._write('docs/requirements.txt', 'sphinx\n')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        self.assertIn('flask', analysis.detected_frameworks)
+    
+    def test_manifest_does_not_count_as_source(self):
+        """Test that manifest entries do not add to the language scores."""
+        self._write('app.py')
+        self._write('package.json', '{"dependencies": {"react": "^18.0.0"}}')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        self.assertEqual(analysis.project_type, 'python')
+        self.assertNotIn('javascript', analysis.languages)
+    
+    def test_manifest_reads_declared_dependencies_only(self):
+        """Test that frameworks named outside dependency declarations are ignored."""
+        self._write('package.json', json.dumps({
+            'description': 'Not a react app',
+            'scripts': {'build': 'next build'},
+            'dependencies': {'express': '^4.18.0'}
+        }))
+        self._write('requirements.txt', '# flask maybe later\nDjango>=4.2\n')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        self.assertIn('express', analysis.detected_frameworks)
+        self.assertIn('django', analysis.detected_frameworks)
+        for framework in ('react', 'nextjs', 'flask'):
+            self.assertNotIn(framework, analysis.detected_frameworks)
+    
+    def test_root_manifest_without_framework_keeps_import_scan(self):
+        """Test that sources are still scanned when the manifest pins no framework."""
+        self._write('app.py', 'from flask import Flask\n')
+        self._write('requirements.txt', 'requests\n')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        self.assertIn('flask', analysis.detected_frameworks)
+    
+    def test_analysis_cache_drops_least_recently_used(self):
+        """Test that the analysis cache is capped and evicts by last use."""
+        for i in range(MAX_CACHED_ANALYSES):
+            self.memory.set_cached_analysis(f'/projects/{i}', 'key', {'index': i})
+        
+        # Reading the oldest entry keeps it over the next oldest
+        self.assertEqual(self.memory.get_cached_analysis('/projects/0', 'key'), {'index': 0})
+        self.memory.set_cached_analysis('/projects/new', 'key', {'index': -1})
+        
+        cache = json.loads(self.memory.get_blob('project_analyses'))
+        self.assertEqual(len(cache), MAX_CACHED_ANALYSES)
+        self.assertIn('/projects/0', cache)
+        self.assertNotIn('/projects/1', cache)
+    
+    def test_hidden_directories_are_scanned(self):
+        """Test that files under dot-directories such as .github are found."""
+        self._write('.github/workflows/ci.yml', 'on: push\n')
+        
+        analysis = ProjectScanner(self.memory).scan_project(self.project_dir)
+        
+        paths = [project_file.path for project_file in analysis.files]
+        self.assertIn(os.path.join('.github', 'workflows', 'ci.yml'), paths)
+
+
+if __name__ == '__main__':
+    unittest.main()
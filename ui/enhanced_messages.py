@@ -658,7 +658,7 @@ class EnhancedMessageDisplay:
         self.console.rule("[bold green]🎉 Installation Complete![/bold green]", style="green")
         
         # Overall statistics
-        total_healed = len([r for r in healing_results if r.get("success", False)])
+        total_healed = sum(1 for r in healing_results if r.get("success", False))
         
         self.console.print("[bold cyan]📊 Final Statistics:[/bold cyan]")
         self.console.print(f"  📦 Total Tools: {plan.total_steps}")
@@ -21,7 +21,8 @@ import time
 import asyncio
 import os
 import sys
-from typing import List, Dict, Any, Optional, Tuple, Union, Callable
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -203,6 +204,103 @@ class UIConfig:
         self.rounded_corners = True
         self.show_shadows = True
 
+class ChatResponseStream:
+    """
+    Chat response panel that grows in place while the response streams in.
+    
+    Without a live display (output is not a terminal) the streamed text is
+    ignored and only the final message is printed.
+    """
+    
+    def __init__(self, ui: 'ModernTerminalUI', live: Optional[Live] = None):
+        self._ui = ui
+        self._live = live
+        self._text = ""
+    
+    def append(self, delta: str) -> None:
+        """Add newly received response text to the panel."""
+        if self._live is None:
+            return
+        
+        self._text += delta
+        self._live.update(self._ui._chat_response_panel(self._text))
+    
+    def finish(self, message: str) -> None:
+        """Replace the streamed text with the final response message."""
+        if self._live is None:
+            self._ui.console.print(self._ui._chat_response_panel(message))
+            return
+        
+        self._live.update(self._ui._chat_response_panel(message), refresh=True)
+
+class StepProgressTable:
+    """
+    Table of plan steps whose rows are updated in place as the steps progress.
+    
+    Without a live display (output is not a terminal) every update is printed
+    as a message instead, so logs read the same as before.
+    """
+    
+    # Status -> (icon, color name, label)
+    STATUSES = {
+        'installing': ("🔧", 'info', "Installing"),
+        'installed': ("✅", 'success', "Installed"),
+        'failed': ("❌", 'error', "Failed"),
+        'retrying': ("🔄", 'warning', "Retrying"),
+        'error': ("❌", 'error', "Step failed"),
+    }
+    
+    def __init__(self, ui: 'ModernTerminalUI', live: Optional[Live] = None):
+        self._ui = ui
+        self._live = live
+        self._rows: Dict[str, Tuple[str, str]] = {}
+    
+    def update(self, name: str, status: str, details: str = "") -> None:
+        """Set a step's status, one of STATUSES, with optional details."""
+        if self._live is None:
+            self._print_update(name, status, details)
+            return
+        
+        self._rows[name] = (status, details)
+        self._live.update(self.render())
+    
+    def render(self) -> Panel:
+        """Build the panel showing every step's latest status."""
+        colors = self._ui.config.colors
+        table = Table(
+            box=box.ROUNDED if self._ui.config.rounded_corners else box.SIMPLE,
+            border_style=colors['panel_border']
+        )
+        table.add_column("Step", style="bold")
+        table.add_column("Status", style="bold")
+        table.add_column("Details", style=colors['muted'])
+        
+        for name, (status, details) in self._rows.items():
+            icon, color, label = self.STATUSES[status]
+            table.add_row(name, Text(f"{icon} {label}", style=colors[color]), details)
+        
+        return Panel(
+            table,
+            border_style=colors['panel_border'],
+            box=box.ROUNDED if self._ui.config.rounded_corners else box.SIMPLE,
+            padding=self._ui.config.panel_padding,
+            title="🔧 Installation Progress",
+            title_align="left"
+        )
+    
+    def _print_update(self, name: str, status: str, details: str) -> None:
+        """Show a status update as a standalone message."""
+        if status == 'installing':
+            self._ui.show_info_message(f"Installing {name}...", "🔧")
+        elif status == 'installed':
+            self._ui.show_success_message(f"{name} installed successfully", details or None)
+        elif status == 'failed':
+            self._ui.show_error_message(f"Failed to install {name}", details)
+        elif status == 'retrying':
+            self._ui.show_info_message(f"Retrying {name} ({details})", "🔄")
+        else:
+            self._ui.show_error_message("Step failed", details)
+
 class ModernTerminalUI:
     """
     Modern Terminal UI for CONFIGO with stunning visuals and responsive design.
@@ -434,6 +532,27 @@ class ModernTerminalUI:
         self.console.print(plan_panel)
         self.console.print()
     
+    @contextmanager
+    def show_step_progress(self) -> Iterator[StepProgressTable]:
+        """
+        Display plan step statuses in one table that is redrawn in place.
+        
+        The table is redrawn at most 10 times per second however often steps
+        update. When output is not a terminal, updates are printed as messages.
+        
+        Yields:
+            StepProgressTable: Receives the status updates of the steps
+        """
+        if not self.console.is_terminal:
+            yield StepProgressTable(self)
+            return
+        
+        with Live(console=self.console, refresh_per_second=10) as live:
+            steps = StepProgressTable(self, live)
+            live.update(steps.render())
+            yield steps
+        self.console.print()
+    
     def show_success_message(self, message: str, details: Optional[str] = None) -> None:
         """Display success message with optional details."""
         success_text = Text()
@@ -547,6 +666,32 @@ class ModernTerminalUI:
     
     def show_chat_response(self, response: str, is_ai: bool = True) -> None:
         """Display chat response."""
+        self.console.print(self._chat_response_panel(response, is_ai))
+        self.console.print()
+    
+    @contextmanager
+    def stream_chat_response(self) -> Iterator[ChatResponseStream]:
+        """
+        Display an AI chat response that is updated as it streams in.
+        
+        The panel is redrawn at most 10 times per second, however fast the
+        response text arrives. When output is not a terminal, only the final
+        message is printed.
+        
+        Yields:
+            ChatResponseStream: Receives response text and the final message
+        """
+        if not self.console.is_terminal:
+            yield ChatResponseStream(self)
+            self.console.print()
+            return
+        
+        with Live(self._chat_response_panel(""), console=self.console, refresh_per_second=10) as live:
+            yield ChatResponseStream(self, live)
+        self.console.print()
+    
+    def _chat_response_panel(self, response: str, is_ai: bool = True) -> Panel:
+        """Build the panel showing a chat response."""
         response_text = Text()
         if is_ai:
             response_text.append("🤖 CONFIGO: ", style=f"bold {self.config.colors['primary']}")
@@ -555,15 +700,12 @@ class ModernTerminalUI:
         
         response_text.append(response, style=self.config.colors['text'])
         
-        response_panel = Panel(
+        return Panel(
             response_text,
             border_style=self.config.colors['panel_border'],
             box=box.ROUNDED if self.config.rounded_corners else box.SIMPLE,
             padding=self.config.panel_padding
         )
-        
-        self.console.print(response_panel)
-        self.console.print()
     
     def show_loading_spinner(self, message: str) -> Progress:
         """Show loading spinner."""
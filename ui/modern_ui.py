@@ -132,9 +132,9 @@ class ModernUI:
             tech_table.add_column("Items", style=self.colors['primary'])
             
             if analysis.detected_frameworks:
-                tech_table.add_row("Frameworks", ", ".join(analysis.detected_frameworks))
+                tech_table.add_row("Frameworks", ", ".join(sorted(analysis.detected_frameworks)))
             if analysis.languages:
-                tech_table.add_row("Languages", ", ".join(analysis.languages))
+                tech_table.add_row("Languages", ", ".join(sorted(analysis.languages)))
             
             self.console.print(tech_table)
         